@@ -6,14 +6,16 @@
 from pathlib import Path
 from typing import Annotated, Optional
 
+import numpy as np
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
 from rag.config import get_config
-from rag.embedding import Embedder, get_vector_store
-from rag.generation import build_prompt, get_llm
+from rag.embedding import get_embedder, get_vector_store
+from rag.generation import build_prompt, context_order_key, get_llm
 from rag.retrieval import HybridSearcher
 from rag.retrieval.reranker import Reranker
 from rag.retrieval.query_rewriter import QueryRewriter
@@ -22,6 +24,12 @@ from rag.logger import setup_logging
 
 console = Console()
 
+# 병합 후보가 이 개수 이상이면 NumPy 정렬 기반 병합 사용
+VECTORIZED_MERGE_MIN = 64
+
+# 스트리밍 중 줄바꿈이 없어도 이 글자 수만큼 쌓이면 Markdown 다시 렌더링
+MARKDOWN_RENDER_STEP = 200
+
 # Reranker 인스턴스 (지연 로딩)
 _reranker: Optional[Reranker] = None
 
@@ -46,17 +54,22 @@ def merge_results(
     Returns:
         병합된 결과 (중복 제거, 최고 점수 유지)
     """
+    flat = [item for results in all_results for item in results]
+    
+    if len(flat) >= VECTORIZED_MERGE_MIN:
+        return _merge_results_vectorized(flat, top_k)
+    
     seen_contents = {}
     
-    for results in all_results:
-        for chunk, score in results:
-            content_hash = hash(chunk.content[:100])
-            if content_hash not in seen_contents:
+    for chunk, score in flat:
+        # 본문 전체 해시로 비교 (접두어가 같은 서로 다른 청크 오병합 방지)
+        content_hash = chunk.content_hash
+        if content_hash not in seen_contents:
+            seen_contents[content_hash] = (chunk, score)
+        else:
+            # 더 높은 점수로 업데이트
+            if score > seen_contents[content_hash][1]:
                 seen_contents[content_hash] = (chunk, score)
-            else:
-                # 더 높은 점수로 업데이트
-                if score > seen_contents[content_hash][1]:
-                    seen_contents[content_hash] = (chunk, score)
     
     # 점수순 정렬
     merged = list(seen_contents.values())
@@ -65,6 +78,40 @@ def merge_results(
     return merged[:top_k]
 
 
+def _merge_results_vectorized(flat: list[tuple], top_k: int) -> list[tuple]:
+    """merge_results의 NumPy 정렬 기반 구현 (후보가 많을 때)
+    
+    해시별 최고 점수 항목을 고르고, 동점 순서까지 dict 기반 구현과 동일하게 유지합니다.
+    """
+    n = len(flat)
+    hashes = np.fromiter(
+        (int(chunk.content_hash, 16) for chunk, _ in flat), dtype=np.uint64, count=n
+    )
+    scores = np.fromiter((score for _, score in flat), dtype=np.float64, count=n)
+    
+    # (해시, 점수 내림차순, 입력 순서)로 정렬 후 해시 그룹별 첫 항목 = 최고 점수 항목
+    order = np.lexsort((-scores, hashes))
+    sorted_hashes = hashes[order]
+    is_first = np.ones(n, dtype=bool)
+    is_first[1:] = sorted_hashes[1:] != sorted_hashes[:-1]
+    best = order[is_first]
+    
+    _, first_seen = np.unique(hashes, return_index=True)
+    
+    # top_k보다 후보가 많으면 O(N) 부분 선택으로 k번째 점수 이상만 남김 (경계 동점 포함)
+    k = min(top_k, len(best))
+    if 0 < k < len(best):
+        neg_scores = -scores[best]
+        kth = np.partition(neg_scores, k - 1)[k - 1]
+        cand = np.flatnonzero(neg_scores <= kth)
+        best, first_seen = best[cand], first_seen[cand]
+    
+    # 점수 내림차순, 동점은 해시가 처음 등장한 순서
+    ranked = best[np.lexsort((first_seen, -scores[best]))][:top_k]
+    
+    return [flat[i] for i in ranked]
+
+
 def handle_ask(
     query: Annotated[str, typer.Argument(help="질문 내용")],
     top_k: Annotated[int, typer.Option("--top-k", "-k", help="참조할 청크 개수")] = 5,
@@ -72,6 +119,7 @@ def handle_ask(
     rerank: Annotated[bool, typer.Option("--rerank", "-r", help="Reranker로 결과 재정렬")] = False,
     expand: Annotated[bool, typer.Option("--expand", "-e", help="Query Rewriting으로 검색 확장")] = False,
     provider: Annotated[str, typer.Option("--provider", "-p", help="LLM Provider (gemini/ollama)")] = None,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="LLM 응답 캐시 사용 안 함")] = False,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="상세 로그 출력")] = False,
 ):
     """질문에 대해 답변합니다."""
@@ -90,12 +138,12 @@ def handle_ask(
 
     with console.status("[bold green]Thinking...[/bold green]"):
         # 1. 인덱스 로드
-        embedder = Embedder()
+        embedder = get_embedder(use_cache=True)
         store = get_vector_store(config)
         searcher = HybridSearcher(embedder, store)
         
         try:
-            searcher.load(index_path)
+            searcher.load(index_path, mmap=True)  # 검색 전용: 읽기 전용 mmap
         except Exception as e:
             console.print(f"[red]Error loading index: {e}[/red]")
             raise typer.Exit(code=1)
@@ -103,7 +151,7 @@ def handle_ask(
         # 2. Query Rewriting (선택적)
         if expand:
             console.print(f"[dim]Expanding query using {provider or config.generation.provider}...[/dim]")
-            llm = get_llm(provider)
+            llm = get_llm(provider, use_cache=not no_cache)
             rewriter = QueryRewriter(llm)
             queries = rewriter.rewrite(query)
             console.print(f"[dim]Queries: {queries}[/dim]")
@@ -113,10 +161,7 @@ def handle_ask(
         # 3. 검색 (각 쿼리별)
         search_top_k = top_k * 3 if use_reranker else top_k * 2
         
-        all_results = []
-        for q in queries:
-            results = searcher.search(q, top_k=search_top_k)
-            all_results.append(results)
+        all_results = searcher.search_many(queries, top_k=search_top_k)
         
         # 결과 병합 (중복 제거)
         if len(queries) > 1:
@@ -130,25 +175,39 @@ def handle_ask(
             reranker = get_reranker(config.retrieval.reranker_model)
             results = reranker.rerank(query, results, top_k=top_k)
         
-        chunks = [r[0] for r in results[:top_k]]
+        # 프롬프트 컨텍스트 순서로 정렬 (참조 번호와 답변의 [Chunk N] 일치)
+        results = sorted(results[:top_k], key=lambda r: context_order_key(r[0]))
+        chunks = [r[0] for r in results]
         
         if not chunks:
             console.print("[yellow]No relevant context found.[/yellow]")
             return
 
-        # 5. 프롬프트 구성 및 LLM 호출
+        # 5. 프롬프트 구성 및 LLM 준비
         prompt = build_prompt(query, chunks)
         
         try:
-            llm = get_llm(provider)
-            answer = llm.generate(prompt)
+            llm = get_llm(provider, use_cache=not no_cache)
         except Exception as e:
             console.print(f"[red]LLM Error: {e}[/red]")
             raise typer.Exit(code=1)
 
-    # 6. 결과 출력
+    # 6. 답변 스트리밍 출력 (전체 생성 완료를 기다리지 않고 첫 토큰부터 표시)
     console.print("\n[bold]Answer:[/bold]")
-    console.print(Markdown(answer))
+    answer = ""
+    rendered_len = 0
+    try:
+        with Live(Markdown(answer), console=console, refresh_per_second=10) as live:
+            for text in llm.generate_stream(prompt):
+                answer += text
+                # Markdown 파싱은 전체 본문을 다시 읽으므로 줄 단위/일정 분량마다만 갱신
+                if "\n" in text or len(answer) - rendered_len >= MARKDOWN_RENDER_STEP:
+                    live.update(Markdown(answer))
+                    rendered_len = len(answer)
+            live.update(Markdown(answer))
+    except Exception as e:
+        console.print(f"[red]LLM Error: {e}[/red]")
+        raise typer.Exit(code=1)
     
     # 컨텍스트 표시 (옵션)
     if show_context:
@@ -156,7 +215,7 @@ def handle_ask(
         for i, (chunk, score) in enumerate(results[:top_k], 1):
             source = chunk.metadata.get("filename", "unknown")
             panel = Panel(
-                chunk.content[:500] + ("..." if len(chunk.content) > 500 else ""),
+                chunk.preview + ("..." if len(chunk.content) > len(chunk.preview) else ""),
                 title=f"[{i}] {source} (Score: {score:.4f})",
             )
             console.print(panel)
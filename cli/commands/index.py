@@ -4,6 +4,7 @@
 """
 
 import shutil
+from itertools import islice
 from pathlib import Path
 from typing import Annotated
 
@@ -11,10 +12,10 @@ import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from rag.chunking import chunk_document
+from rag.chunking import Chunk, chunk_documents
 from rag.config import get_config
-from rag.embedding import Embedder, get_vector_store
-from rag.ingestion import load_documents, load_file
+from rag.embedding import get_embedder, get_vector_store
+from rag.ingestion import iter_files, load_documents, load_files
 from rag.ingestion.metadata import IndexMetadata
 from rag.retrieval import HybridSearcher
 
@@ -23,6 +24,31 @@ from rag.logger import setup_logging
 
 console = Console()
 
+# 한 번에 임베딩/인덱싱할 문서 수 (임베딩 메모리 상한)
+INDEX_BATCH_DOCS = 32
+
+# 이 배치 수마다 인덱스를 디스크에 저장 (중단 시 이어서 인덱싱 가능)
+CHECKPOINT_EVERY_BATCHES = 10
+
+
+def _checkpoint(
+    searcher: HybridSearcher,
+    index_meta: IndexMetadata,
+    index_path: Path,
+    chunks: list[Chunk],
+    file_chunk_counts: dict[Path, int],
+) -> None:
+    """대기 중인 청크를 BM25에 반영하고 인덱스/파일 메타데이터 저장
+    
+    저장된 문서만 인덱싱 완료로 기록하므로, 중단 후 재실행 시 나머지 문서부터 처리됩니다.
+    """
+    searcher.add_keywords(chunks)
+    searcher.save(index_path)
+    
+    for file_path, chunk_count in file_chunk_counts.items():
+        index_meta.mark_indexed(file_path, chunk_count)
+    index_meta.save()
+
 
 def handle_index(
     path: Annotated[Path, typer.Argument(help="문서가 있는 경로 (파일 또는 폴더)")],
@@ -41,7 +67,7 @@ def handle_index(
         raise typer.Exit(code=1)
 
     # 벡터 스토어 초기화 (reset 처리를 위해 먼저 생성)
-    embedder = Embedder()
+    embedder = get_embedder(use_cache=True)
     store = get_vector_store(config)
     
     # 인덱스 메타데이터 (파일 해시 추적)
@@ -79,24 +105,23 @@ def handle_index(
         if path_obj.is_file():
             all_files = [path_obj] if path_obj.suffix.lower() in extensions else []
         else:
-            all_files = [f for f in path_obj.rglob("*") if f.is_file() and f.suffix.lower() in extensions]
+            all_files = list(iter_files(path_obj, extensions, skip_hidden=False))
         
         # 변경된 파일만 필터링 (reset이 아닌 경우)
         if not reset:
-            new_or_changed_files = [f for f in all_files if not index_meta.is_indexed(f)]
+            indexed_mask = index_meta.is_indexed_many(all_files)
+            new_or_changed_files = [f for f, indexed in zip(all_files, indexed_mask) if not indexed]
             skipped_count = len(all_files) - len(new_or_changed_files)
             if skipped_count > 0:
                 console.print(f"[blue]Skipping {skipped_count} unchanged files[/blue]")
         else:
             new_or_changed_files = all_files
         
-        # 변경된 파일만 로드
+        # 변경된 파일만 로드 (스레드 풀로 동시 읽기)
         docs = []
-        for file_path in new_or_changed_files:
-            doc = load_file(file_path)
-            if doc:
-                doc.metadata["_file_path"] = file_path  # 해시 추적용
-                docs.append(doc)
+        for file_path, doc in load_files(new_or_changed_files):
+            doc.metadata["_file_path"] = file_path  # 해시 추적용
+            docs.append(doc)
         
         progress.update(task_load, completed=1, description=f"Loaded {len(docs)} documents")
         
@@ -107,24 +132,6 @@ def handle_index(
                 console.print("[yellow]No documents found.[/yellow]")
             return
 
-        # 2. 청킹
-        task_chunk = progress.add_task("Chunking documents...", total=len(docs))
-        all_chunks = []
-        doc_chunk_counts: dict[Path, int] = {}  # 문서별 청크 수 추적
-        
-        for doc in docs:
-            chunks = chunk_document(doc)
-            all_chunks.extend(chunks)
-            file_path = doc.metadata.get("_file_path")
-            if file_path:
-                doc_chunk_counts[file_path] = len(chunks)
-            progress.advance(task_chunk)
-            
-        progress.update(task_chunk, description=f"Created {len(all_chunks)} chunks")
-
-        # 3. 임베딩 및 인덱싱
-        task_embed = progress.add_task("Embedding and Indexing...", total=None)
-        
         searcher = HybridSearcher(embedder, store)
         
         # 기존 인덱스가 있으면 로드 (reset이 아닐 때만)
@@ -135,17 +142,43 @@ def handle_index(
             except Exception as e:
                 console.print(f"[red]Failed to load existing index: {e}[/red]")
 
-        # 인덱스 추가 (임베딩은 내부에서 수행됨)
-        searcher.index(all_chunks)
-        searcher.save(index_path)
+        # 2. 청킹 → 임베딩 → 인덱싱 (문서 미니 배치 단위 스트리밍)
+        # 전체 임베딩을 한 번에 메모리에 올리지 않고, 주기적으로 체크포인트 저장
+        task_index = progress.add_task("Indexing documents...", total=len(docs))
+        total_chunks = 0
+        batch_count = 0
+        pending_chunks: list[Chunk] = []  # BM25/저장 미반영 청크
+        pending_files: dict[Path, int] = {}  # 저장 미반영 문서별 청크 수
+        
+        doc_chunks = zip(docs, chunk_documents(docs))
+        while batch := list(islice(doc_chunks, INDEX_BATCH_DOCS)):
+            batch_chunks: list[Chunk] = []
+            for doc, chunks in batch:
+                batch_chunks.extend(chunks)
+                file_path = doc.metadata.get("_file_path")
+                if file_path:
+                    pending_files[file_path] = len(chunks)
+            
+            if batch_chunks:
+                embeddings = embedder.embed(
+                    [chunk.content for chunk in batch_chunks],
+                    batch_size=config.embedding.batch_size,
+                )
+                searcher.add_vectors(batch_chunks, embeddings)
+                pending_chunks.extend(batch_chunks)
+                total_chunks += len(batch_chunks)
+            
+            progress.advance(task_index, len(batch))
+            batch_count += 1
+            
+            if batch_count % CHECKPOINT_EVERY_BATCHES == 0:
+                _checkpoint(searcher, index_meta, index_path, pending_chunks, pending_files)
+                pending_chunks, pending_files = [], {}
         
-        # 인덱싱된 파일 메타데이터 업데이트
-        for file_path, chunk_count in doc_chunk_counts.items():
-            index_meta.mark_indexed(file_path, chunk_count)
-        index_meta.save()
+        _checkpoint(searcher, index_meta, index_path, pending_chunks, pending_files)
         
-        progress.update(task_embed, completed=1, description="Indexing complete")
+        progress.update(task_index, description=f"Indexing complete ({total_chunks} chunks)")
 
-    console.print(f"\n[green]Successfully indexed {len(all_chunks)} chunks from {len(docs)} documents![/green]")
+    console.print(f"\n[green]Successfully indexed {total_chunks} chunks from {len(docs)} documents![/green]")
     console.print(f"Index saved to: [bold]{index_path}[/bold]")
 
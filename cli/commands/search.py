@@ -11,7 +11,7 @@ from rich.console import Console
 from rich.table import Table
 
 from rag.config import get_config
-from rag.embedding import Embedder, get_vector_store
+from rag.embedding import get_embedder, get_vector_store
 from rag.retrieval import HybridSearcher
 
 
@@ -37,9 +37,9 @@ def handle_search(
         console.print("[red]Error:[/red] Index not found. Please run 'rag index' first.")
         raise typer.Exit(code=1)
 
-    searcher = HybridSearcher(Embedder(), get_vector_store(config))  # 팩토리 사용
+    searcher = HybridSearcher(get_embedder(use_cache=True), get_vector_store(config))  # 팩토리 사용
     try:
-        searcher.load(index_path)
+        searcher.load(index_path, mmap=True)  # 검색 전용: 읽기 전용 mmap
     except Exception as e:
         console.print(f"[red]Index Load Error: {e}[/red]")
         raise typer.Exit(code=1)
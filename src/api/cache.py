@@ -0,0 +1,169 @@
+"""API 응답 캐시
+
+동일한 요청에 대해 임베딩 → 검색 → 리랭킹 → LLM 파이프라인을 다시 실행하지 않도록
+완성된 응답을 메모리에 캐싱합니다.
+
+- LRU 교체 (항목 수 및 바이트 크기 상한)
+- TTL 만료
+- 인덱스 파일 수정 시각을 키에 포함하여 재인덱싱 시 자동 무효화
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from rag.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 인덱스 버전 판단에 사용하는 파일 (LLM 캐시 등 질의마다 바뀌는 파일 제외)
+INDEX_VERSION_FILES = ("faiss.index", "chunks.pkl", "chunks.arrow", "bm25.pkl", "meta.json")
+
+
+class SmartRAGCache:
+    """스레드 안전한 LRU + TTL 응답 캐시"""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        max_bytes: int = 100 * 1024 * 1024,
+        ttl: float = 3600,
+    ):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            max_bytes: 최대 누적 크기 (바이트)
+            ttl: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        # key -> (value, size_bytes, expires_at)
+        self._entries: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """캐시 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, _, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, size_bytes: int | None = None) -> None:
+        """캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            size_bytes: 값의 크기 (바이트, None이면 추정)
+        """
+        if size_bytes is None:
+            size_bytes = _estimate_size(value)
+        if size_bytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (value, size_bytes, time.monotonic() + self.ttl)
+            self._total_bytes += size_bytes
+
+            while len(self._entries) > self.maxsize or self._total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+        logger.info("api_cache_cleared")
+
+    def stats(self) -> dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        """항목 삭제 (호출자가 lock 보유)"""
+        _, size_bytes, _ = self._entries.pop(key)
+        self._total_bytes -= size_bytes
+
+
+def _estimate_size(value: Any) -> int:
+    """값의 직렬화 크기 추정 (Pydantic 모델은 JSON 크기)"""
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json().encode("utf-8"))
+    return len(repr(value).encode("utf-8"))
+
+
+def index_version(index_path: Path) -> int:
+    """인덱스 파일들의 최신 수정 시각 (ns). 인덱스가 없으면 0."""
+    version = 0
+    for name in INDEX_VERSION_FILES:
+        try:
+            version = max(version, (index_path / name).stat().st_mtime_ns)
+        except FileNotFoundError:
+            continue
+    return version
+
+
+def make_cache_key(endpoint: str, index_path: Path, **fields: Any) -> str:
+    """요청 필드와 인덱스 버전으로 캐시 키 생성
+
+    Args:
+        endpoint: 엔드포인트 이름 (응답 형식 구분)
+        index_path: 인덱스 디렉토리 (재인덱싱 시 키가 바뀜)
+        **fields: 응답에 영향을 주는 요청 필드
+
+    Returns:
+        SHA256 hex 문자열
+    """
+    parts = [endpoint, str(index_version(index_path))]
+    parts.extend(f"{name}={fields[name]!r}" for name in sorted(fields))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+# 응답 캐시 싱글톤
+_cache: SmartRAGCache | None = None
+
+
+def get_cache() -> SmartRAGCache:
+    """API 응답 캐시 싱글톤 반환"""
+    global _cache
+    if _cache is None:
+        _cache = SmartRAGCache(maxsize=1024, max_bytes=100 * 1024 * 1024, ttl=3600)
+    return _cache
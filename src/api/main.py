@@ -3,17 +3,31 @@
 Terminal RAG REST API 서버
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from api.cache import get_cache
 from api.routes import ask, search, index
 from api.exceptions import RAGException
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 모델을 백그라운드에서 미리 로딩 (첫 요청 지연 제거)"""
+    warmup = asyncio.create_task(asyncio.to_thread(ask.warm_up))
+    yield
+    if not warmup.done():
+        warmup.cancel()
+
+
 app = FastAPI(
     title="Terminal RAG API",
+    lifespan=lifespan,
     description="RAG 기반 문서 Q&A API. 문서를 인덱싱하고 질문에 답변합니다.",
     version="0.1.0",
     docs_url="/docs",
@@ -84,7 +98,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 @app.get("/health")
 async def health_check():
     """서버 상태 확인"""
-    return {"status": "ok"}
+    return {"status": "ok", "cache": get_cache().stats()}
 
 
 @app.get("/")
@@ -3,42 +3,81 @@
 질문-답변 엔드포인트 (일반 및 스트리밍)
 """
 
+import asyncio
+import heapq
 import json
+import os
+import threading
+from operator import itemgetter
 from pathlib import Path
 from typing import AsyncIterator
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from api.cache import get_cache, make_cache_key
 from api.schemas import AskRequest, AskResponse, ChunkReference
 from api.exceptions import IndexNotFoundError
+from rag.chunking.chunk import Chunk
 from rag.config import get_config
-from rag.embedding import Embedder, get_vector_store
-from rag.generation import build_prompt, get_llm
+from rag.embedding import get_embedder, get_vector_store
+from rag.generation import build_prompt, context_order_key, get_llm
+from rag.generation.llm import is_error_response
 from rag.retrieval import HybridSearcher
 from rag.retrieval.reranker import Reranker
+from rag.retrieval.semantic_cache import SemanticCache
 from rag.retrieval.query_rewriter import QueryRewriter
+from rag.logger import get_logger
+
 
+logger = get_logger(__name__)
 
 router = APIRouter()
 
+# 프록시(nginx 등)와 클라이언트의 SSE 버퍼링 방지 헤더
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+SSE_DONE = b"data: [DONE]\n\n"
+
 # 싱글톤 인스턴스들 (지연 로딩)
 _searcher: HybridSearcher | None = None
 _reranker: Reranker | None = None
+_semantic_cache: SemanticCache | None = None
+_rewriters: dict[str, QueryRewriter] = {}
+# 시작 시 워밍업과 첫 요청이 동시에 초기화하지 않도록 보호
+_init_lock = threading.Lock()
+
+# 워커 스레드에서 실행되는 무거운 호출의 동시 실행 수 제한
+# (리랭커는 GPU 메모리 부족을 막기 위해 더 작게 유지)
+_llm_sem = asyncio.Semaphore(int(os.getenv("RAG_LLM_CONCURRENCY", "4")))
+_rerank_sem = asyncio.Semaphore(int(os.getenv("RAG_RERANK_CONCURRENCY", "2")))
 
 
 def get_searcher() -> HybridSearcher:
     """HybridSearcher 싱글톤"""
     global _searcher
     if _searcher is None:
-        config = get_config()
-        embedder = Embedder()
-        store = get_vector_store(config)
-        _searcher = HybridSearcher(embedder, store)
-        
-        index_path = Path(config.project.index_path)
-        if index_path.exists():
-            _searcher.load(index_path)
+        with _init_lock:
+            if _searcher is None:
+                config = get_config()
+                embedder = get_embedder(use_cache=True)
+                store = get_vector_store(config)
+                searcher = HybridSearcher(embedder, store)
+                
+                index_path = Path(config.project.index_path)
+                if index_path.exists():
+                    searcher.load(index_path)
+                _searcher = searcher
     return _searcher
 
 
@@ -46,74 +85,186 @@ def get_reranker_instance() -> Reranker:
     """Reranker 싱글톤"""
     global _reranker
     if _reranker is None:
-        config = get_config()
-        _reranker = Reranker(model_name=config.retrieval.reranker_model)
+        with _init_lock:
+            if _reranker is None:
+                config = get_config()
+                _reranker = Reranker(model_name=config.retrieval.reranker_model)
     return _reranker
 
 
-def _search_documents(request: AskRequest) -> tuple[list, list]:
-    """검색 로직 공통 함수
+def warm_up() -> None:
+    """검색기/리랭커 모델을 미리 로딩 (서버 시작 시 백그라운드 실행)"""
+    for name, factory in (("searcher", get_searcher), ("reranker", get_reranker_instance)):
+        try:
+            factory()
+            logger.info("api_warmup_loaded", component=name)
+        except Exception as e:
+            logger.warning("api_warmup_failed", component=name, error=str(e))
+
+
+def get_rewriter(provider: str | None) -> QueryRewriter:
+    """Provider별 QueryRewriter 싱글톤 (재작성 결과 캐시 공유)"""
+    key = provider or "default"
+    rewriter = _rewriters.get(key)
+    if rewriter is None:
+        rewriter = _rewriters[key] = QueryRewriter(get_llm(provider))
+    return rewriter
+
+
+def get_semantic_cache(dim: int) -> SemanticCache:
+    """유사 쿼리 검색 결과 캐시 싱글톤"""
+    global _semantic_cache
+    if _semantic_cache is None or _semantic_cache.dim != dim:
+        _semantic_cache = SemanticCache(dim=dim)
+    return _semantic_cache
+
+
+def clear_semantic_cache() -> None:
+    """인덱스 변경 시 유사 쿼리 캐시 폐기"""
+    if _semantic_cache is not None:
+        _semantic_cache.clear()
+
+
+def _sse_response(events: AsyncIterator[bytes]) -> StreamingResponse:
+    """버퍼링 없이 전송되는 SSE 응답 생성"""
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+def _sse_event(payload: dict) -> bytes:
+    """SSE data 프레임 직렬화 (orjson이 있으면 C 구현 사용)"""
+    if HAS_ORJSON:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload).encode("utf-8")
+    return b"data: " + body + b"\n\n"
+
+
+def _sse_text(text: str) -> bytes:
+    """토큰 프레임 직렬화 (토큰마다 dict를 만들지 않고 문자열만 인코딩)"""
+    if HAS_ORJSON:
+        return b'data: {"text":' + orjson.dumps(text) + b"}\n\n"
+    return _sse_event({"text": text})
+
+
+def require_index_path() -> Path:
+    """인덱스 경로 확인 의존성 (없으면 IndexNotFoundError)
     
-    Returns:
-        (chunks, unique_results) 튜플
+    라우트에서 get_searcher보다 먼저 선언하여, 인덱스가 없을 때는
+    모델 로딩 없이 바로 오류를 반환합니다.
     """
-    config = get_config()
-    index_path = Path(config.project.index_path)
-    
+    index_path = Path(get_config().project.index_path)
     if not index_path.exists():
         raise IndexNotFoundError()
+    return index_path
+
+
+def _ask_cache_key(request: AskRequest, index_path: Path) -> str:
+    """답변에 영향을 주는 요청 필드로 캐시 키 생성 (api_key 제외)"""
+    return make_cache_key(
+        "ask",
+        index_path,
+        query=request.query,
+        top_k=request.top_k,
+        rerank=request.rerank,
+        expand=request.expand,
+        provider=request.provider,
+        model_name=request.model_name,
+        base_url=request.base_url,
+        user_id=request.user_id,
+        source_filter=request.source_filter,
+    )
+
+
+async def _search_documents(request: AskRequest, searcher: HybridSearcher) -> tuple[list, list]:
+    """검색 로직 공통 함수
     
-    searcher = get_searcher()
+    블로킹 단계(쿼리 재작성, 임베딩, 검색, 리랭킹)는 워커 스레드에서 실행하여
+    이벤트 루프를 막지 않고, 확장 쿼리별 검색은 동시에 수행합니다.
     
+    Returns:
+        (chunks, unique_results) 튜플
+    """
     # Query Rewriting (선택적)
     if request.expand:
-        llm = get_llm(request.provider)
-        rewriter = QueryRewriter(llm)
-        queries = rewriter.rewrite(request.query)
+        rewriter = get_rewriter(request.provider)
+        queries = await asyncio.to_thread(rewriter.rewrite, request.query)
     else:
         queries = [request.query]
     
     # 검색 (user_id 및 source_filter 적용)
     search_top_k = request.top_k * 3 if request.rerank else request.top_k * 2
 
-    all_results = []
-    for q in queries:
-        # 검색 수행
-        results = searcher.search(
-            query=q,
-            top_k=search_top_k,
-            user_id=request.user_id,
-            source_filter=request.source_filter,
-            fusion_type="weighted",
-            alpha=0.7,  # 벡터 검색 가중치 70%
-        )
-        all_results.extend(results)
-    
-    # 중복 제거
-    seen = set()
-    unique_results = []
+    # 쿼리 임베딩은 한 번에 생성하고, 유사 쿼리의 검색 결과가 캐시에 있으면 재사용
+    query_vecs = await asyncio.to_thread(searcher.embedder.embed, queries)
+    semantic_cache = get_semantic_cache(query_vecs.shape[1])
+    scope = (search_top_k, request.user_id, request.source_filter)
+
+    per_query = [semantic_cache.get(query_vecs[i:i + 1], scope=scope) for i in range(len(queries))]
+    misses = [i for i, results in enumerate(per_query) if results is None]
+    if misses:
+        # 캐시 미스 쿼리만 이미 계산된 임베딩으로 동시 검색 (FAISS/NumPy는 GIL 해제)
+        miss_results = await asyncio.gather(*(
+            asyncio.to_thread(
+                searcher.search,
+                query=queries[i],
+                top_k=search_top_k,
+                user_id=request.user_id,
+                source_filter=request.source_filter,
+                fusion_type="weighted",
+                alpha=0.7,  # 벡터 검색 가중치 70%
+                query_vec=query_vecs[i:i + 1],
+            )
+            for i in misses
+        ))
+        for i, results in zip(misses, miss_results):
+            per_query[i] = results
+            semantic_cache.set(query_vecs[i:i + 1], results, scope=scope)
+
+    all_results = [r for results in per_query for r in results]
+    
+    # 중복 제거 (확장 쿼리 간 같은 청크는 최고 점수만 유지, CLI merge_results와 같은 내용 해시 기준)
+    best: dict[str, tuple[Chunk, float]] = {}
     for chunk, score in all_results:
-        chunk_id = chunk.metadata.get("chunk_index", id(chunk))
-        if chunk_id not in seen:
-            seen.add(chunk_id)
-            unique_results.append((chunk, score))
+        key = chunk.content_hash
+        prev = best.get(key)
+        if prev is None or score > prev[1]:
+            best[key] = (chunk, score)
     
-    unique_results.sort(key=lambda x: x[1], reverse=True)
+    if request.rerank:
+        # 리랭커가 전체 후보를 다시 평가하므로 정렬만 수행
+        unique_results = sorted(best.values(), key=itemgetter(1), reverse=True)
+    else:
+        unique_results = heapq.nlargest(request.top_k, best.values(), key=itemgetter(1))
     
     # Reranking (선택적)
     if request.rerank and unique_results:
         reranker = get_reranker_instance()
-        unique_results = reranker.rerank(request.query, unique_results, top_k=request.top_k)
+        async with _rerank_sem:
+            unique_results = await asyncio.to_thread(
+                reranker.rerank, request.query, unique_results, top_k=request.top_k
+            )
     
-    chunks = [r[0] for r in unique_results[:request.top_k]]
+    # 프롬프트 컨텍스트 순서로 정렬 (참조 번호와 답변의 [Chunk N] 일치)
+    top_results = sorted(unique_results[:request.top_k], key=lambda r: context_order_key(r[0]))
+    chunks = [r[0] for r in top_results]
     
-    return chunks, unique_results[:request.top_k]
+    return chunks, top_results
 
 
 @router.post("/ask", response_model=AskResponse)
-async def ask(request: AskRequest):
+async def ask(
+    request: AskRequest,
+    index_path: Path = Depends(require_index_path),
+    searcher: HybridSearcher = Depends(get_searcher),
+):
     """질문에 대한 답변 생성"""
-    chunks, unique_results = _search_documents(request)
+    cache = get_cache()
+    cache_key = _ask_cache_key(request, index_path)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    chunks, unique_results = await _search_documents(request, searcher)
     
     if not chunks:
         return AskResponse(answer="관련 문서를 찾을 수 없습니다.", references=[])
@@ -125,42 +276,51 @@ async def ask(request: AskRequest):
         api_key=request.api_key,
         model_name=request.model_name,
         base_url=request.base_url,
+        prefix_cache=request.prefix_cache,
     )
-    answer = llm.generate(prompt)
+    # 블로킹 LLM 호출은 워커 스레드에서 실행 (생성 중에도 다른 요청의 검색 진행)
+    async with _llm_sem:
+        answer = await asyncio.to_thread(llm.generate, prompt)
     
     # 참조 정보 구성
-    references = [
-        ChunkReference(
-            content=chunk.content[:500],
-            source=chunk.metadata.get("source", "unknown"),
-            score=score,
-        )
-        for chunk, score in unique_results
-    ]
+    references = [ChunkReference.from_chunk(chunk, score) for chunk, score in unique_results]
+    
+    response = AskResponse.model_construct(answer=answer, references=references)
+    if not is_error_response(answer):
+        cache.set(cache_key, response)
     
-    return AskResponse(answer=answer, references=references)
+    return response
 
 
 @router.post("/ask/stream")
-async def ask_stream(request: AskRequest):
+async def ask_stream(
+    request: AskRequest,
+    index_path: Path = Depends(require_index_path),
+    searcher: HybridSearcher = Depends(get_searcher),
+):
     """스트리밍 방식으로 답변 생성 (SSE)"""
-    chunks, unique_results = _search_documents(request)
+    cache = get_cache()
+    cache_key = _ask_cache_key(request, index_path)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        async def cached_response():
+            cached_references = [ref.model_dump() for ref in cached.references]
+            yield _sse_event({"references": cached_references})
+            yield _sse_text(cached.answer)
+            yield SSE_DONE
+        return _sse_response(cached_response())
+    
+    chunks, unique_results = await _search_documents(request, searcher)
     
     if not chunks:
         async def empty_response():
-            yield f"data: {json.dumps({'text': '관련 문서를 찾을 수 없습니다.'})}\n\n"
-            yield "data: [DONE]\n\n"
-        return StreamingResponse(empty_response(), media_type="text/event-stream")
+            yield _sse_text("관련 문서를 찾을 수 없습니다.")
+            yield SSE_DONE
+        return _sse_response(empty_response())
     
     # 참조 정보 (스트림 시작 시 전송)
-    references = [
-        {
-            "content": chunk.content[:500],
-            "source": chunk.metadata.get("source", "unknown"),
-            "score": score,
-        }
-        for chunk, score in unique_results
-    ]
+    references = [ChunkReference.from_chunk(chunk, score) for chunk, score in unique_results]
+    references_frame = _sse_event({"references": [ref.model_dump() for ref in references]})
     
     prompt = build_prompt(request.query, chunks)
     llm = get_llm(
@@ -168,17 +328,31 @@ async def ask_stream(request: AskRequest):
         api_key=request.api_key,
         model_name=request.model_name,
         base_url=request.base_url,
+        prefix_cache=request.prefix_cache,
     )
     
     async def generate():
-        # 먼저 참조 정보 전송
-        yield f"data: {json.dumps({'references': references})}\n\n"
+        # LLM 호출 전에 참조 정보부터 전송 (prefill 동안 클라이언트가 출처 표시)
+        yield references_frame
         
         # 스트리밍 응답 생성
-        for chunk_text in llm.generate_stream(prompt):
-            yield f"data: {json.dumps({'text': chunk_text})}\n\n"
+        parts = []
+        failed = False
+        async with _llm_sem:
+            async for chunk_text in llm.generate_stream_async(prompt):
+                parts.append(chunk_text)
+                failed = failed or is_error_response(chunk_text)
+                yield _sse_text(chunk_text)
+        
+        # 완료된 답변 캐싱 (스트림 중간에 오류가 섞인 응답 제외)
+        answer = "".join(parts)
+        if answer and not failed:
+            cache.set(
+                cache_key,
+                AskResponse.model_construct(answer=answer, references=references),
+            )
         
         # 완료 신호
-        yield "data: [DONE]\n\n"
+        yield SSE_DONE
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    return _sse_response(generate())
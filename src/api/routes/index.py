@@ -5,20 +5,22 @@
 
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
+from api.cache import get_cache
 from api.schemas import IndexRequest, IndexResponse
-from api.routes.ask import get_searcher
+from api.routes.ask import clear_semantic_cache, get_searcher
 from rag.config import get_config
 from rag.chunking import chunk_text
 from rag.ingestion.loader import load_file
+from rag.retrieval import HybridSearcher
 
 
 router = APIRouter()
 
 
 @router.post("/index", response_model=IndexResponse)
-async def index_document(request: IndexRequest):
+async def index_document(request: IndexRequest, searcher: HybridSearcher = Depends(get_searcher)):
     """텍스트를 청킹하여 인덱스에 추가"""
     config = get_config()
     
@@ -54,7 +56,6 @@ async def index_document(request: IndexRequest):
             chunk.metadata["user_id"] = request.user_id
     
     # 인덱스에 추가
-    searcher = get_searcher()
     searcher.index(chunks)
     
     # 인덱스 저장
@@ -62,6 +63,10 @@ async def index_document(request: IndexRequest):
     index_path.mkdir(parents=True, exist_ok=True)
     searcher.save(index_path)
     
+    # 인덱스가 바뀌었으므로 이전 응답 캐시 폐기
+    get_cache().clear()
+    clear_semantic_cache()
+    
     return IndexResponse(
         message=f"Successfully indexed {len(chunks)} chunks for user {request.user_id or 'anonymous'}",
         chunk_count=len(chunks),
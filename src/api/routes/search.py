@@ -3,38 +3,48 @@
 검색 전용 엔드포인트 (LLM 호출 없이 관련 문서만 반환)
 """
 
+import asyncio
 from pathlib import Path
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from api.cache import get_cache, make_cache_key
 from api.schemas import SearchRequest, SearchResponse, ChunkReference
-from api.exceptions import IndexNotFoundError
-from api.routes.ask import get_searcher
-from rag.config import get_config
+from api.routes.ask import get_searcher, require_index_path
+from rag.retrieval import HybridSearcher
 
 
 router = APIRouter()
 
 
 @router.post("/search", response_model=SearchResponse)
-async def search(request: SearchRequest):
+async def search(
+    request: SearchRequest,
+    index_path: Path = Depends(require_index_path),
+    searcher: HybridSearcher = Depends(get_searcher),
+):
     """관련 문서 검색"""
-    config = get_config()
-    index_path = Path(config.project.index_path)
+    cache = get_cache()
+    cache_key = make_cache_key(
+        "search",
+        index_path,
+        query=request.query,
+        top_k=request.top_k,
+        user_id=request.user_id,
+    )
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    if not index_path.exists():
-        raise IndexNotFoundError()
-    
-    searcher = get_searcher()
-    results = searcher.search(request.query, top_k=request.top_k)
+    # 블로킹 검색은 워커 스레드에서 실행 (이벤트 루프 점유 방지)
+    results = await asyncio.to_thread(searcher.search, request.query, top_k=request.top_k)
     
     references = [
-        ChunkReference(
-            content=chunk.content[:500],
-            source=chunk.metadata.get("filename", "unknown"),
-            score=score,
-        )
+        ChunkReference.from_chunk(chunk, score, source_key="filename")
         for chunk, score in results
     ]
     
-    return SearchResponse(results=references)
+    response = SearchResponse.model_construct(results=references)
+    cache.set(cache_key, response)
+    
+    return response
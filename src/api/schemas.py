@@ -3,8 +3,15 @@
 Pydantic 모델을 사용한 Request/Response 스키마
 """
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from rag.chunking.chunk import Chunk
+
 
 # === Ask Endpoint ===
 
@@ -22,6 +29,7 @@ class AskRequest(BaseModel):
     api_key: str | None = Field(default=None, description="API Key (Optional)")
     model_name: str | None = Field(default=None, description="Model Name (Optional)")
     base_url: str | None = Field(default=None, description="Base URL (Ollama only)")
+    prefix_cache: bool = Field(default=True, description="프롬프트 접두어 KV 캐시 재사용 (Ollama only)")
 
 
 class ChunkReference(BaseModel):
@@ -30,6 +38,24 @@ class ChunkReference(BaseModel):
     source: str = Field(..., description="출처 파일명")
     score: float = Field(..., description="관련도 점수")
 
+    @classmethod
+    def from_chunk(cls, chunk: Chunk, score: float, source_key: str = "source") -> ChunkReference:
+        """검색 결과 청크로부터 생성
+
+        필드 검증 없이(model_construct) 생성하므로, 이전 인덱스/Qdrant 페이로드에서
+        None이나 문자열이 아닌 값이 올 수 있는 메타데이터는 직접 문자열로 변환합니다.
+
+        Args:
+            chunk: 검색된 청크
+            score: 관련도 점수
+            source_key: 출처로 사용할 메타데이터 키
+        """
+        return cls.model_construct(
+            content=chunk.preview,
+            source=str(chunk.metadata.get(source_key) or "unknown"),
+            score=float(score),
+        )
+
 
 class AskResponse(BaseModel):
     """질문-답변 응답"""
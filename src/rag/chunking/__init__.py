@@ -3,24 +3,49 @@
 문서를 청크로 분할하는 기능을 제공합니다.
 """
 
-from rag.chunking.chunk import Chunk
-from rag.chunking.splitter import split_text
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from rag.chunking.chunk import Chunk, compute_content_hash
+from rag.chunking.splitter import iter_split_text, split_text
 from rag.chunking.markdown import split_markdown
 from rag.chunking.semantic import split_semantic
 from rag.config import get_config
 from rag.ingestion.document import Document
 
+if TYPE_CHECKING:
+    from rag.embedding.embedder import Embedder
+
+
+# 이 문서 수 미만이면 풀 생성 비용이 더 커서 순차 처리
+PARALLEL_MIN_DOCS = 8
+
+# 워커당 동시에 제출해 두는 배치 수 (결과를 순서대로 내보내며 메모리 상한 유지)
+PENDING_BATCHES_PER_WORKER = 2
+
+# 확장자별 구조 분할기 (없으면 기본 텍스트 분할)
+_SPLITTERS: dict[str, Callable[..., list[Chunk]]] = {
+    ".md": split_markdown,
+    ".markdown": split_markdown,
+}
+
 
-def chunk_document(doc: Document) -> list[Chunk]:
+def chunk_document(doc: Document, embedder: Embedder | None = None) -> list[Chunk]:
     """문서를 청크로 분할
 
     설정과 확장자에 따라 적절한 분할 전략을 선택합니다.
     - semantic: 의미 기반 분할 (임베딩 + 코사인 유사도)
-    - .md: Markdown 구조 보존 분할
+    - .md/.markdown: Markdown 구조 보존 분할
     - 기타: 기본 텍스트 분할
 
     Args:
         doc: 분할할 Document
+        embedder: semantic 전략에서 사용할 Embedder (None이면 내부 생성)
 
     Returns:
         Chunk 리스트
@@ -34,28 +59,83 @@ def chunk_document(doc: Document) -> list[Chunk]:
 
     # Strategy selection
     if strategy == "semantic":
-        return split_semantic(
+        chunks = split_semantic(
             doc.content,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             similarity_threshold=config.chunking.semantic_threshold,
             source=source,
-        )
-    elif extension == ".md":
-        return split_markdown(
-            doc.content,
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            source=source,
+            embedder=embedder,
+            batch_size=config.embedding.batch_size,
         )
     else:
-        return split_text(
+        splitter = _SPLITTERS.get(extension, split_text)
+        chunks = splitter(
             doc.content,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             source=source,
         )
 
+    # 검색 결과 병합 시 재계산하지 않도록 본문 해시를 미리 저장
+    for chunk in chunks:
+        chunk.metadata["content_hash"] = compute_content_hash(chunk.content)
+
+    return chunks
+
+
+def _chunk_batch(docs: list[Document]) -> list[list[Chunk]]:
+    """워커 프로세스에서 문서 묶음을 청킹 (IPC 횟수를 줄이기 위해 묶어서 전달)"""
+    return [chunk_document(doc) for doc in docs]
+
+
+def chunk_documents(
+    docs: list[Document],
+    max_workers: int | None = None,
+) -> Iterator[list[Chunk]]:
+    """여러 문서를 병렬로 청킹
+
+    - text/markdown: CPU 바운드 순수 Python 작업이므로 ProcessPoolExecutor 사용.
+      워커는 spawn으로 시작하여 부모의 스레드(로더 풀, torch 등) 상태를 물려받지 않고,
+      한 번에 제출하는 배치 수를 제한해 결과를 순서대로 흘려보냅니다.
+    - semantic: 공유 Embedder는 동시 호출을 가정하지 않으므로 문서를 순차 처리
+      (모델 추론 자체가 배치 단위로 코어를 활용)
+
+    Args:
+        docs: 분할할 Document 리스트
+        max_workers: 워커 수 (None이면 CPU 코어 수)
+
+    Yields:
+        입력 순서와 동일한 문서별 Chunk 리스트
+    """
+    workers = max_workers or os.cpu_count() or 1
+    strategy = get_config().chunking.strategy
+
+    if strategy == "semantic":
+        from rag.embedding.embedder import get_embedder
+        # 재인덱싱/문서 간 반복 문장은 임베딩 캐시에서 조회
+        embedder = get_embedder(use_cache=True)
+        for doc in docs:
+            yield chunk_document(doc, embedder=embedder)
+        return
+
+    if workers <= 1 or len(docs) < PARALLEL_MIN_DOCS:
+        for doc in docs:
+            yield chunk_document(doc)
+        return
+
+    batch_size = max(1, len(docs) // (workers * 4))
+    max_pending = workers * PENDING_BATCHES_PER_WORKER
+    pending: deque[Future[list[list[Chunk]]]] = deque()
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        for start in range(0, len(docs), batch_size):
+            pending.append(executor.submit(_chunk_batch, docs[start:start + batch_size]))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
 
 def chunk_text(
     text: str,
@@ -88,9 +168,12 @@ def chunk_text(
 
 __all__ = [
     "Chunk",
+    "compute_content_hash",
     "split_text",
+    "iter_split_text",
     "split_markdown",
     "split_semantic",
     "chunk_document",
+    "chunk_documents",
     "chunk_text",
 ]
@@ -0,0 +1,77 @@
+"""Numba-compiled core of semantic sentence grouping
+
+Used by ``rag.chunking.semantic`` when numba is installed; the pure Python
+loop in ``_group_sentences_semantically`` is the fallback.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _group_boundaries(
+    embeddings: np.ndarray,
+    sent_lens: np.ndarray,
+    threshold: float,
+    chunk_size: int,
+) -> np.ndarray:
+    """Compute group start indices for contiguous semantic sentence groups
+
+    Same rule as ``_group_sentences_semantically``: a sentence joins the
+    current group if its cosine similarity to the group centroid (running
+    sum of unit-norm rows) reaches ``threshold`` and the joined text fits
+    in ``chunk_size`` characters. A threshold <= 0 skips the similarity check.
+
+    Args:
+        embeddings: Unit-norm sentence embeddings (float32, shape: [n, d])
+        sent_lens: Sentence lengths in characters (int32, shape: [n])
+        threshold: Minimum similarity to stay in same group
+        chunk_size: Maximum chunk size in characters
+
+    Returns:
+        Start index of every group (int32, first element is 0)
+    """
+    n, d = embeddings.shape
+    starts = np.empty(n, dtype=np.int32)
+    if n == 0:
+        return starts
+
+    starts[0] = 0
+    n_groups = 1
+    current_sum = embeddings[0].copy()
+    current_size = sent_lens[0]
+
+    for i in range(1, n):
+        similarity = threshold
+        if threshold > 0.0:
+            dot = 0.0
+            sq = 0.0
+            for j in range(d):
+                dot += current_sum[j] * embeddings[i, j]
+                sq += current_sum[j] * current_sum[j]
+            similarity = dot / (np.sqrt(sq) + 1e-12)
+
+        if similarity >= threshold and current_size + sent_lens[i] + 1 <= chunk_size:
+            for j in range(d):
+                current_sum[j] += embeddings[i, j]
+            current_size += sent_lens[i] + 1
+        else:
+            starts[n_groups] = i
+            n_groups += 1
+            for j in range(d):
+                current_sum[j] = embeddings[i, j]
+            current_size = sent_lens[i]
+
+    return starts[:n_groups]
+
+
+if HAS_NUMBA:
+    group_boundaries = njit(cache=True)(_group_boundaries)
+else:
+    group_boundaries = _group_boundaries
@@ -5,11 +5,39 @@
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from typing import Any
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
 
-@dataclass
+
+def compute_content_hash(text: str) -> str:
+    """청크 본문 해시 계산
+    
+    Python 내장 hash()와 달리 실행 간 값이 안정적입니다.
+    xxhash(xxh3_64)가 설치되어 있으면 사용하고, 없으면 BLAKE2b(8바이트)로 대체합니다.
+    
+    Args:
+        text: 해시할 본문
+        
+    Returns:
+        16자리 hex 문자열
+    """
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_hexdigest(text)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# 검색 응답/참조 표시에 사용하는 본문 미리보기 길이 (자)
+PREVIEW_CHARS = 500
+
+
+@dataclass(slots=True)
 class Chunk:
     """청크 데이터 클래스
     
@@ -21,9 +49,11 @@ class Chunk:
             - start_char: 원본에서 시작 위치
             - end_char: 원본에서 끝 위치
             - header_path: Markdown 헤더 경로 (예: "# Title > ## Section")
+            - content_hash: 본문 해시 (chunk_document에서 미리 계산)
     """
     content: str
     metadata: dict[str, Any] = field(default_factory=dict)
+    _preview: str | None = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def create(
@@ -34,6 +64,7 @@ class Chunk:
         start_char: int,
         end_char: int,
         header_path: str = "",
+        **extra_metadata: Any,
     ) -> Chunk:
         """청크 생성 헬퍼
         
@@ -44,6 +75,7 @@ class Chunk:
             start_char: 원본에서 시작 위치
             end_char: 원본에서 끝 위치
             header_path: Markdown 헤더 경로
+            **extra_metadata: 추가 메타데이터 (분할 전략별 정보 등, 생성 시 함께 저장)
             
         Returns:
             Chunk 인스턴스
@@ -56,9 +88,45 @@ class Chunk:
                 "start_char": start_char,
                 "end_char": end_char,
                 "header_path": header_path,
+                **extra_metadata,
             }
         )
     
+    @property
+    def content_hash(self) -> str:
+        """본문 해시 (메타데이터에 없으면 계산 후 저장)"""
+        value = self.metadata.get("content_hash")
+        if value is None:
+            value = compute_content_hash(self.content)
+            self.metadata["content_hash"] = value
+        return value
+    
+    @property
+    def preview(self) -> str:
+        """본문 미리보기 (앞 PREVIEW_CHARS자)
+        
+        응답마다 슬라이스를 새로 만들지 않도록 처음 접근 시 한 번만 생성합니다.
+        PREVIEW_CHARS 이하 본문은 복사 없이 content 자체를 공유합니다.
+        """
+        if self._preview is None:
+            self._preview = self.content[:PREVIEW_CHARS]
+        return self._preview
+    
+    def __getstate__(self) -> dict[str, Any]:
+        """pickle 상태 (파생 값인 미리보기 캐시는 저장하지 않음)"""
+        return {"content": self.content, "metadata": self.metadata}
+    
+    def __setstate__(self, state: Any) -> None:
+        """pickle 복원 (__slots__ 도입 이전에 저장된 __dict__ 상태도 지원)"""
+        if isinstance(state, tuple):
+            # 슬롯 클래스의 기본 상태: (__dict__ 상태, 슬롯 상태)
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        object.__setattr__(self, "_preview", None)
+        for name, value in state.items():
+            if name != "_preview":
+                object.__setattr__(self, name, value)
+    
     def __len__(self) -> int:
         """청크 본문 길이 반환"""
         return len(self.content)
@@ -10,14 +10,14 @@ import re
 from dataclasses import dataclass
 
 from rag.chunking.chunk import Chunk
-from rag.chunking.splitter import split_text
+from rag.chunking.splitter import iter_split_text
 
 
 # Markdown 헤더 패턴 (# ~ ######)
 HEADER_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Markdown 섹션"""
     level: int          # 헤더 레벨 (1-6)
@@ -27,6 +27,34 @@ class Section:
     end_pos: int        # 원본에서 끝 위치
 
 
+def _find_headers(text: str) -> list[re.Match[str]]:
+    """헤더 매치 목록 (HEADER_PATTERN.finditer와 동일한 결과)
+    
+    정규식을 문서 전체에 돌리지 않고, C 수준의 str.find로 '#'로 시작하는 줄만
+    찾은 뒤 해당 위치에서만 패턴을 매칭합니다. 본문 줄은 Python 코드에 도달하지 않습니다.
+    """
+    headers: list[re.Match[str]] = []
+    
+    if text.startswith("#"):
+        candidate = 0
+    else:
+        candidate = text.find("\n#") + 1  # 없으면 0 → 아래에서 종료
+        if candidate == 0:
+            return headers
+    
+    while True:
+        match = HEADER_PATTERN.match(text, candidate)
+        search_from = candidate
+        if match:
+            headers.append(match)
+            search_from = match.end()
+        
+        next_line = text.find("\n#", search_from)
+        if next_line < 0:
+            return headers
+        candidate = next_line + 1
+
+
 def _parse_sections(text: str) -> list[Section]:
     """Markdown 텍스트를 섹션으로 파싱
     
@@ -39,7 +67,7 @@ def _parse_sections(text: str) -> list[Section]:
     sections: list[Section] = []
     
     # 모든 헤더 찾기
-    headers = list(HEADER_PATTERN.finditer(text))
+    headers = _find_headers(text)
     
     if not headers:
         # 헤더가 없으면 전체를 하나의 섹션으로
@@ -88,40 +116,32 @@ def _parse_sections(text: str) -> list[Section]:
     return sections
 
 
-def _build_header_path(sections: list[Section], current_index: int) -> str:
-    """현재 섹션의 헤더 경로 생성
+def _build_header_paths(sections: list[Section]) -> list[str]:
+    """모든 섹션의 헤더 경로를 한 번의 순회로 생성
+    
+    상위 헤더 스택을 유지하므로 섹션마다 이전 섹션을 역순 탐색하지 않습니다.
     
     Args:
         sections: 모든 섹션 리스트
-        current_index: 현재 섹션 인덱스
         
     Returns:
-        헤더 경로 (예: "# Title > ## Section > ### Subsection")
+        섹션별 헤더 경로 (예: "# Title > ## Section > ### Subsection")
     """
-    if current_index >= len(sections):
-        return ""
-    
-    current = sections[current_index]
-    if current.level == 0:
-        return ""
+    paths: list[str] = []
+    stack: list[tuple[int, str]] = []  # (레벨, "## 제목")
     
-    path_parts: list[str] = []
-    target_level = current.level
-    
-    # 현재 섹션부터 역순으로 상위 헤더 찾기
-    for i in range(current_index, -1, -1):
-        section = sections[i]
-        
-        if section.level > 0 and section.level <= target_level:
-            prefix = "#" * section.level
-            path_parts.append(f"{prefix} {section.title}")
-            target_level = section.level - 1
+    for section in sections:
+        if section.level == 0:
+            paths.append("")
+            continue
         
-        if target_level == 0:
-            break
+        # 같은 레벨 이하(더 깊거나 같은) 헤더는 현재 섹션의 상위가 아님
+        while stack and stack[-1][0] >= section.level:
+            stack.pop()
+        stack.append((section.level, f"{'#' * section.level} {section.title}"))
+        paths.append(" > ".join(part for _, part in stack))
     
-    path_parts.reverse()
-    return " > ".join(path_parts)
+    return paths
 
 
 def split_markdown(
@@ -145,42 +165,39 @@ def split_markdown(
         return []
     
     sections = _parse_sections(text)
+    header_paths = _build_header_paths(sections)
     chunks: list[Chunk] = []
-    chunk_index = 0
     
-    for section_idx, section in enumerate(sections):
-        header_path = _build_header_path(sections, section_idx)
+    for section, header_path in zip(sections, header_paths):
+        offset = section.start_pos
         
-        # 섹션이 chunk_size보다 크면 추가 분할
+        # 섹션이 chunk_size보다 크면 추가 분할 (중간 리스트 없이 바로 추가)
         if len(section.content) > chunk_size:
-            sub_chunks = split_text(
+            for sub_chunk in iter_split_text(
                 section.content,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
                 source=source,
-            )
-            
-            for sub_chunk in sub_chunks:
+            ):
                 # 메타데이터 업데이트
-                sub_chunk.metadata["chunk_index"] = chunk_index
-                sub_chunk.metadata["start_char"] = section.start_pos + sub_chunk.metadata["start_char"]
-                sub_chunk.metadata["end_char"] = section.start_pos + sub_chunk.metadata["end_char"]
-                sub_chunk.metadata["header_path"] = header_path
+                metadata = sub_chunk.metadata
+                metadata["chunk_index"] = len(chunks)
+                metadata["start_char"] += offset
+                metadata["end_char"] += offset
+                metadata["header_path"] = header_path
                 
                 chunks.append(sub_chunk)
-                chunk_index += 1
         else:
             # 섹션 전체를 하나의 청크로
             if section.content.strip():
                 chunk = Chunk.create(
                     content=section.content,
                     source=source,
-                    chunk_index=chunk_index,
+                    chunk_index=len(chunks),
                     start_char=section.start_pos,
                     end_char=section.end_pos,
                     header_path=header_path,
                 )
                 chunks.append(chunk)
-                chunk_index += 1
     
     return chunks
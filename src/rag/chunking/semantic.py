@@ -6,11 +6,15 @@ Maintains topic coherence while respecting size constraints.
 
 from __future__ import annotations
 
+import os
 import re
+import threading
 import numpy as np
 from typing import TYPE_CHECKING
 
+from rag.chunking._semantic_numba import HAS_NUMBA, group_boundaries
 from rag.chunking.chunk import Chunk
+from rag.chunking.splitter import split_text
 from rag.ingestion.language import detect_language
 from rag.logger import get_logger
 
@@ -23,12 +27,24 @@ logger = get_logger(__name__)
 # Lazy import for Kiwi (optional dependency handling)
 try:
     from kiwipiepy import Kiwi
-    _kiwi_instance = None
     HAS_KIWI = True
 except ImportError:
     HAS_KIWI = False
     logger.warning("kiwipiepy_not_available", fallback="regex_splitting")
 
+_kiwi_instance = None
+# Kiwi() loads its model from disk; threaded ingestion must not load it twice
+_kiwi_lock = threading.Lock()
+
+# Optional SIMD dot-product kernels (falls back to NumPy)
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+_SIMSIMD_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
 
 # English sentence splitting pattern
 # Matches: . ? ! followed by space and capital letter, or end of string
@@ -45,14 +61,21 @@ MAX_SENTENCE_LENGTH = 2000
 
 
 def _get_kiwi() -> Kiwi:
-    """Get lazy-initialized Kiwi instance"""
+    """Get lazy-initialized Kiwi instance (thread-safe)"""
     global _kiwi_instance
     if _kiwi_instance is None:
-        _kiwi_instance = Kiwi()
-        logger.debug("kiwi_initialized")
+        with _kiwi_lock:
+            if _kiwi_instance is None:
+                _kiwi_instance = Kiwi()
+                logger.debug("kiwi_initialized")
     return _kiwi_instance
 
 
+# Optional eager load (e.g. before starting ingestion worker threads)
+if HAS_KIWI and os.getenv("RAG_EAGER_KIWI") == "1":
+    _get_kiwi()
+
+
 def _split_long_sentence(sentence: str, max_len: int = MAX_SENTENCE_LENGTH) -> list[str]:
     """Split overly long sentence at natural boundaries
 
@@ -66,31 +89,26 @@ def _split_long_sentence(sentence: str, max_len: int = MAX_SENTENCE_LENGTH) -> l
     if len(sentence) <= max_len:
         return [sentence]
 
-    # Split on commas, semicolons, or whitespace
+    # Single pass over the sentence: each part ends at the last comma/semicolon
+    # within max_len, else the last space, else a hard cut at max_len
     parts = []
-    current = ""
-
-    # Try splitting on commas and semicolons first
-    for segment in re.split(r'([,;])', sentence):
-        if len(current) + len(segment) <= max_len:
-            current += segment
-        else:
-            if current.strip():
-                parts.append(current.strip())
-            current = segment
-
-    # If still too long, split on whitespace
-    if current and len(current) > max_len:
-        for word in current.split():
-            if len(current) + len(word) + 1 <= max_len:
-                current += (" " + word if current else word)
-            else:
-                if current:
-                    parts.append(current)
-                current = word
-
-    if current.strip():
-        parts.append(current.strip())
+    start = 0
+    while len(sentence) - start > max_len:
+        end = start + max_len
+        cut = max(sentence.rfind(",", start, end), sentence.rfind(";", start, end))
+        if cut <= start:
+            cut = sentence.rfind(" ", start, end)
+        if cut <= start:
+            cut = end - 1
+
+        part = sentence[start:cut + 1].strip()
+        if part:
+            parts.append(part)
+        start = cut + 1
+
+    part = sentence[start:].strip()
+    if part:
+        parts.append(part)
 
     return parts if parts else [sentence]
 
@@ -137,22 +155,33 @@ def _split_sentences_english(text: str) -> list[str]:
         List of sentences
     """
     # Simple sentence splitting on period, question mark, exclamation
-    sentences = ENGLISH_SENTENCE_PATTERN.split(text)
-
-    # Clean and filter
+    # (walk boundary matches and slice, without building the split list first)
     result = []
-    for sent in sentences:
-        sent = sent.strip()
-        if sent:
-            # Handle very long sentences
-            if len(sent) > MAX_SENTENCE_LENGTH:
-                result.extend(_split_long_sentence(sent))
-            else:
-                result.append(sent)
+    last_end = 0
+    for match in ENGLISH_SENTENCE_PATTERN.finditer(text):
+        _append_sentence(result, text[last_end:match.start()])
+        last_end = match.end()
+    _append_sentence(result, text[last_end:])
 
     return result
 
 
+def _append_sentence(result: list[str], sent: str) -> None:
+    """Clean a sentence and append it (sub-splitting very long ones)
+
+    Args:
+        result: Sentence list to append to
+        sent: Raw sentence text
+    """
+    sent = sent.strip()
+    if sent:
+        # Handle very long sentences
+        if len(sent) > MAX_SENTENCE_LENGTH:
+            result.extend(_split_long_sentence(sent))
+        else:
+            result.append(sent)
+
+
 def split_into_sentences(text: str, language: str | None = None) -> list[str]:
     """Split text into sentences based on language
 
@@ -190,69 +219,127 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     Returns:
         Similarity score (0.0 to 1.0, typically)
     """
+    if HAS_SIMSIMD and vec1.dtype == vec2.dtype and vec1.dtype in _SIMSIMD_DTYPES:
+        # Direct native call, skips NumPy's per-call dispatch overhead
+        return float(simsimd.dot(vec1, vec2))
     return float(np.dot(vec1, vec2))
 
 
-def _calculate_group_embedding(embeddings: list[np.ndarray]) -> np.ndarray:
-    """Calculate average embedding for a group of sentences
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embedding rows in place (float32)
+
+    Args:
+        embeddings: Sentence embeddings (shape: [n_sentences, embedding_dim])
+
+    Returns:
+        Unit-norm embeddings (zero rows stay zero)
+    """
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+    if not embeddings.flags.writeable:
+        embeddings = embeddings.copy()
+
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    np.divide(embeddings, norms.clip(min=1e-12), out=embeddings)
+    return embeddings
+
+
+def _group_avg_similarities(embeddings: np.ndarray, groups: list[slice]) -> np.ndarray:
+    """Mean cosine similarity of each group's sentences to its centroid
+
+    All group sums come from one ``np.add.reduceat`` over the embedding
+    matrix, instead of a separate centroid reduction per group.
 
     Args:
-        embeddings: List of sentence embeddings
+        embeddings: Unit-norm sentence embeddings (shape: [n_sentences, embedding_dim])
+        groups: Contiguous sentence slices covering all rows, in order
 
     Returns:
-        Average embedding (normalized)
+        Average similarity per group (0.0 for single-sentence groups)
     """
-    if not embeddings:
-        return np.array([])
+    starts = np.fromiter((group.start for group in groups), dtype=np.intp, count=len(groups))
+    counts = np.diff(np.append(starts, len(embeddings)))
 
-    # Average and re-normalize
-    avg = np.mean(embeddings, axis=0)
-    norm = np.linalg.norm(avg)
-    if norm > 0:
-        avg = avg / norm
+    centroids = np.add.reduceat(embeddings, starts, axis=0)
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True).clip(min=1e-12)
 
+    row_sims = np.einsum("ij,ij->i", embeddings, np.repeat(centroids, counts, axis=0))
+    avg = np.add.reduceat(row_sims, starts) / counts
+    avg[counts == 1] = 0.0
     return avg
 
 
+def _fits_one_group(sentences: list[str], chunk_size: int) -> bool:
+    """Check whether all sentences joined with spaces fit in one chunk"""
+    return sum(map(len, sentences)) + len(sentences) - 1 <= chunk_size
+
+
 def _group_sentences_semantically(
     sentences: list[str],
     embeddings: np.ndarray,
     similarity_threshold: float,
     chunk_size: int,
-) -> list[tuple[list[str], list[np.ndarray]]]:
+) -> list[slice]:
     """Group sentences based on semantic similarity
 
+    Groups are contiguous runs of sentences, returned as slices so that
+    callers index ``sentences`` and the ``embeddings`` matrix directly
+    (rows stay in the single contiguous array, no per-group copies).
+
     Args:
         sentences: List of sentences
         embeddings: Sentence embeddings (shape: [n_sentences, embedding_dim])
         similarity_threshold: Minimum similarity to stay in same group
+            (<= 0 disables the similarity check, only size splits groups)
         chunk_size: Maximum chunk size in characters
 
     Returns:
-        List of (sentence_group, embedding_group) tuples
+        List of sentence slices, one per group
     """
     if not sentences:
         return []
 
+    # Sentence lengths computed once (int32 array, as the compiled loop expects)
+    sent_lens = np.fromiter((len(s) for s in sentences), dtype=np.int32, count=len(sentences))
+
+    if similarity_threshold <= 0.0 and _fits_one_group(sentences, chunk_size):
+        return [slice(0, len(sentences))]
+
+    if HAS_NUMBA:
+        # Compiled loop; same grouping rule, without per-sentence logging
+        starts = group_boundaries(
+            np.ascontiguousarray(embeddings, dtype=np.float32),
+            sent_lens,
+            similarity_threshold,
+            chunk_size,
+        ).tolist()
+        groups = [slice(start, end) for start, end in zip(starts, starts[1:] + [len(sentences)])]
+        logger.debug("semantic_groups_compiled", groups=len(groups))
+        return groups
+
     groups = []
-    current_sentences = []
-    current_embeddings = []
+    current_start = 0
     current_size = 0
+    # Running sum of group embeddings: sum/|sum| equals the normalized mean,
+    # so similarity is updated in O(d) per sentence instead of re-averaging the group
+    current_sum = np.zeros(embeddings.shape[1], dtype=embeddings.dtype)
 
-    for i, (sentence, embedding) in enumerate(zip(sentences, embeddings)):
-        sentence_len = len(sentence)
+    for i, (sentence_len, embedding) in enumerate(zip(sent_lens.tolist(), embeddings)):
 
         # Check if we should add to current group
         should_add = False
         similarity = 0.0
 
-        if not current_embeddings:
+        if i == current_start:
             # First sentence always starts a group
             should_add = True
         else:
-            # Calculate similarity with current group
-            group_embedding = _calculate_group_embedding(current_embeddings)
-            similarity = cosine_similarity(group_embedding, embedding)
+            if similarity_threshold > 0.0:
+                # Calculate similarity with current group centroid
+                sum_norm = np.sqrt(np.vdot(current_sum, current_sum))
+                similarity = float(np.dot(current_sum, embedding) / (sum_norm + 1e-12))
+            else:
+                # No similarity constraint: only the size limit splits groups
+                similarity = similarity_threshold
 
             # Add if similar AND doesn't exceed size
             if similarity >= similarity_threshold:
@@ -269,30 +356,28 @@ def _group_sentences_semantically(
                     )
 
         if should_add:
-            current_sentences.append(sentence)
-            current_embeddings.append(embedding)
-            current_size += sentence_len + (1 if len(current_sentences) > 1 else 0)
+            current_sum += embedding
+            current_size += sentence_len + (1 if i > current_start else 0)
         else:
             # Start new group
-            if current_sentences:
-                groups.append((current_sentences, current_embeddings))
-                logger.debug(
-                    "semantic_group_created",
-                    sentences=len(current_sentences),
-                    size=current_size,
-                    reason="similarity_drop" if similarity < similarity_threshold else "size_limit",
-                )
-
-            current_sentences = [sentence]
-            current_embeddings = [embedding]
+            groups.append(slice(current_start, i))
+            logger.debug(
+                "semantic_group_created",
+                sentences=i - current_start,
+                size=current_size,
+                reason="similarity_drop" if similarity < similarity_threshold else "size_limit",
+            )
+
+            current_start = i
+            current_sum = embedding.copy()
             current_size = sentence_len
 
     # Add final group
-    if current_sentences:
-        groups.append((current_sentences, current_embeddings))
+    if current_start < len(sentences):
+        groups.append(slice(current_start, len(sentences)))
         logger.debug(
             "semantic_group_created",
-            sentences=len(current_sentences),
+            sentences=len(sentences) - current_start,
             size=current_size,
             reason="last_group",
         )
@@ -302,6 +387,7 @@ def _group_sentences_semantically(
 
 def _apply_overlap_to_chunks(
     chunks: list[Chunk],
+    sentence_groups: list[list[str]],
     chunk_overlap: int,
     chunk_size: int,
 ) -> list[Chunk]:
@@ -309,6 +395,8 @@ def _apply_overlap_to_chunks(
 
     Args:
         chunks: List of chunks without overlap
+        sentence_groups: Sentences of each chunk (same order as ``chunks``),
+            reused instead of re-splitting chunk content
         chunk_overlap: Target overlap size in characters
         chunk_size: Maximum chunk size (to prevent exceeding limit)
 
@@ -318,36 +406,29 @@ def _apply_overlap_to_chunks(
     if not chunks or chunk_overlap <= 0:
         return chunks
 
-    overlapped = [chunks[0]]  # First chunk unchanged
-
     for i in range(1, len(chunks)):
-        prev_chunk = chunks[i - 1]
         current_chunk = chunks[i]
+        current_len = len(current_chunk.content)
 
-        # Get sentences from previous chunk for overlap
-        prev_sentences = split_into_sentences(prev_chunk.content)
-        overlap_text = ""
-
-        # Add sentences from end of previous chunk until we reach overlap size
+        # Take sentences from the end of the previous chunk until we reach overlap size
         # But ensure total size doesn't exceed chunk_size
-        for sent in reversed(prev_sentences):
-            potential_size = len(overlap_text) + len(sent) + 1 + len(current_chunk.content)
-            if (len(overlap_text) + len(sent) + 1 <= chunk_overlap and
-                potential_size <= chunk_size):
-                overlap_text = sent + (" " + overlap_text if overlap_text else "")
+        collected = []
+        overlap_len = 0
+        for sent in reversed(sentence_groups[i - 1]):
+            if (overlap_len + len(sent) + 1 <= chunk_overlap and
+                overlap_len + len(sent) + 1 + current_len <= chunk_size):
+                collected.append(sent)
+                overlap_len += len(sent) + (1 if len(collected) > 1 else 0)
             else:
                 break
 
         # Prepend overlap to current chunk
-        if overlap_text.strip():
-            new_content = overlap_text.strip() + " " + current_chunk.content
-            # Update chunk content only if it doesn't exceed size limit
-            if len(new_content) <= chunk_size:
-                current_chunk.content = new_content
+        if collected:
+            collected.reverse()
+            collected.append(current_chunk.content)
+            current_chunk.content = " ".join(collected)
 
-        overlapped.append(current_chunk)
-
-    return overlapped
+    return chunks
 
 
 def split_semantic(
@@ -357,6 +438,7 @@ def split_semantic(
     similarity_threshold: float = 0.7,
     source: str = "",
     embedder: Embedder | None = None,
+    batch_size: int | None = None,
 ) -> list[Chunk]:
     """Split text into semantically coherent chunks
 
@@ -364,9 +446,11 @@ def split_semantic(
         text: Text to split
         chunk_size: Maximum chunk size in characters
         chunk_overlap: Overlap size in characters
-        similarity_threshold: Minimum cosine similarity to group sentences (0.0-1.0)
+        similarity_threshold: Minimum cosine similarity to group sentences (0.0-1.0,
+            0.0 groups by size only)
         source: Source document path (for metadata)
         embedder: Embedder instance (will create if None)
+        batch_size: Embedding batch size (None uses embedding.batch_size from config)
 
     Returns:
         List of Chunk objects
@@ -382,22 +466,14 @@ def split_semantic(
             length=len(text),
             using="simple_chunking",
         )
-        # Import here to avoid circular dependency
-        from rag.chunking.splitter import split_text
         return split_text(text, chunk_size, chunk_overlap, source)
 
-    # Initialize embedder if needed
-    if embedder is None:
-        from rag.embedding.embedder import Embedder
-        embedder = Embedder()
-
     # Step 1: Split into sentences
     logger.debug("splitting_sentences", text_length=len(text))
     try:
         sentences = split_into_sentences(text)
     except Exception as e:
         logger.error("sentence_split_failed", error=str(e), using="simple_chunking")
-        from rag.chunking.splitter import split_text
         return split_text(text, chunk_size, chunk_overlap, source)
 
     if not sentences:
@@ -413,23 +489,48 @@ def split_semantic(
             chunk_index=0,
             start_char=0,
             end_char=len(text),
+            chunking_strategy="semantic",
+            sentence_count=1,
+            avg_similarity=1.0,
         )
-        chunk.metadata["chunking_strategy"] = "semantic"
-        chunk.metadata["sentence_count"] = 1
-        chunk.metadata["avg_similarity"] = 1.0
         return [chunk]
 
     logger.info("sentences_split", count=len(sentences))
 
+    # Whole text fits in one chunk and similarity never splits: skip embedding
+    if similarity_threshold <= 0.0 and _fits_one_group(sentences, chunk_size):
+        logger.debug("semantic_single_group", reason="no_split_possible")
+        content = " ".join(sentences)
+        chunk = Chunk.create(
+            content=content,
+            source=source,
+            chunk_index=0,
+            start_char=0,
+            end_char=len(content),
+            chunking_strategy="semantic",
+            sentence_count=len(sentences),
+            avg_similarity=1.0,
+        )
+        return [chunk]
+
+    # Initialize embedder if needed
+    if embedder is None:
+        from rag.embedding.embedder import get_embedder
+        # Repeated sentences (re-ingestion, shared boilerplate) hit the embedding cache
+        embedder = get_embedder(use_cache=True)
+
     # Step 2: Embed all sentences
     logger.debug("embedding_sentences", count=len(sentences))
     try:
-        embeddings = embedder.embed(sentences)
+        # All sentences in one call; the embedder tiles them into batch_size batches
+        embeddings = embedder.embed(sentences, batch_size=batch_size)
     except Exception as e:
         logger.error("embedding_failed", error=str(e), using="simple_chunking")
-        from rag.chunking.splitter import split_text
         return split_text(text, chunk_size, chunk_overlap, source)
 
+    # Normalize all rows once so every similarity below is a plain dot product
+    embeddings = _normalize_rows(embeddings)
+
     # Step 3: Group sentences semantically
     logger.debug(
         "grouping_semantically",
@@ -447,44 +548,41 @@ def split_semantic(
 
     # Step 4: Create chunks from groups
     chunks = []
+    sentence_groups = []
     char_position = 0
+    total_len = 0
+    avg_similarities = _group_avg_similarities(embeddings, groups)
 
-    for chunk_idx, (sent_group, embed_group) in enumerate(groups):
+    for chunk_idx, group in enumerate(groups):
         # Combine sentences
+        sent_group = sentences[group]
+        sentence_groups.append(sent_group)
         content = " ".join(sent_group)
         chunk_len = len(content)
 
-        # Calculate average similarity within group (for metadata)
-        avg_similarity = 0.0
-        if len(embed_group) > 1:
-            group_emb = _calculate_group_embedding(embed_group)
-            similarities = [
-                cosine_similarity(group_emb, emb) for emb in embed_group
-            ]
-            avg_similarity = float(np.mean(similarities))
-
         chunk = Chunk.create(
             content=content,
             source=source,
             chunk_index=chunk_idx,
             start_char=char_position,
             end_char=char_position + chunk_len,
+            # Semantic-specific metadata (stored in the same dict literal)
+            chunking_strategy="semantic",
+            sentence_count=len(sent_group),
+            avg_similarity=round(float(avg_similarities[chunk_idx]), 3),
         )
 
-        # Add semantic-specific metadata
-        chunk.metadata["chunking_strategy"] = "semantic"
-        chunk.metadata["sentence_count"] = len(sent_group)
-        chunk.metadata["avg_similarity"] = round(avg_similarity, 3)
-
         chunks.append(chunk)
         char_position += chunk_len + 1  # +1 for space between chunks
+        total_len += chunk_len
 
     # Step 5: Apply overlap
     if chunk_overlap > 0 and len(chunks) > 1:
         logger.debug("applying_overlap", overlap=chunk_overlap)
-        chunks = _apply_overlap_to_chunks(chunks, chunk_overlap, chunk_size)
+        chunks = _apply_overlap_to_chunks(chunks, sentence_groups, chunk_overlap, chunk_size)
 
-    avg_chunk_size = int(np.mean([len(c.content) for c in chunks])) if chunks else 0
+    # Average size of the semantic groups (before overlap), from the running total
+    avg_chunk_size = total_len // len(chunks) if chunks else 0
     logger.info(
         "semantic_chunking_complete",
         chunks=len(chunks),
@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-import re
+from typing import Iterator
 
 from rag.chunking.chunk import Chunk
 
@@ -23,42 +23,43 @@ SEPARATORS = [
 ]
 
 
-def _find_split_point(text: str, max_size: int) -> int:
+def _find_split_point(text: str, start: int, max_size: int) -> int:
     """최적의 분할 지점 찾기
     
     우선순위에 따라 구분자를 찾아 분할 지점 결정.
+    남은 텍스트를 복사하지 않고 원본에서 start 위치부터 탐색합니다.
     
     Args:
-        text: 분할할 텍스트
+        text: 원본 텍스트
+        start: 탐색 시작 위치
         max_size: 최대 크기
         
     Returns:
-        분할 지점 인덱스
+        start 기준 분할 지점 오프셋
     """
-    if len(text) <= max_size:
-        return len(text)
+    if len(text) - start <= max_size:
+        return len(text) - start
     
     # 각 구분자에 대해 max_size 이하에서 가장 마지막 위치 찾기
+    end = start + max_size
     for sep in SEPARATORS:
-        # max_size 범위 내에서 구분자의 마지막 위치 찾기
-        search_area = text[:max_size]
-        pos = search_area.rfind(sep)
+        pos = text.rfind(sep, start, end)
         
-        if pos > 0:
+        if pos > start:
             # 구분자 포함하여 분할 (문장 부호는 앞 청크에 포함)
-            return pos + len(sep)
+            return pos - start + len(sep)
     
     # 구분자를 찾지 못하면 강제 분할
     return max_size
 
 
-def split_text(
+def iter_split_text(
     text: str,
     chunk_size: int = 1000,
     chunk_overlap: int = 150,
     source: str = "",
-) -> list[Chunk]:
-    """텍스트를 청크로 분할
+) -> Iterator[Chunk]:
+    """텍스트를 청크로 분할하며 순차 생성
     
     Args:
         text: 분할할 텍스트
@@ -66,43 +67,57 @@ def split_text(
         chunk_overlap: 오버랩 크기
         source: 원본 문서 경로 (메타데이터용)
         
-    Returns:
-        Chunk 리스트
+    Yields:
+        Chunk (chunk_index는 이 텍스트 내 순번)
     """
     if not text or not text.strip():
-        return []
+        return
     
-    chunks: list[Chunk] = []
+    text_len = len(text)
     start = 0
     chunk_index = 0
     
-    while start < len(text):
-        # 남은 텍스트
-        remaining = text[start:]
-        
+    while start < text_len:
         # 분할 지점 찾기
-        split_point = _find_split_point(remaining, chunk_size)
+        split_point = _find_split_point(text, start, chunk_size)
         
         # 청크 내용 추출
-        chunk_content = remaining[:split_point].strip()
+        chunk_content = text[start:start + split_point].strip()
         
         if chunk_content:  # 빈 청크 제외
-            chunk = Chunk.create(
+            yield Chunk.create(
                 content=chunk_content,
                 source=source,
                 chunk_index=chunk_index,
                 start_char=start,
                 end_char=start + split_point,
             )
-            chunks.append(chunk)
             chunk_index += 1
         
         # 다음 시작점 (오버랩 적용)
-        if start + split_point >= len(text):
+        if start + split_point >= text_len:
             break
         
         # 오버랩을 적용하되, 최소한 1자는 진행
         next_start = start + split_point - chunk_overlap
         start = max(next_start, start + 1)
+
+
+def split_text(
+    text: str,
+    chunk_size: int = 1000,
+    chunk_overlap: int = 150,
+    source: str = "",
+) -> list[Chunk]:
+    """텍스트를 청크로 분할
     
-    return chunks
+    Args:
+        text: 분할할 텍스트
+        chunk_size: 목표 청크 크기 (자)
+        chunk_overlap: 오버랩 크기
+        source: 원본 문서 경로 (메타데이터용)
+        
+    Returns:
+        Chunk 리스트
+    """
+    return list(iter_split_text(text, chunk_size, chunk_overlap, source))
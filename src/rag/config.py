@@ -45,16 +45,42 @@ class QdrantConfig(BaseModel):
     """Qdrant 서버 설정"""
     host: str = Field(default_factory=lambda: os.getenv("QDRANT_HOST", "localhost"))
     port: int = Field(default_factory=lambda: int(os.getenv("QDRANT_PORT", "6333")))
+    # gRPC 전송 (벡터를 JSON 텍스트 대신 protobuf 바이너리로 전송)
+    grpc_port: int = Field(default_factory=lambda: int(os.getenv("QDRANT_GRPC_PORT", "6334")))
+    prefer_grpc: bool = True
     collection: str = "terminal-rag"
+    # 동시에 업로드할 배치 수 (서버 부하에 맞춰 조정)
+    upload_concurrency: int = Field(default=4, ge=1)
+
+
+class HNSWConfig(BaseModel):
+    """FAISS HNSW 인덱스 설정"""
+    m: int = Field(default=32, ge=4, le=128)  # 노드당 이웃 수
+    ef_construction: int = Field(default=200, ge=8)
+    ef_search: int = Field(default=64, ge=8)
 
 
 class EmbeddingConfig(BaseModel):
     """임베딩 설정"""
     # model: str = "text-embedding-3-small"
     model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    # 임베딩 벡터는 float32 [N, dimension] (청킹/검색 경로 모두 float32 기준)
     dimension: int = 384
     batch_size: int = Field(default=100, ge=1)
+    # 추론 백엔드 (onnx-int8: ONNX Runtime 동적 int8 양자화, CPU 처리량 2~4배)
+    backend: Literal["torch", "onnx-int8"] = "torch"
+    # onnx-int8 변환 모델 저장 위치 (최초 1회 변환 후 재사용)
+    onnx_dir: str = "data/onnx"
+    # CPU 대량 임베딩 시 사용할 프로세스 수 (0이면 비활성화, 프로세스마다 모델을 별도 로드)
+    multi_process_workers: int = Field(default=0, ge=0)
+    # 임베딩 캐시 파일 (인덱스 초기화와 무관하게 유지되도록 인덱스 디렉토리 밖에 둠, 빈 값이면 비활성화)
+    cache_path: str | None = "data/embed_cache.sqlite"
     store_type: Literal["faiss", "qdrant"] = "faiss"
+    # 벡터 양자화 (int8: 메모리/검색 대역폭 1/4, FAISS 전용 / fp16: 1/2, Qdrant는 새 컬렉션에 적용)
+    quantization: Literal["none", "int8", "fp16"] = "none"
+    # FAISS 인덱스 구조 (flat: 전수 탐색 O(N) / hnsw: 근사 탐색 O(log N))
+    index_type: Literal["flat", "hnsw"] = "flat"
+    hnsw: HNSWConfig = Field(default_factory=HNSWConfig)
     qdrant: QdrantConfig = Field(default_factory=QdrantConfig)
 
 
@@ -69,6 +95,8 @@ class RetrievalConfig(BaseModel):
     # Reranker 설정
     use_reranker: bool = False
     reranker_model: str = "BAAI/bge-reranker-v2-m3"
+    # cross_encoder: sentence-transformers(torch) / flashrank: ONNX Runtime (torch 불필요)
+    reranker_backend: Literal["cross_encoder", "flashrank"] = "cross_encoder"
 
 
 
@@ -78,6 +106,9 @@ class OllamaConfig(BaseModel):
     # 실운영 환경에서는 반드시 환경변수로 주입받아야 함
     base_url: str | None = Field(default_factory=lambda: os.getenv("OLLAMA_BASE_URL"))
     model: str | None = Field(default_factory=lambda: os.getenv("OLLAMA_MODEL"))
+    # 프롬프트 접두어 KV 캐시 유지: 모델이 언로드되거나 num_ctx가 바뀌면 캐시가 사라짐
+    keep_alive: str = "30m"
+    num_ctx: int | None = None
 
 
 class GenerationConfig(BaseModel):
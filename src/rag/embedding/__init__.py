@@ -6,7 +6,8 @@
 from typing import TYPE_CHECKING
 
 from rag.embedding.base import VectorStoreBase
-from rag.embedding.embedder import Embedder
+from rag.embedding.cache import CachedEmbedder
+from rag.embedding.embedder import Embedder, get_embedder
 from rag.embedding.faiss_store import FAISSStore
 
 if TYPE_CHECKING:
@@ -32,11 +33,23 @@ def get_vector_store(config: "Config") -> VectorStoreBase:
             dimension=dimension,
             host=qdrant_config.host,
             port=qdrant_config.port,
+            grpc_port=qdrant_config.grpc_port,
+            prefer_grpc=qdrant_config.prefer_grpc,
             collection_name=qdrant_config.collection,
+            quantization=config.embedding.quantization,
+            upload_concurrency=qdrant_config.upload_concurrency,
         )
     else:
         # 기본값: FAISS
-        return FAISSStore(dimension=dimension)
+        hnsw_config = config.embedding.hnsw
+        return FAISSStore(
+            dimension=dimension,
+            quantization=config.embedding.quantization,
+            index_type=config.embedding.index_type,
+            hnsw_m=hnsw_config.m,
+            hnsw_ef_construction=hnsw_config.ef_construction,
+            hnsw_ef_search=hnsw_config.ef_search,
+        )
 
 
 # 하위 호환성을 위한 별칭
@@ -44,9 +57,11 @@ VectorStore = FAISSStore
 
 
 __all__ = [
+    "CachedEmbedder",
     "Embedder",
     "FAISSStore",
     "VectorStore",
     "VectorStoreBase",
+    "get_embedder",
     "get_vector_store",
 ]
@@ -30,13 +30,14 @@ class VectorStoreBase(ABC):
     
     @abstractmethod
     def search(
-        self, query_embedding: np.ndarray, top_k: int = 5
+        self, query_embedding: np.ndarray, top_k: int = 5, user_id: str | None = None
     ) -> list[tuple["Chunk", float]]:
         """유사한 청크 검색
         
         Args:
             query_embedding: 쿼리 벡터 (numpy array, shape=[1, dim])
             top_k: 반환할 청크 수
+            user_id: 사용자 ID (None이면 필터 없음)
             
         Returns:
             (청크, 점수) 튜플 리스트
@@ -49,8 +50,13 @@ class VectorStoreBase(ABC):
         ...
     
     @abstractmethod
-    def load(self, path: str) -> None:
-        """인덱스와 메타데이터 로드"""
+    def load(self, path: str, mmap: bool = False) -> None:
+        """인덱스와 메타데이터 로드
+        
+        Args:
+            path: 저장된 디렉토리 경로
+            mmap: 읽기 전용 메모리 매핑 로드 (지원하지 않는 저장소는 무시)
+        """
         ...
     
     @property
@@ -0,0 +1,161 @@
+"""임베딩 캐시 모듈
+
+동일한 모델/텍스트의 임베딩을 메모리(LRU)와 디스크(SQLite)에 캐싱합니다.
+재인덱싱 시 내용이 바뀌지 않은 청크와 반복 쿼리는 모델 추론 없이 조회만으로 처리됩니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from rag.embedding.embedder import Embedder
+from rag.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# SQLite 바인딩 변수 개수 제한 대응 (IN 절 분할 크기)
+_SQL_BATCH = 500
+
+# 캐시 벡터 저장 타입 (단위 벡터는 float16 반올림 오차가 검색 순위에 영향이 없고 크기는 절반)
+CACHE_DTYPE = np.float16
+
+
+class CachedEmbedder:
+    """임베딩 캐시를 적용한 Embedder 래퍼
+
+    캐시 키는 (모델명, 텍스트)의 SHA-256 해시이며, 값은 float16 벡터 바이트입니다.
+    캐시 적중 여부와 관계없이 같은 결과를 반환하도록 새로 임베딩한 벡터도
+    float16으로 반올림한 값(float32)을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        cache_path: Path | str | None = None,
+        max_memory_items: int = 10_000,
+    ):
+        """
+        Args:
+            embedder: 실제 임베딩을 수행할 Embedder
+            cache_path: SQLite 캐시 파일 경로 (None이면 메모리 캐시만 사용)
+            max_memory_items: 메모리 LRU 캐시 최대 항목 수
+        """
+        self.embedder = embedder
+        self.max_memory_items = max_memory_items
+        backend = getattr(embedder, "backend", "torch")
+        self._namespace = self.model_name if backend == "torch" else f"{self.model_name}\0{backend}"
+        self._memory: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+        if cache_path is not None:
+            path = Path(cache_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings_f16 (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def model_name(self) -> str:
+        return self.embedder.model_name
+
+    def _make_key(self, text: str) -> bytes:
+        """캐시 키 생성 (int8 등 다른 백엔드의 벡터는 별도 키)"""
+        return hashlib.sha256(f"{self._namespace}\0{text}".encode("utf-8")).digest()
+
+    def _get_many(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """메모리 → 디스크 순으로 캐시 조회 (적중한 키만 반환)"""
+        found: dict[bytes, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+
+            if self._db is None:
+                return found
+
+            missing = list({key for key in keys if key not in found})
+            for start in range(0, len(missing), _SQL_BATCH):
+                batch = missing[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings_f16 WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=CACHE_DTYPE).astype(np.float32)
+                    self._remember(key, vector)
+                    found[key] = vector
+        return found
+
+    def _put_many(self, items: list[tuple[bytes, np.ndarray]]) -> None:
+        """메모리와 디스크에 캐시 저장"""
+        with self._lock:
+            for key, vector in items:
+                self._remember(key, vector)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings_f16 (key, vector) VALUES (?, ?)",
+                    [(key, vector.astype(CACHE_DTYPE).tobytes()) for key, vector in items],
+                )
+                self._db.commit()
+
+    def _remember(self, key: bytes, vector: np.ndarray) -> None:
+        """메모리 LRU에 저장 (호출자가 lock 보유)"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def embed(self, texts: list[str], batch_size: int | None = None) -> np.ndarray:
+        """텍스트 리스트를 벡터로 변환 (캐시 미스만 모델로 임베딩)
+
+        Args:
+            texts: 텍스트 리스트
+            batch_size: 모델 배치 크기 (None이면 설정 파일값 사용)
+
+        Returns:
+            L2 정규화된 임베딩 벡터 (numpy array, float32, shape=[N, dim])
+        """
+        if not texts:
+            return np.array([])
+
+        keys = [self._make_key(text) for text in texts]
+        vectors = self._get_many(keys)
+
+        # 배치 내 중복 텍스트는 한 번만 임베딩
+        miss_texts: dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors and key not in miss_texts:
+                miss_texts[key] = text
+
+        if miss_texts:
+            embeddings = self.embedder.embed(list(miss_texts.values()), batch_size=batch_size)
+            rounded = np.asarray(embeddings, dtype=CACHE_DTYPE).astype(np.float32)
+            new_items = list(zip(miss_texts, rounded))
+            self._put_many(new_items)
+            vectors.update(new_items)
+
+        logger.debug("embedding_cache_lookup", total=len(texts), misses=len(miss_texts))
+
+        return np.stack([vectors[key] for key in keys])
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """쿼리를 벡터로 변환
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            임베딩 벡터 (numpy array, shape=[1, dim])
+        """
+        return self.embed([query])
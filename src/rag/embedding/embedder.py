@@ -5,8 +5,11 @@ SentenceTransformers를 사용하여 텍스트를 벡터로 변환합니다.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from pathlib import Path
+
+import faiss
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from rag.config import get_config
 from rag.logger import get_logger
@@ -14,38 +17,70 @@ from rag.logger import get_logger
 
 logger = get_logger(__name__)
 
+# onnx-int8 백엔드의 동적 양자화 설정 (VNNI int8 내적 커널 사용, 미지원 CPU도 실행 가능)
+ONNX_QUANTIZATION = "avx512_vnni"
+ONNX_INT8_FILE = f"onnx/model_qint8_{ONNX_QUANTIZATION}.onnx"
+
+# 이 개수 이상의 텍스트부터 멀티프로세스 풀 사용 (작은 입력은 프로세스 간 전송 비용이 더 큼)
+MULTI_PROCESS_MIN_TEXTS = 1024
+
 
 class Embedder:
     """텍스트 임베딩 생성기"""
     
-    def __init__(self, model_name: str | None = None):
+    def __init__(self, model_name: str | None = None, backend: str | None = None):
         """
         Args:
             model_name: 사용할 모델명. None이면 설정 파일값 사용.
+            backend: 추론 백엔드 ("torch" | "onnx-int8"). None이면 설정 파일값 사용.
         """
         config = get_config()
         self.model_name = model_name or config.embedding.model
+        self.backend = backend or config.embedding.backend
+        
+        logger.info("loading_embedding_model", model=self.model_name, backend=self.backend)
+        if self.backend == "onnx-int8":
+            self.model = _load_onnx_int8_model(self.model_name, Path(config.embedding.onnx_dir))
+        else:
+            # torch 임포트 비용(수 초)은 모델이 실제로 필요할 때만 지불
+            from sentence_transformers import SentenceTransformer
+            # device 미지정 시 CUDA/MPS가 있으면 자동 선택됨
+            self.model = SentenceTransformer(self.model_name)
+            if self.model.device.type == "cuda":
+                # Tensor Core fp16 연산 (출력은 embed에서 float32로 변환 후 정규화)
+                self.model.half()
         
-        logger.info("loading_embedding_model", model=self.model_name)
-        self.model = SentenceTransformer(self.model_name)
+        logger.info("embedding_model_loaded", device=str(getattr(self.model, "device", "cpu")))
+        
+        # CPU 멀티프로세스 인코딩 풀 (대량 입력 시 최초 1회 생성)
+        self.multi_process_workers = (
+            config.embedding.multi_process_workers if self.backend == "torch" else 0
+        )
+        self._pool: dict | None = None
         
         # CPU 사용 시 intra-op parallelism 제한 (선택사항)
         # torch.set_num_threads(4)
         
-    def embed(self, texts: list[str]) -> np.ndarray:
+    def embed(self, texts: list[str], batch_size: int | None = None) -> np.ndarray:
         """텍스트 리스트를 벡터로 변환
         
+        SentenceTransformer.encode가 내부적으로 길이순 정렬 후 배치를 구성하므로,
+        가능한 한 많은 텍스트를 한 번에 넘길수록 패딩 낭비가 줄어듭니다.
+        
         Args:
             texts: 텍스트 리스트
+            batch_size: 모델 배치 크기 (None이면 설정 파일값 사용)
             
         Returns:
-            임베딩 벡터 (numpy array, shape=[N, dim])
+            L2 정규화된 임베딩 벡터 (C-연속 numpy array, float32, shape=[N, dim]).
+            정규화는 전체 행렬에 대해 faiss.normalize_L2로 한 번에 수행되므로
+            호출 측(벡터 저장소 등)에서 다시 정규화하거나 복사할 필요가 없습니다.
         """
         if not texts:
             return np.array([])
         
-        config = get_config()
-        batch_size = config.embedding.batch_size
+        if batch_size is None:
+            batch_size = get_config().embedding.batch_size
         
         logger.debug("embedding_texts", count=len(texts), batch_size=batch_size)
         
@@ -54,11 +89,41 @@ class Embedder:
             batch_size=batch_size,
             show_progress_bar=False,
             convert_to_numpy=True,
-            normalize_embeddings=True,  # 코사인 유사도를 위해 정규화
+            pool=self._get_pool(len(texts)),
         )
         
+        # 코사인 유사도를 위해 정규화 (배치별 torch 연산 대신 전체 행렬을 C 커널로 한 번에)
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        faiss.normalize_L2(embeddings)
         return embeddings
     
+    def _get_pool(self, count: int) -> dict | None:
+        """대량 CPU 인코딩용 멀티프로세스 풀 반환 (사용하지 않으면 None)"""
+        if (
+            self.multi_process_workers < 2
+            or count < MULTI_PROCESS_MIN_TEXTS
+            or self.model.device.type != "cpu"
+        ):
+            return None
+        if self._pool is None:
+            logger.info("starting_embedding_pool", workers=self.multi_process_workers)
+            self._pool = self.model.start_multi_process_pool(
+                ["cpu"] * self.multi_process_workers
+            )
+        return self._pool
+    
+    def close(self) -> None:
+        """멀티프로세스 풀 종료"""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def embed_query(self, query: str) -> np.ndarray:
         """쿼리를 벡터로 변환
         
@@ -69,3 +134,62 @@ class Embedder:
             임베딩 벡터 (numpy array, shape=[1, dim])
         """
         return self.embed([query])
+
+
+def _load_onnx_int8_model(model_name: str, onnx_dir: Path):
+    """int8 양자화 ONNX 모델 로딩 (없으면 한 번 변환하여 저장)
+    
+    Args:
+        model_name: SentenceTransformer 모델명
+        onnx_dir: 변환 모델 저장 디렉토리
+        
+    Returns:
+        ONNX 백엔드 SentenceTransformer (encode 인터페이스 동일)
+    """
+    from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+    
+    local_dir = onnx_dir / model_name.replace("/", "__")
+    if not (local_dir / ONNX_INT8_FILE).exists():
+        logger.info("exporting_onnx_int8_model", model=model_name, path=str(local_dir))
+        model = SentenceTransformer(model_name, backend="onnx")
+        model.save(str(local_dir))
+        export_dynamic_quantized_onnx_model(model, ONNX_QUANTIZATION, str(local_dir))
+    
+    return SentenceTransformer(
+        str(local_dir),
+        backend="onnx",
+        model_kwargs={"file_name": ONNX_INT8_FILE},
+    )
+
+
+def get_embedder(model_name: str | None = None, use_cache: bool = False) -> Embedder:
+    """모델별 Embedder 싱글톤 반환
+    
+    SentenceTransformer 모델 로딩은 수 초가 걸리므로, 같은 프로세스
+    (API 서버, 반복 호출 등)에서는 로드된 인스턴스를 재사용합니다.
+    
+    Args:
+        model_name: 사용할 모델명. None이면 설정 파일값 사용.
+        use_cache: True이면 임베딩 캐시(CachedEmbedder)로 감싸서 반환
+            (설정의 embedding.cache_path가 비어 있으면 메모리 LRU 캐시만 사용하여
+            반복 쿼리는 디스크 없이도 모델 추론을 건너뜀)
+        
+    Returns:
+        Embedder 인스턴스 (또는 동일 인터페이스의 CachedEmbedder)
+    """
+    config = get_config()
+    name = model_name or config.embedding.model
+    if use_cache:
+        return _load_cached_embedder(name, config.embedding.cache_path or None)
+    return _load_embedder(name)
+
+
+@lru_cache(maxsize=4)
+def _load_embedder(model_name: str) -> Embedder:
+    return Embedder(model_name)
+
+
+@lru_cache(maxsize=4)
+def _load_cached_embedder(model_name: str, cache_path: str | None) -> Embedder:
+    from rag.embedding.cache import CachedEmbedder
+    return CachedEmbedder(_load_embedder(model_name), cache_path=cache_path)
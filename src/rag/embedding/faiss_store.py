@@ -6,7 +6,9 @@
 from __future__ import annotations
 
 import json
+import os
 import pickle
+from collections.abc import Sequence
 from pathlib import Path
 
 import faiss
@@ -19,19 +21,227 @@ from rag.logger import get_logger
 
 logger = get_logger(__name__)
 
+# SIMD 내적 커널 (선택적 의존성)
+try:
+    import simsimd
+    HAS_SIMSIMD = True
+except ImportError:
+    HAS_SIMSIMD = False
+
+# 청크 컬럼 저장소 (선택적 의존성, 없으면 pickle 사용)
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 이 행 수 이하이고 SimSIMD가 있으면 FAISS 대신 프로세스 내 정확 검색 사용
+# (작은 행렬에서는 인덱스 호출 비용이 큼, 벡터 버퍼를 그대로 쓸 수 있는 Flat 인덱스만 해당)
+SIMD_SEARCH_MAX_ROWS = 10_000
+
+# 학습이 필요한 양자화(int8)는 이 수 이상의 벡터가 모일 때까지 float32로 보관 후
+# 모인 벡터 전체로 값 범위를 학습 (작은 첫 배치로 학습하면 재현율이 크게 떨어짐)
+SQ_TRAIN_MIN_VECTORS = 1000
+
+CHUNKS_PICKLE_FILE = "chunks.pkl"
+CHUNKS_ARROW_FILE = "chunks.arrow"
+
+
+def inner_product_scores(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """쿼리 벡터와 행렬 각 행의 내적 점수 계산
+    
+    SimSIMD가 설치되어 있으면 AVX-512/NEON 커널을, 없으면 NumPy(BLAS) 행렬곱을 사용합니다.
+    정규화된 벡터라면 내적이 곧 코사인 유사도입니다.
+    
+    Args:
+        query: 쿼리 벡터 (shape=[dim] 또는 [1, dim])
+        matrix: 후보 벡터 행렬 (shape=[N, dim], float32)
+        
+    Returns:
+        점수 배열 (shape=[N])
+    """
+    query = np.ascontiguousarray(query, dtype=np.float32).reshape(1, -1)
+    if HAS_SIMSIMD:
+        return np.asarray(simsimd.cdist(query, matrix, metric="dot"), dtype=np.float32)[0]
+    return matrix @ query[0]
+
+
+# 양자화 방식별 스칼라 양자화 타입
+_SQ_TYPES = {
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+}
+
+# 값 범위 학습이 필요한 양자화 방식
+_TRAINED_QUANTIZATIONS = {"int8"}
+
+
+def _create_index(
+    dimension: int,
+    quantization: str = "none",
+    index_type: str = "flat",
+    hnsw_m: int = 32,
+    hnsw_ef_construction: int = 200,
+    hnsw_ef_search: int = 64,
+) -> faiss.Index:
+    """양자화/인덱스 구조 설정에 맞는 내적(IP) 인덱스 생성
+    
+    Args:
+        dimension: 벡터 차원
+        quantization: "none" (float32), "int8" (차원별 8bit 스칼라 양자화)
+            또는 "fp16" (반정밀도, 학습 불필요)
+        index_type: "flat" (전수 탐색) 또는 "hnsw" (그래프 기반 근사 탐색)
+        hnsw_m: HNSW 노드당 이웃 수
+        hnsw_ef_construction: HNSW 구축 시 탐색 폭
+        hnsw_ef_search: HNSW 검색 시 탐색 폭 (클수록 재현율↑, 속도↓)
+        
+    Returns:
+        FAISS 인덱스
+    """
+    sq_type = _SQ_TYPES.get(quantization)
+    if index_type == "hnsw":
+        if sq_type is not None:
+            index = faiss.IndexHNSWSQ(dimension, sq_type, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexHNSWFlat(dimension, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = hnsw_ef_construction
+        index.hnsw.efSearch = hnsw_ef_search
+        return index
+    
+    if sq_type is not None:
+        index = faiss.IndexScalarQuantizer(dimension, sq_type, faiss.METRIC_INNER_PRODUCT)
+        if quantization == "int8":
+            # 학습 표본의 min/max 범위에 여유를 두어 이후 추가분의 클리핑 완화
+            index.sq.rangestat_arg = 0.1
+        return index
+    # 코사인 유사도(정규화된 벡터의 내적)를 위한 IndexFlatIP 사용
+    return faiss.IndexFlatIP(dimension)
+
+
+class ArrowChunks(Sequence):
+    """Arrow IPC 파일에 저장된 청크 목록 (읽기 전용, 행 단위 지연 복원)
+    
+    파일을 메모리 매핑하므로 로드 시 전체 청크를 역직렬화하지 않고,
+    검색 결과로 접근한 행만 Chunk 객체로 만듭니다.
+    """
+    
+    def __init__(self, table: "pa.Table"):
+        self._content = table.column("content")
+        self._metadata = table.column("metadata")
+        self._user_id = table.column("user_id")
+    
+    @classmethod
+    def open(cls, path: Path) -> ArrowChunks:
+        """Arrow IPC 파일을 메모리 매핑하여 열기"""
+        # 테이블 버퍼가 매핑을 참조하므로 파일을 닫지 않고 GC에 맡김
+        source = pa.memory_map(str(path), "r")
+        return cls(pa.ipc.open_file(source).read_all())
+    
+    @staticmethod
+    def write(chunks: Sequence[Chunk], path: Path) -> None:
+        """청크 목록을 Arrow IPC 파일로 저장
+        
+        기존 파일이 메모리 매핑되어 있을 수 있으므로 임시 파일에 쓴 뒤 교체합니다.
+        """
+        table = pa.table({
+            "content": pa.array([c.content for c in chunks], type=pa.string()),
+            "metadata": pa.array(
+                [json.dumps(c.metadata, ensure_ascii=False, default=str) for c in chunks],
+                type=pa.string(),
+            ),
+            "user_id": pa.array(
+                [c.metadata.get("user_id") or "" for c in chunks], type=pa.string()
+            ),
+        })
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+    
+    def __len__(self) -> int:
+        return len(self._content)
+    
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = int(idx)
+        return Chunk(
+            content=self._content[idx].as_py(),
+            metadata=json.loads(self._metadata[idx].as_py()),
+        )
+    
+    def user_ids(self) -> list[str]:
+        """행별 사용자 ID (청크를 복원하지 않고 컬럼만 읽음)"""
+        return self._user_id.to_pylist()
+
 
 class FAISSStore(VectorStoreBase):
     """FAISS 기반 벡터 저장소"""
     
-    def __init__(self, dimension: int):
+    def __init__(
+        self,
+        dimension: int,
+        quantization: str = "none",
+        index_type: str = "flat",
+        hnsw_m: int = 32,
+        hnsw_ef_construction: int = 200,
+        hnsw_ef_search: int = 64,
+    ):
         """
         Args:
             dimension: 벡터 차원
+            quantization: 벡터 양자화 방식 ("none", "int8" 또는 "fp16")
+            index_type: 인덱스 구조 ("flat" 또는 "hnsw")
+            hnsw_m: HNSW 노드당 이웃 수
+            hnsw_ef_construction: HNSW 구축 시 탐색 폭
+            hnsw_ef_search: HNSW 검색 시 탐색 폭
         """
         self.dimension = dimension
-        # 코사인 유사도(정규화된 벡터의 내적)를 위한 IndexFlatIP 사용
-        self.index = faiss.IndexFlatIP(dimension)
-        self.chunks: list[Chunk] = []
+        self.quantization = quantization
+        self.index_type = index_type
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
+        self.index = self._empty_index()
+        # mmap 로드된 인덱스는 벡터 버퍼가 파일에 매핑되어 추가 불가
+        self.read_only = False
+        # Arrow 파일에서 로드하면 지연 복원되는 ArrowChunks
+        self.chunks: list[Chunk] | ArrowChunks = []
+        # 필터 검색용 캐시 (add/load/clear 시 무효화)
+        self._rows_by_user: dict[str, np.ndarray] | None = None
+    
+    def _new_index(self, quantization: str | None = None) -> faiss.Index:
+        """현재 설정으로 빈 인덱스 생성 (quantization이 주어지면 해당 방식 사용)"""
+        return _create_index(
+            self.dimension,
+            quantization or self.quantization,
+            self.index_type,
+            self.hnsw_m,
+            self.hnsw_ef_construction,
+            self.hnsw_ef_search,
+        )
+    
+    def _empty_index(self) -> faiss.Index:
+        """빈 인덱스 생성 (학습이 필요한 양자화는 표본이 모일 때까지 float32 인덱스)"""
+        if self.quantization in _TRAINED_QUANTIZATIONS:
+            return self._new_index("none")
+        return self._new_index()
+    
+    def _is_staged(self) -> bool:
+        """양자화 학습 전이라 float32 인덱스에 벡터를 모으는 중인지 여부"""
+        return self.quantization in _TRAINED_QUANTIZATIONS and not isinstance(
+            self.index, (faiss.IndexScalarQuantizer, faiss.IndexHNSWSQ)
+        )
+    
+    def _quantize(self) -> None:
+        """모인 float32 벡터 전체로 양자화 인덱스를 학습하고 옮겨 담음"""
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        index = self._new_index()
+        index.train(vectors)
+        index.add(vectors)
+        self.index = index
+        logger.info("index_trained", quantization=self.quantization, count=len(vectors))
         
     def add(self, chunks: list[Chunk], embeddings: np.ndarray) -> None:
         """청크와 임베딩 추가
@@ -47,6 +257,9 @@ class FAISSStore(VectorStoreBase):
         
         if len(chunks) == 0:
             return
+        
+        if self.read_only:
+            raise RuntimeError("Index was loaded with mmap=True (read-only); reload without mmap to add chunks")
             
         # 차원 확인
         if embeddings.shape[1] != self.dimension:
@@ -54,8 +267,16 @@ class FAISSStore(VectorStoreBase):
                 f"Embedding dimension ({embeddings.shape[1]}) does not match index dimension ({self.dimension})"
             )
             
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        
         self.index.add(embeddings)
+        # 학습이 필요한 양자화는 충분한 표본이 모인 시점에 한 번만 학습
+        if self._is_staged() and self.index.ntotal >= SQ_TRAIN_MIN_VECTORS:
+            self._quantize()
+        if isinstance(self.chunks, ArrowChunks):
+            self.chunks = list(self.chunks)
         self.chunks.extend(chunks)
+        self._invalidate_cache()
         
         logger.info(
             "chunks_added_to_index",
@@ -63,36 +284,108 @@ class FAISSStore(VectorStoreBase):
             total_chunks=len(self.chunks),
         )
         
-    def search(self, query_embedding: np.ndarray, top_k: int = 5) -> list[tuple[Chunk, float]]:
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        user_id: str | None = None,
+    ) -> list[tuple[Chunk, float]]:
         """유사한 청크 검색
         
         Args:
             query_embedding: 쿼리 벡터 (numpy array, shape=[1, dim])
             top_k: 반환할 청크 수
+            user_id: 사용자 ID (None이면 필터 없음)
             
         Returns:
             (청크, 점수) 튜플 리스트
         """
         if len(self.chunks) == 0:
             return []
-            
-        # 검색
-        scores, indices = self.index.search(query_embedding, top_k)
         
-        results: list[tuple[Chunk, float]] = []
+        rows = None
+        if user_id:
+            rows = self._get_user_rows(user_id)
+            if len(rows) == 0:
+                return []
+        elif HAS_SIMSIMD and len(self.chunks) <= SIMD_SEARCH_MAX_ROWS:
+            vectors = self._flat_vectors()
+            if vectors is not None:
+                return self._search_vectors(query_embedding, top_k, vectors)
+        
+        # 사용자 필터는 전체 검색 후 거르면 상위 결과가 다른 사용자 청크로 채워질 수 있으므로
+        # IDSelector로 해당 사용자의 행만 FAISS 안에서 탐색 (벡터 복사 없음)
+        selector = faiss.IDSelectorBatch(rows) if rows is not None else None
+        
+        # 검색 (HNSW는 top_k가 efSearch보다 크면 후보가 모자라 재현율이 떨어지므로
+        # 요청마다 탐색 폭을 보정, 공유 인덱스 상태는 바꾸지 않고 파라미터로 전달)
+        params = None
+        if self.index_type == "hnsw":
+            params = faiss.SearchParametersHNSW(
+                sel=selector, efSearch=max(self.hnsw_ef_search, top_k * 4)
+            )
+        elif selector is not None:
+            params = faiss.SearchParameters(sel=selector)
+        scores, indices = self.index.search(query_embedding, top_k, params=params)
         
         # 1차원이 아닌 2차원 배열로 반환됨 (쿼리가 하나여도)
-        query_scores = scores[0]
+        # 결과 부족시 -1이 채워지므로 마스크로 한 번에 제거
         query_indices = indices[0]
+        valid = query_indices != -1
+        return [
+            (self.chunks[idx], score)
+            for idx, score in zip(query_indices[valid].tolist(), scores[0][valid].tolist())
+        ]
+    
+    def _search_vectors(
+        self, query_embedding: np.ndarray, top_k: int, vectors: np.ndarray
+    ) -> list[tuple[Chunk, float]]:
+        """벡터 행렬에 대한 프로세스 내 정확 검색 (SIMD 내적)
         
-        for score, idx in zip(query_scores, query_indices):
-            if idx == -1:  # 결과 부족시 -1 반환됨
-                continue
-            
-            chunk = self.chunks[idx]
-            results.append((chunk, float(score)))
-            
-        return results
+        Args:
+            query_embedding: 쿼리 벡터
+            top_k: 반환할 청크 수
+            vectors: 인덱스 행 순서의 벡터 행렬 (shape=[N, dim])
+        """
+        scores = inner_product_scores(query_embedding, vectors)
+        
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        
+        return [(self.chunks[i], float(scores[i])) for i in top]
+    
+    def _flat_vectors(self) -> np.ndarray | None:
+        """비양자화 Flat 인덱스의 벡터 버퍼를 복사 없이 행렬로 반환
+        
+        양자화/HNSW 인덱스는 float32 행렬을 만들려면 전체를 복원해야 하므로 None을 반환합니다.
+        반환값은 인덱스 내부 버퍼(mmap 로드 시 매핑된 파일)를 가리키므로
+        add/load/clear 이후에는 사용하지 않습니다.
+        """
+        if not isinstance(self.index, faiss.IndexFlat):
+            return None
+        ntotal, dimension = self.index.ntotal, self.index.d
+        return faiss.rev_swig_ptr(self.index.get_xb(), ntotal * dimension).reshape(ntotal, dimension)
+    
+    def _get_user_rows(self, user_id: str) -> np.ndarray:
+        """사용자 ID별 행 번호 반환 (지연 구축 후 캐싱)"""
+        if self._rows_by_user is None:
+            if isinstance(self.chunks, ArrowChunks):
+                owners = self.chunks.user_ids()
+            else:
+                owners = [chunk.metadata.get("user_id") for chunk in self.chunks]
+            rows_by_user: dict[str, list[int]] = {}
+            for row, owner in enumerate(owners):
+                if owner:
+                    rows_by_user.setdefault(owner, []).append(row)
+            self._rows_by_user = {
+                owner: np.array(rows, dtype=np.int64) for owner, rows in rows_by_user.items()
+            }
+        return self._rows_by_user.get(user_id, np.empty(0, dtype=np.int64))
+    
+    def _invalidate_cache(self) -> None:
+        """필터 검색용 캐시 무효화"""
+        self._rows_by_user = None
     
     def save(self, path: str | Path) -> None:
         """인덱스와 메타데이터 저장
@@ -107,23 +400,39 @@ class FAISSStore(VectorStoreBase):
         index_path = path / "faiss.index"
         faiss.write_index(self.index, str(index_path))
         
-        # 청크 데이터(메타데이터) 저장
-        chunks_path = path / "chunks.pkl"
-        with open(chunks_path, "wb") as f:
-            pickle.dump(self.chunks, f)
+        # 청크 데이터(메타데이터) 저장 (pyarrow가 있으면 컬럼 파일, 없으면 pickle)
+        if HAS_PYARROW:
+            ArrowChunks.write(self.chunks, path / CHUNKS_ARROW_FILE)
+            stale_path = path / CHUNKS_PICKLE_FILE
+        else:
+            with open(path / CHUNKS_PICKLE_FILE, "wb") as f:
+                pickle.dump(list(self.chunks), f)
+            stale_path = path / CHUNKS_ARROW_FILE
+        # 이전 형식 파일이 남아 있으면 로드 시 오래된 청크를 읽을 수 있으므로 제거
+        stale_path.unlink(missing_ok=True)
             
         # 설정 저장 (차원 정보)
         meta_path = path / "meta.json"
         with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump({"dimension": self.dimension, "store_type": "faiss"}, f)
+            json.dump(
+                {
+                    "dimension": self.dimension,
+                    "store_type": "faiss",
+                    "quantization": self.quantization,
+                    "index_type": self.index_type,
+                },
+                f,
+            )
             
         logger.info("index_saved", path=str(path), total_chunks=len(self.chunks))
         
-    def load(self, path: str | Path) -> None:
+    def load(self, path: str | Path, mmap: bool = False) -> None:
         """인덱스와 메타데이터 로드
         
         Args:
             path: 저장된 디렉토리 경로
+            mmap: True이면 벡터 버퍼를 힙에 복사하지 않고 파일을 메모리 매핑하여
+                읽기 전용으로 로드 (필요한 페이지만 읽고, 여러 프로세스가 페이지 캐시 공유)
         """
         path = Path(path)
         
@@ -132,12 +441,22 @@ class FAISSStore(VectorStoreBase):
             
         # FAISS 인덱스 로드
         index_path = path / "faiss.index"
-        self.index = faiss.read_index(str(index_path))
+        if mmap:
+            self.index = faiss.read_index(
+                str(index_path), faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+            )
+        else:
+            self.index = faiss.read_index(str(index_path))
+        self.read_only = mmap
         
-        # 청크 데이터 로드
-        chunks_path = path / "chunks.pkl"
-        with open(chunks_path, "rb") as f:
-            self.chunks = pickle.load(f)
+        # 청크 데이터 로드 (Arrow 파일은 메모리 매핑 후 검색된 행만 복원)
+        arrow_path = path / CHUNKS_ARROW_FILE
+        if HAS_PYARROW and arrow_path.exists():
+            self.chunks = ArrowChunks.open(arrow_path)
+        else:
+            with open(path / CHUNKS_PICKLE_FILE, "rb") as f:
+                self.chunks = pickle.load(f)
+        self._invalidate_cache()
             
         # 차원 정보 확인 (일치하지 않으면 경고)
         meta_path = path / "meta.json"
@@ -150,8 +469,29 @@ class FAISSStore(VectorStoreBase):
                         expected=self.dimension,
                         loaded=meta.get("dimension"),
                     )
+                # 저장된 인덱스의 양자화 방식을 따름 (재인덱싱 전까지 유지)
+                loaded_quantization = meta.get("quantization", "none")
+                if loaded_quantization != self.quantization:
+                    logger.warning(
+                        "index_quantization_mismatch",
+                        expected=self.quantization,
+                        loaded=loaded_quantization,
+                    )
+                    self.quantization = loaded_quantization
+                loaded_index_type = meta.get("index_type", "flat")
+                if loaded_index_type != self.index_type:
+                    logger.warning(
+                        "index_type_mismatch",
+                        expected=self.index_type,
+                        loaded=loaded_index_type,
+                    )
+                    self.index_type = loaded_index_type
+        
+        # efSearch는 검색 시점 파라미터이므로 현재 설정을 적용
+        if self.index_type == "hnsw":
+            faiss.downcast_index(self.index).hnsw.efSearch = self.hnsw_ef_search
             
-        logger.info("index_loaded", path=str(path), total_chunks=len(self.chunks))
+        logger.info("index_loaded", path=str(path), total_chunks=len(self.chunks), mmap=mmap)
 
     @property
     def total_chunks(self) -> int:
@@ -159,8 +499,10 @@ class FAISSStore(VectorStoreBase):
     
     def clear(self) -> None:
         """저장소 초기화"""
-        self.index = faiss.IndexFlatIP(self.dimension)
+        self.index = self._empty_index()
+        self.read_only = False
         self.chunks = []
+        self._invalidate_cache()
         logger.info("index_cleared")
 
 
@@ -7,6 +7,7 @@ Qdrant 서버에 연결하여 벡터를 저장하고 검색합니다.
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +23,9 @@ from rag.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 포인트 ID 생성용 네임스페이스 (같은 청크는 항상 같은 ID → 재수집 시 덮어쓰기)
+POINT_ID_NAMESPACE = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
 
 class QdrantStore(VectorStoreBase):
     """Qdrant 기반 벡터 저장소"""
@@ -31,23 +35,39 @@ class QdrantStore(VectorStoreBase):
         dimension: int,
         host: str = "localhost",
         port: int = 6333,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
         collection_name: str = "terminal-rag",
+        upload_concurrency: int = 4,
+        quantization: str = "none",
         **kwargs: Any,
     ):
         """
         Args:
             dimension: 벡터 차원
             host: Qdrant 서버 호스트
-            port: Qdrant 서버 포트
+            port: Qdrant 서버 HTTP 포트
+            grpc_port: Qdrant 서버 gRPC 포트
+            prefer_grpc: gRPC 전송 사용 여부 (벡터를 JSON 대신 바이너리로 전송)
             collection_name: 컬렉션 이름
+            upload_concurrency: add 시 동시에 업로드할 배치 수
+            quantization: "fp16"이면 새 컬렉션의 벡터를 float16으로 저장 (기존 컬렉션은 유지)
         """
         self.dimension = dimension
         self.host = host
         self.port = port
         self.collection_name = collection_name
+        self.upload_concurrency = upload_concurrency
+        self.quantization = quantization
         
         # Qdrant 클라이언트 초기화 (타임아웃 증가)
-        self.client = QdrantClient(host=host, port=port, timeout=60)
+        self.client = QdrantClient(
+            host=host,
+            port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+            timeout=60,
+        )
         
         # 컬렉션 생성 (없으면)
         self._ensure_collection()
@@ -56,6 +76,7 @@ class QdrantStore(VectorStoreBase):
             "qdrant_store_initialized",
             host=host,
             port=port,
+            grpc=prefer_grpc,
             collection=collection_name,
         )
     
@@ -70,6 +91,9 @@ class QdrantStore(VectorStoreBase):
                 vectors_config=models.VectorParams(
                     size=self.dimension,
                     distance=models.Distance.COSINE,
+                    datatype=(
+                        models.Datatype.FLOAT16 if self.quantization == "fp16" else None
+                    ),
                 ),
             )
             logger.info("collection_created", collection=self.collection_name)
@@ -90,45 +114,71 @@ class QdrantStore(VectorStoreBase):
         if len(chunks) == 0:
             return
         
-        # 포인트 생성
-        points = []
-        for chunk, embedding in zip(chunks, embeddings):
-            point_id = str(uuid.uuid4())
-            payload = {
+        # 벡터는 한 번에 Python 리스트로 변환 (포인트마다 tolist 호출 방지)
+        vectors = np.asarray(embeddings, dtype=np.float32).tolist()
+        
+        # 메타데이터는 최상위 필드로 펼쳐 한 번만 저장 (별도 metadata 사본 없음)
+        payloads = [
+            {
+                "source": "",
+                "chunk_index": 0,
+                "start_char": 0,
+                "end_char": 0,
+                "header_path": "",
+                "user_id": "",  # 사용자 ID 필터용
+                **chunk.metadata,
                 "content": chunk.content,
-                "source": chunk.metadata.get("source", ""),
-                "chunk_index": chunk.metadata.get("chunk_index", 0),
-                "start_char": chunk.metadata.get("start_char", 0),
-                "end_char": chunk.metadata.get("end_char", 0),
-                "header_path": chunk.metadata.get("header_path", ""),
-                "user_id": chunk.metadata.get("user_id", ""),  # 사용자 ID 추가
-                "metadata": chunk.metadata,
             }
-            points.append(
-                models.PointStruct(
-                    id=point_id,
-                    vector=embedding.tolist(),
-                    payload=payload,
-                )
+            for chunk in chunks
+        ]
+        ids = [
+            str(uuid.uuid5(
+                POINT_ID_NAMESPACE,
+                f"{p['user_id']}:{p['source']}:{p['chunk_index']}:{p['start_char']}",
+            ))
+            for p in payloads
+        ]
+        
+        # 배치 업로드 (타임아웃 방지, 네트워크 왕복 대기를 겹치도록 동시 전송)
+        # 포인트별 PointStruct 대신 컬럼 단위 Batch로 전달하여 객체 생성/검증 생략
+        batches = [
+            models.Batch(
+                ids=ids[i:i + batch_size],
+                vectors=vectors[i:i + batch_size],
+                payloads=payloads[i:i + batch_size],
             )
+            for i in range(0, len(ids), batch_size)
+        ]
+        total_batches = len(batches)
         
-        # 배치 업로드 (타임아웃 방지)
-        total_batches = (len(points) + batch_size - 1) // batch_size
-        for i in range(0, len(points), batch_size):
-            batch = points[i:i + batch_size]
+        def upsert(batch_num: int, batch: models.Batch, wait: bool = False) -> None:
             self.client.upsert(
                 collection_name=self.collection_name,
                 points=batch,
-                wait=True,
+                wait=wait,
             )
-            batch_num = (i // batch_size) + 1
             logger.debug(
                 "batch_uploaded",
                 batch=batch_num,
                 total_batches=total_batches,
-                points_in_batch=len(batch),
+                points_in_batch=len(batch.ids),
             )
         
+        # 마지막 배치 전까지는 서버 반영을 기다리지 않고(wait=False) 접수만 확인
+        *pending, last = batches
+        workers = min(self.upload_concurrency, len(pending))
+        if workers <= 1:
+            for batch_num, batch in enumerate(pending, start=1):
+                upsert(batch_num, batch)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list()로 소비하여 업로드 예외를 호출자에게 전파
+                list(executor.map(upsert, range(1, total_batches), pending))
+        
+        # 업데이트는 접수 순서대로 적용되므로, 나머지가 모두 접수된 뒤 보낸
+        # 마지막 배치의 적용을 기다리면 반환 시점에 전체가 검색 가능
+        upsert(total_batches, last, wait=True)
+        
         logger.info(
             "chunks_added_to_qdrant",
             count=len(chunks),
@@ -172,21 +222,11 @@ class QdrantStore(VectorStoreBase):
         # 결과 변환
         output: list[tuple[Chunk, float]] = []
         for hit in results.points:
-            payload = hit.payload or {}
-            # 저장된 metadata 또는 payload에서 재구성
-            metadata = payload.get("metadata", {})
-            if not metadata:
-                metadata = {
-                    "source": payload.get("source", ""),
-                    "chunk_index": payload.get("chunk_index", 0),
-                    "start_char": payload.get("start_char", 0),
-                    "end_char": payload.get("end_char", 0),
-                    "header_path": payload.get("header_path", ""),
-                }
-            chunk = Chunk(
-                content=payload.get("content", ""),
-                metadata=metadata,
-            )
+            payload = dict(hit.payload or {})
+            content = payload.pop("content", "")
+            # 펼쳐 저장된 필드에서 재구성 (이전 형식은 metadata 사본 사용)
+            metadata = payload.pop("metadata", None) or payload
+            chunk = Chunk(content=content, metadata=metadata)
             output.append((chunk, hit.score))
         
         return output
@@ -195,7 +235,7 @@ class QdrantStore(VectorStoreBase):
         """Qdrant는 자동 영속화되므로 별도 저장 불필요"""
         logger.info("qdrant_auto_persisted", collection=self.collection_name)
     
-    def load(self, path: str | Path) -> None:
+    def load(self, path: str | Path, mmap: bool = False) -> None:
         """Qdrant는 서버가 데이터를 관리하므로 별도 로드 불필요"""
         self._ensure_collection()
         logger.info("qdrant_collection_ready", collection=self.collection_name)
@@ -3,15 +3,19 @@
 LLM 연동 및 프롬프트 관리를 제공합니다.
 """
 
-from rag.generation.llm import LLM, GeminiLLM, OllamaLLM, get_llm
-from rag.generation.prompt import build_prompt, SYSTEM_PROMPT
+from rag.generation.llm import LLM, GeminiLLM, OllamaLLM, generate_batch, get_llm
+from rag.generation.cache import CachedLLM
+from rag.generation.prompt import build_prompt, context_order_key, SYSTEM_PROMPT
 
 
 __all__ = [
     "LLM",
     "GeminiLLM",
     "OllamaLLM",
+    "CachedLLM",
     "get_llm",
+    "generate_batch",
     "build_prompt",
+    "context_order_key",
     "SYSTEM_PROMPT",
 ]
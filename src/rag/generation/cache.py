@@ -0,0 +1,171 @@
+"""LLM 응답 캐시 모듈
+
+동일한 모델/프롬프트에 대한 응답을 메모리(LRU)와 디스크(SQLite)에 캐싱합니다.
+반복 질문 시 네트워크 지연과 토큰 비용 없이 즉시 응답합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+from rag.generation.llm import LLM, is_error_response
+from rag.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+# 인덱스 디렉토리 내 캐시 파일명
+LLM_CACHE_FILENAME = "llm_cache.sqlite"
+
+
+class CachedLLM(LLM):
+    """응답 캐시를 적용한 LLM 래퍼
+    
+    캐시 키는 (모델 식별자, 프롬프트)의 BLAKE2b 해시입니다.
+    오류 안내 메시지(스트림 중간에 도착한 경우 포함)는 캐싱하지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        llm: LLM,
+        cache_path: Path | str | None = None,
+        max_memory_items: int = 256,
+    ):
+        """
+        Args:
+            llm: 실제 호출을 수행할 LLM
+            cache_path: SQLite 캐시 파일 경로 (None이면 메모리 캐시만 사용)
+            max_memory_items: 메모리 LRU 캐시 최대 항목 수
+        """
+        self.llm = llm
+        self.max_memory_items = max_memory_items
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        
+        if cache_path is not None:
+            path = Path(cache_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+            self._db.commit()
+    
+    @property
+    def model_id(self) -> str:
+        return self.llm.model_id
+    
+    def _make_key(self, prompt: str) -> str:
+        """캐시 키 생성"""
+        payload = f"{self.llm.model_id}\0{prompt}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _get(self, key: str) -> str | None:
+        """메모리 → 디스크 순으로 캐시 조회"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            
+            if self._db is None:
+                return None
+            
+            row = self._db.execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            self._remember(key, row[0])
+            return row[0]
+    
+    def _put(self, key: str, response: str) -> None:
+        """메모리와 디스크에 캐시 저장"""
+        with self._lock:
+            self._remember(key, response)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, response),
+                )
+                self._db.commit()
+    
+    def _remember(self, key: str, response: str) -> None:
+        """메모리 LRU에 저장 (호출자가 lock 보유)"""
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+    
+    def generate(self, prompt: str) -> str:
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=self.model_id)
+            return cached
+        
+        response = self.llm.generate(prompt)
+        if response and not is_error_response(response):
+            self._put(key, response)
+        return response
+    
+    async def agenerate(self, prompt: str) -> str:
+        """비동기 응답 생성 (캐시 동작은 generate와 동일)"""
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=self.model_id)
+            return cached
+        
+        response = await self.llm.agenerate(prompt)
+        if response and not is_error_response(response):
+            self._put(key, response)
+        return response
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """캐시 적중 시 전체 응답을 한 번에 반환, 미스 시 스트림을 그대로 전달하며 저장"""
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=self.model_id, stream=True)
+            yield cached
+            return
+        
+        # 스트림 도중 오류 메시지가 섞이면 앞부분이 정상이어도 캐싱하지 않음
+        parts: list[str] = []
+        failed = False
+        for text in self.llm.generate_stream(prompt):
+            parts.append(text)
+            failed = failed or is_error_response(text)
+            yield text
+        
+        response = "".join(parts)
+        if response and not failed:
+            self._put(key, response)
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """비동기 스트리밍 (캐시 동작은 generate_stream과 동일)"""
+        key = self._make_key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", model=self.model_id, stream=True)
+            yield cached
+            return
+        
+        # 스트림 도중 오류 메시지가 섞이면 앞부분이 정상이어도 캐싱하지 않음
+        parts: list[str] = []
+        failed = False
+        async for text in self.llm.generate_stream_async(prompt):
+            parts.append(text)
+            failed = failed or is_error_response(text)
+            yield text
+        
+        response = "".join(parts)
+        if response and not failed:
+            self._put(key, response)
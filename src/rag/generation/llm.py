@@ -6,10 +6,14 @@ Google Gemini API 및 Ollama를 사용하는 LLM 구현체를 제공합니다.
 
 from __future__ import annotations
 
+import asyncio
 import os
 import json
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional
 
 import requests
 import google.generativeai as genai
@@ -19,15 +23,75 @@ from dotenv import load_dotenv
 from rag.config import get_config, GenerationConfig
 from rag.logger import get_logger
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+# 스트림 줄 단위 JSON 파싱 (orjson이 있으면 C 구현 사용)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Ollama 서버(base_url)별 공유 HTTP 연결 풀
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+# httpx 비동기 클라이언트는 생성된 이벤트 루프에 묶이므로 루프별로 보관
+# (루프가 종료되어 수거되면 함께 제거)
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, "httpx.AsyncClient"]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_session(base_url: str) -> requests.Session:
+    """서버별 requests 세션 반환 (스레드 간 공유, 최초 호출 시 생성)"""
+    with _sessions_lock:
+        session = _sessions.get(base_url)
+        if session is None:
+            session = _sessions[base_url] = requests.Session()
+        return session
+
+
+def _get_async_client(base_url: str) -> "httpx.AsyncClient":
+    """현재 이벤트 루프의 서버별 httpx 비동기 클라이언트 반환 (최초 호출 시 생성)"""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(base_url)
+    if client is None or client.is_closed:
+        client = clients[base_url] = httpx.AsyncClient(timeout=120)
+    return client
+
 load_dotenv()
 
 
 logger = get_logger(__name__)
 
+# 호출 실패 시 반환되는 안내 메시지 접두어 (응답 캐시 제외 판단용)
+ERROR_RESPONSE_PREFIXES = (
+    "API 오류:",
+    "오류 발생:",
+    "Ollama 연결 오류:",
+    "죄송합니다. 답변을 생성할 수 없습니다.",
+)
+
+
+def is_error_response(text: str) -> bool:
+    """LLM 응답이 호출 실패 안내 메시지인지 확인"""
+    return text.startswith(ERROR_RESPONSE_PREFIXES)
+
 
 class LLM(ABC):
     """LLM 추상 기본 클래스"""
     
+    @property
+    def model_id(self) -> str:
+        """캐시 키 등에 사용하는 Provider/모델 식별자"""
+        return type(self).__name__
+    
     @abstractmethod
     def generate(self, prompt: str) -> str:
         """프롬프트에 대한 응답 생성"""
@@ -37,6 +101,29 @@ class LLM(ABC):
     def generate_stream(self, prompt: str) -> Iterator[str]:
         """스트리밍 응답 생성"""
         pass
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """비동기 스트리밍 응답 생성
+        
+        기본 구현은 동기 스트림을 워커 스레드에서 한 항목씩 소비하여
+        토큰 대기 중에도 이벤트 루프를 점유하지 않습니다.
+        네이티브 비동기 클라이언트가 있는 Provider는 재정의합니다.
+        """
+        iterator = self.generate_stream(prompt)
+        done = object()
+        while True:
+            text = await asyncio.to_thread(next, iterator, done)
+            if text is done:
+                break
+            yield text
+    
+    async def agenerate(self, prompt: str) -> str:
+        """비동기 응답 생성
+        
+        기본 구현은 동기 generate를 워커 스레드에서 실행합니다.
+        네이티브 비동기 클라이언트가 있는 Provider는 재정의합니다.
+        """
+        return await asyncio.to_thread(self.generate, prompt)
 
 
 class GeminiLLM(LLM):
@@ -64,17 +151,32 @@ class GeminiLLM(LLM):
         except Exception as e:
             logger.error("gemini_init_failed", error=str(e))
             raise
+    
+    @property
+    def model_id(self) -> str:
+        return f"gemini:{self.model_name}"
+            
+    def _response_text(self, response) -> str:
+        """generate_content 응답에서 본문 추출 (빈 응답은 안내 메시지)"""
+        # 암시적 컨텍스트 캐시(접두어 일치) 적중 토큰 수 확인용
+        usage = getattr(response, "usage_metadata", None)
+        logger.debug(
+            "gemini_usage",
+            prompt_tokens=getattr(usage, "prompt_token_count", None),
+            cached_tokens=getattr(usage, "cached_content_token_count", None),
+        )
+        
+        if not response.text:
+            logger.warning("gemini_empty_response", feedback=response.prompt_feedback)
+            return "죄송합니다. 답변을 생성할 수 없습니다."
+            
+        return response.text
             
     def generate(self, prompt: str) -> str:
         try:
             logger.debug("gemini_generating", prompt_length=len(prompt))
             response = self.model.generate_content(prompt)
-            
-            if not response.text:
-                logger.warning("gemini_empty_response", feedback=response.prompt_feedback)
-                return "죄송합니다. 답변을 생성할 수 없습니다."
-                
-            return response.text
+            return self._response_text(response)
             
         except exceptions.GoogleAPIError as e:
             logger.error("gemini_api_error", error=str(e))
@@ -99,6 +201,37 @@ class GeminiLLM(LLM):
         except Exception as e:
             logger.error("gemini_stream_failed", error=str(e))
             yield f"오류 발생: {str(e)}"
+    
+    async def agenerate(self, prompt: str) -> str:
+        """Gemini 비동기 응답 생성 (SDK 비동기 클라이언트 사용)"""
+        try:
+            logger.debug("gemini_generating_async", prompt_length=len(prompt))
+            response = await self.model.generate_content_async(prompt)
+            return self._response_text(response)
+            
+        except exceptions.GoogleAPIError as e:
+            logger.error("gemini_api_error", error=str(e))
+            return f"API 오류: {str(e)}"
+        except Exception as e:
+            logger.error("gemini_generation_failed", error=str(e))
+            return f"오류 발생: {str(e)}"
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """Gemini 비동기 스트리밍 응답 생성 (SDK 비동기 클라이언트 사용)"""
+        try:
+            logger.debug("gemini_streaming_async", prompt_length=len(prompt))
+            response = await self.model.generate_content_async(prompt, stream=True)
+            
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+                    
+        except exceptions.GoogleAPIError as e:
+            logger.error("gemini_stream_error", error=str(e))
+            yield f"API 오류: {str(e)}"
+        except Exception as e:
+            logger.error("gemini_stream_failed", error=str(e))
+            yield f"오류 발생: {str(e)}"
 
 
 class OllamaLLM(LLM):
@@ -108,28 +241,63 @@ class OllamaLLM(LLM):
         self,
         base_url: str | None = None,
         model: str | None = None,
+        prefix_cache: bool = True,
     ):
+        """
+        Args:
+            base_url: Ollama 서버 주소
+            model: 모델명
+            prefix_cache: 프롬프트 접두어(시스템 프롬프트 + 컨텍스트) KV 캐시 재사용.
+                Ollama는 로드된 모델 슬롯에 직전 프롬프트의 KV 캐시를 보관하므로,
+                모델을 메모리에 유지(keep_alive)하고 num_ctx를 고정하여 캐시가 버려지지 않게 합니다.
+        """
         config = get_config()
-        self.base_url = base_url or config.generation.ollama.base_url
-        self.model = model or config.generation.ollama.model
+        ollama_config = config.generation.ollama
+        self.base_url = base_url or ollama_config.base_url
+        self.model = model or ollama_config.model
+        self.prefix_cache = prefix_cache
+        self.keep_alive = ollama_config.keep_alive
+        self.num_ctx = ollama_config.num_ctx
+        # 호출마다 TCP 연결을 새로 맺지 않도록 서버별 keep-alive 연결 풀 공유
+        # (API는 요청마다 인스턴스를 만들므로 인스턴스가 아닌 모듈 단위로 보관)
+        self._session = _get_session(self.base_url)
         
-        logger.info("ollama_initialized", base_url=self.base_url, model=self.model)
+        logger.info(
+            "ollama_initialized",
+            base_url=self.base_url,
+            model=self.model,
+            prefix_cache=prefix_cache,
+        )
+    
+    @property
+    def model_id(self) -> str:
+        return f"ollama:{self.model}"
+    
+    def _build_payload(self, prompt: str, stream: bool) -> dict:
+        """/api/generate 요청 본문 생성"""
+        options: dict = {
+            "temperature": 0.1,
+            "num_predict": 1024,
+        }
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": options,
+        }
+        if self.prefix_cache:
+            payload["keep_alive"] = self.keep_alive
+            if self.num_ctx is not None:
+                options["num_ctx"] = self.num_ctx
+        return payload
         
     def generate(self, prompt: str) -> str:
         try:
             logger.debug("ollama_generating", model=self.model, prompt_length=len(prompt))
             
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.1,
-                    "num_predict": 1024,
-                }
-            }
-            
-            response = requests.post(
+            payload = self._build_payload(prompt, stream=False)
+            
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 timeout=120
@@ -151,17 +319,9 @@ class OllamaLLM(LLM):
         try:
             logger.debug("ollama_streaming", model=self.model, prompt_length=len(prompt))
             
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": True,
-                "options": {
-                    "temperature": 0.1,
-                    "num_predict": 1024,
-                }
-            }
-            
-            response = requests.post(
+            payload = self._build_payload(prompt, stream=True)
+            
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 stream=True,
@@ -171,7 +331,7 @@ class OllamaLLM(LLM):
             
             for line in response.iter_lines():
                 if line:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                     text = data.get("response", "")
                     if text:
                         yield text
@@ -182,6 +342,71 @@ class OllamaLLM(LLM):
         except Exception as e:
             logger.error("ollama_stream_failed", error=str(e))
             yield f"오류 발생: {str(e)}"
+    
+    async def agenerate(self, prompt: str) -> str:
+        """Ollama 비동기 응답 생성 (httpx가 없으면 스레드 기반 기본 구현)"""
+        if not HAS_HTTPX:
+            return await super().agenerate(prompt)
+        
+        try:
+            logger.debug("ollama_generating_async", model=self.model, prompt_length=len(prompt))
+            
+            payload = self._build_payload(prompt, stream=False)
+            client = _get_async_client(self.base_url)
+            response = await client.post(f"{self.base_url}/api/generate", json=payload)
+            response.raise_for_status()
+            
+            return response.json().get("response", "")
+            
+        except httpx.HTTPError as e:
+            logger.error("ollama_api_error", error=str(e))
+            return f"Ollama 연결 오류: {str(e)}"
+        except Exception as e:
+            logger.error("ollama_generation_failed", error=str(e))
+            return f"오류 발생: {str(e)}"
+    
+    async def generate_stream_async(self, prompt: str) -> AsyncIterator[str]:
+        """Ollama 비동기 스트리밍 응답 생성 (httpx가 없으면 스레드 기반 기본 구현)"""
+        if not HAS_HTTPX:
+            async for text in super().generate_stream_async(prompt):
+                yield text
+            return
+        
+        try:
+            logger.debug("ollama_streaming_async", model=self.model, prompt_length=len(prompt))
+            
+            payload = self._build_payload(prompt, stream=True)
+            client = _get_async_client(self.base_url)
+            async with client.stream(
+                "POST", f"{self.base_url}/api/generate", json=payload
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line:
+                        data = _json_loads(line)
+                        text = data.get("response", "")
+                        if text:
+                            yield text
+                                
+        except httpx.HTTPError as e:
+            logger.error("ollama_stream_error", error=str(e))
+            yield f"Ollama 연결 오류: {str(e)}"
+        except Exception as e:
+            logger.error("ollama_stream_failed", error=str(e))
+            yield f"오류 발생: {str(e)}"
+
+
+async def generate_batch(llm: LLM, prompts: list[str]) -> list[str]:
+    """여러 프롬프트를 동시에 생성 (네트워크 대기 시간을 겹쳐 처리)
+    
+    Args:
+        llm: LLM 인스턴스
+        prompts: 프롬프트 목록
+        
+    Returns:
+        입력 순서와 같은 응답 목록
+    """
+    return list(await asyncio.gather(*(llm.agenerate(p) for p in prompts)))
 
 
 def get_llm(
@@ -189,6 +414,8 @@ def get_llm(
     api_key: str | None = None,
     model_name: str | None = None,
     base_url: str | None = None,
+    use_cache: bool = False,
+    prefix_cache: bool = True,
 ) -> LLM:
     """설정된 Provider에 맞는 LLM 인스턴스 반환
     
@@ -197,11 +424,22 @@ def get_llm(
         api_key: Gemini API Key (Optional Override)
         model_name: Model Name (Optional Override)
         base_url: Ollama Base URL (Optional Override)
+        use_cache: True이면 응답 캐시(CachedLLM)로 감싸서 반환
+        prefix_cache: Provider 측 프롬프트 접두어 캐시 활용 (Ollama 전용,
+            Gemini는 암시적 캐시가 항상 적용됨)
     """
     config = get_config()
     target_provider = provider or config.generation.provider
     
+    llm: LLM
     if target_provider == "ollama":
-        return OllamaLLM(base_url=base_url, model=model_name)
+        llm = OllamaLLM(base_url=base_url, model=model_name, prefix_cache=prefix_cache)
     else:
-        return GeminiLLM(api_key=api_key, model_name=model_name)
+        llm = GeminiLLM(api_key=api_key, model_name=model_name)
+    
+    if use_cache:
+        from rag.generation.cache import CachedLLM, LLM_CACHE_FILENAME
+        cache_path = Path(config.project.index_path) / LLM_CACHE_FILENAME
+        llm = CachedLLM(llm, cache_path=cache_path)
+    
+    return llm
@@ -28,9 +28,26 @@ SYSTEM_PROMPT = """당신은 전문적이고 신뢰할 수 있는 AI 어시스
 **언어:** 한국어로 답변하세요.
 """
 
+# 모든 프롬프트에 공통인 고정 접두어
+_PROMPT_HEADER = SYSTEM_PROMPT + "\n\n[Context]\n"
+
+def context_order_key(chunk: Chunk) -> tuple[str, int]:
+    """컨텍스트 정렬 키 (문서 경로, 청크 순서)
+    
+    참조 목록을 출력할 때도 같은 키로 정렬하면 답변의 [Chunk N] 번호와 일치합니다.
+    """
+    source = chunk.metadata.get("source") or chunk.metadata.get("filename", "")
+    return (str(source), chunk.metadata.get("chunk_index", -1))
+
+
 def build_prompt(query: str, chunks: List[Chunk]) -> str:
     """컨텍스트와 질문을 결합하여 프롬프트 생성
     
+    Provider의 프롬프트 캐시(KV cache)는 접두어가 일치할 때만 적중하므로,
+    고정된 시스템 프롬프트 → 컨텍스트 → 가변 질문 순으로 배치하고
+    컨텍스트는 검색 순위가 아닌 (문서, 청크 순서)로 정렬합니다.
+    같은 청크 집합이 검색되면 질문 앞까지의 접두어가 동일해집니다.
+    
     Args:
         query: 사용자 질문
         chunks: 검색된 청크 리스트
@@ -38,24 +55,16 @@ def build_prompt(query: str, chunks: List[Chunk]) -> str:
     Returns:
         완성된 프롬프트 문자열
     """
-    # 컨텍스트 구성
-    context_parts = []
-    for i, chunk in enumerate(chunks, 1):
+    # 조각을 모아 한 번에 결합 (컨텍스트 크기만큼의 중간 문자열 복사 방지)
+    parts = [_PROMPT_HEADER]
+    for i, chunk in enumerate(sorted(chunks, key=context_order_key), 1):
         # 메타데이터를 포함하여 컨텍스트 풍부화
         source = chunk.metadata.get("filename", "unknown")
-        context_parts.append(f"--- [Chunk {i}] (Source: {source}) ---\n{chunk.content}\n")
+        if i > 1:
+            parts.append("\n")
+        parts.append(f"--- [Chunk {i}] (Source: {source}) ---\n")
+        parts.append(chunk.content)
+        parts.append("\n")
     
-    context_str = "\n".join(context_parts)
-    
-    # 전체 프롬프트 조립
-    prompt = f"""{SYSTEM_PROMPT}
-
-[Context]
-{context_str}
-
-[Question]
-{query}
-
-[Answer]
-"""
-    return prompt
+    parts.extend(("\n\n[Question]\n", query, "\n\n[Answer]\n"))
+    return "".join(parts)
@@ -4,15 +4,17 @@
 """
 
 from rag.ingestion.document import Document
-from rag.ingestion.loader import load_documents, load_file
+from rag.ingestion.loader import iter_files, load_documents, load_file, load_files
 from rag.ingestion.normalizer import normalize_text
 from rag.ingestion.language import detect_language
 
 
 __all__ = [
     "Document",
+    "iter_files",
     "load_documents",
     "load_file",
+    "load_files",
     "normalize_text",
     "detect_language",
 ]
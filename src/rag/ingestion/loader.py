@@ -5,7 +5,10 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from rag.ingestion.document import Document
 from rag.ingestion.parsers.base import DocumentParser
@@ -16,6 +19,9 @@ from rag.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 동시 파일 로드 스레드 수 (파일 I/O 대기 중에는 GIL이 해제됨)
+LOAD_MAX_WORKERS = 16
+
 
 class DocumentLoader:
     """문서 로더"""
@@ -25,13 +31,15 @@ class DocumentLoader:
             TextParser(),
             PDFParser(),
         ]
+        # 확장자 → 파서 (먼저 등록된 파서 우선)
+        self._by_suffix: dict[str, DocumentParser] = {}
+        for parser in self.parsers:
+            for ext in parser.extensions:
+                self._by_suffix.setdefault(ext.lower(), parser)
         
     def get_parser(self, path: Path) -> DocumentParser | None:
         """파일에 적합한 파서 반환"""
-        for parser in self.parsers:
-            if parser.can_parse(path):
-                return parser
-        return None
+        return self._by_suffix.get(path.suffix.lower())
         
     def load(self, path: Path | str) -> str:
         """파일에서 텍스트 추출
@@ -62,10 +70,90 @@ class DocumentLoader:
             raise e
 
 
+# 파서는 상태가 없으므로 하나의 로더를 모든 호출(스레드 포함)에서 공유
+_LOADER = DocumentLoader()
+
+
 def load_file(path: Path | str) -> str:
     """헬퍼 함수: 파일 로드"""
-    loader = DocumentLoader()
-    return loader.load(path)
+    return _LOADER.load(path)
+
+
+def load_files(
+    paths: Iterable[Path | str],
+    max_workers: int | None = None,
+) -> list[tuple[Path, Document]]:
+    """여러 파일을 동시에 로드
+    
+    파일 읽기는 I/O 대기가 대부분이므로 스레드 풀로 요청을 겹쳐서 처리합니다.
+    지원하지 않거나 읽기에 실패한 파일은 건너뜁니다.
+    
+    Args:
+        paths: 파일 경로 목록
+        max_workers: 스레드 수 (None이면 LOAD_MAX_WORKERS)
+        
+    Returns:
+        입력 순서를 유지한 (경로, Document) 튜플 리스트
+    """
+    loader = _LOADER
+    file_paths = [Path(p) for p in paths]
+    
+    def _load(file_path: Path) -> Document | None:
+        try:
+            content = loader.load(file_path)
+        except ValueError:
+            return None  # 지원하지 않는 파일 스킵
+        except Exception as e:
+            logger.warning("load_doc_failed", path=str(file_path), error=str(e))
+            return None
+        return Document.from_file(file_path, content)
+    
+    if len(file_paths) <= 1:
+        docs = [_load(file_path) for file_path in file_paths]
+    else:
+        workers = min(max_workers or LOAD_MAX_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            docs = list(executor.map(_load, file_paths))
+    
+    return [(file_path, doc) for file_path, doc in zip(file_paths, docs) if doc is not None]
+
+
+def iter_files(
+    root: Path | str,
+    extensions: Iterable[str],
+    skip_hidden: bool = True,
+) -> Iterator[Path]:
+    """디렉터리 아래에서 지정한 확장자의 파일을 재귀적으로 나열
+    
+    os.scandir의 DirEntry는 디렉터리 목록을 읽을 때 받은 파일 종류를 캐싱하므로
+    Path.rglob + is_file()처럼 항목마다 stat을 호출하지 않습니다.
+    심볼릭 링크 디렉터리는 순환을 피하기 위해 따라가지 않습니다.
+    
+    Args:
+        root: 탐색할 디렉터리
+        extensions: 허용 확장자 (예: [".md", ".txt"], 대소문자 무시)
+        skip_hidden: True이면 "."으로 시작하는 파일/디렉터리 제외
+        
+    Yields:
+        파일 경로
+    """
+    ext_set = frozenset(ext.lower() for ext in extensions)
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if skip_hidden and entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in ext_set
+                        and entry.is_file()
+                    ):
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning("scan_dir_failed", error=str(e))
 
 
 def load_documents(path: Path | str) -> list[Document]:
@@ -78,7 +166,7 @@ def load_documents(path: Path | str) -> list[Document]:
         Document 객체 리스트
     """
     root_path = Path(path)
-    loader = DocumentLoader()
+    loader = _LOADER
     documents: list[Document] = []
     
     if not root_path.exists():
@@ -98,20 +186,10 @@ def load_documents(path: Path | str) -> list[Document]:
         return documents
     
     # 2. 디렉터리인 경우 (재귀 탐색)
-    # 숨김 파일/폴더 제외
-    for file_path in root_path.rglob("*"):
-        if file_path.name.startswith(".") or not file_path.is_file():
-            continue
-            
-        try:
-            content = loader.load(file_path)
-            doc = Document.from_file(file_path, content)
-            documents.append(doc)
-        except ValueError:
-            continue  # 지원하지 않는 파일 스킵
-        except Exception as e:
-            logger.warning("load_doc_failed", path=str(file_path), error=str(e))
-            continue
-            
+    # 숨김 파일/폴더와 파서가 없는 파일은 스레드 풀에 넘기기 전에 제외
+    extensions = [ext for parser in loader.parsers for ext in parser.extensions]
+    file_paths = list(iter_files(root_path, extensions))
+    documents = [doc for _, doc in load_files(file_paths)]
+    
     logger.info("documents_loaded", count=len(documents), path=str(path))
     return documents
@@ -7,14 +7,27 @@ from __future__ import annotations
 
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
 
 from rag.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+# 새로 기록하는 파일 해시 알고리즘 (BLAKE3: SIMD/멀티스레드로 SHA256 대비 수 배 빠름)
+DEFAULT_HASH_ALGO = "blake3" if HAS_BLAKE3 else "sha256"
+
+# 동시 해시 계산 스레드 수 (파일 I/O 및 해시 계산 중 GIL 해제)
+HASH_MAX_WORKERS = 8
+
 
 class IndexMetadata:
     """인덱스 메타데이터 관리자
@@ -28,9 +41,12 @@ class IndexMetadata:
         self.index_path = Path(index_path)
         self.meta_file = self.index_path / self.FILENAME
         self._data: dict[str, Any] = {
-            "indexed_files": {},  # {file_path: {"hash": ..., "chunks_count": ...}}
+            # {file_path: {"hash": ..., "hash_algo": ..., "mtime_ns": ..., "size": ..., "chunks_count": ...}}
+            "indexed_files": {},
             "version": "1.0",
         }
+        # is_indexed_many에서 계산한 해시 (mark_indexed에서 재계산 방지)
+        self._computed_hashes: dict[str, str] = {}
         self._load()
     
     def _load(self) -> None:
@@ -58,35 +74,108 @@ class IndexMetadata:
         logger.debug("index_metadata_cleared")
     
     @staticmethod
-    def compute_file_hash(file_path: Path) -> str:
-        """파일 내용의 해시 계산 (SHA256)"""
-        hasher = hashlib.sha256()
+    def compute_file_hash(file_path: Path, algo: str = "sha256") -> str:
+        """파일 내용의 해시 계산
+        
+        Args:
+            file_path: 파일 경로
+            algo: "sha256" 또는 "blake3" (blake3 미설치 시 사용 불가)
+            
+        Returns:
+            hex 해시 문자열
+        """
+        if algo == "blake3":
+            # 파일을 메모리 매핑하여 복사 없이 해시
+            return blake3.blake3().update_mmap(str(file_path)).hexdigest()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            return hashlib.file_digest(f, algo).hexdigest()
     
     def is_indexed(self, file_path: Path) -> bool:
         """파일이 이미 인덱싱되었고 변경되지 않았는지 확인"""
-        str_path = str(file_path.absolute())
+        return self.is_indexed_many([file_path])[0]
+    
+    def is_indexed_many(self, file_paths: Iterable[Path]) -> list[bool]:
+        """여러 파일의 인덱싱 여부를 한 번에 확인
+        
+        기록이 있는 파일 중 수정 시각(mtime_ns)과 크기가 기록과 같으면 미변경으로 보고
+        해시를 생략합니다. 나머지만 스레드 풀에서 동시에 해시를 계산해 비교합니다.
+        저장 당시의 알고리즘으로 비교하므로 알고리즘이 바뀌어도 재인덱싱되지 않습니다.
+        
+        Args:
+            file_paths: 파일 경로 목록
+            
+        Returns:
+            입력 순서와 동일한 인덱싱 여부 리스트
+        """
+        indexed_files = self._data["indexed_files"]
+        str_paths = [str(Path(p).absolute()) for p in file_paths]
+        
+        # 기록 없는 파일은 해시 계산 불필요, stat이 기록과 같으면 파일을 읽지 않음
+        unchanged: set[str] = set()
+        stats: dict[str, tuple[int, int]] = {}
+        to_check = []
+        for str_path in str_paths:
+            entry = indexed_files.get(str_path)
+            if entry is None:
+                continue
+            try:
+                st = Path(str_path).stat()
+            except OSError:
+                continue  # 파일 없음 → 미인덱싱으로 간주
+            stats[str_path] = (st.st_mtime_ns, st.st_size)
+            if (entry.get("mtime_ns"), entry.get("size")) == stats[str_path]:
+                unchanged.add(str_path)
+            else:
+                to_check.append(str_path)
         
-        if str_path not in self._data["indexed_files"]:
-            return False
+        def _hash(str_path: str) -> str:
+            algo = indexed_files[str_path].get("hash_algo", "sha256")
+            if algo == "blake3" and not HAS_BLAKE3:
+                return ""  # 검증 불가 → 변경된 것으로 간주
+            return self.compute_file_hash(Path(str_path), algo)
         
-        stored_hash = self._data["indexed_files"][str_path].get("hash")
-        current_hash = self.compute_file_hash(file_path)
+        if len(to_check) > 1:
+            with ThreadPoolExecutor(max_workers=min(HASH_MAX_WORKERS, len(to_check))) as executor:
+                current_hashes = dict(zip(to_check, executor.map(_hash, to_check)))
+        else:
+            current_hashes = {p: _hash(p) for p in to_check}
         
-        if stored_hash != current_hash:
-            logger.debug("file_changed", path=str_path)
-            return False
+        results = []
+        for str_path in str_paths:
+            if str_path in unchanged:
+                results.append(True)
+                continue
+            if str_path not in current_hashes:
+                results.append(False)
+                continue
+            
+            entry = indexed_files[str_path]
+            if entry.get("hash_algo", "sha256") == DEFAULT_HASH_ALGO:
+                self._computed_hashes[str_path] = current_hashes[str_path]
+            
+            if entry.get("hash") != current_hashes[str_path]:
+                logger.debug("file_changed", path=str_path)
+                results.append(False)
+            else:
+                # 내용은 같고 stat만 바뀐 경우(touch, 복사 등) 다음 확인부터 해시 생략
+                entry["mtime_ns"], entry["size"] = stats[str_path]
+                results.append(True)
         
-        return True
+        return results
     
     def mark_indexed(self, file_path: Path, chunks_count: int) -> None:
         """파일을 인덱싱됨으로 표시"""
         str_path = str(file_path.absolute())
+        # 해시 전에 stat을 기록하여, 그 사이 파일이 바뀌면 다음 확인 때 다시 해시하도록 함
+        st = file_path.stat()
+        file_hash = self._computed_hashes.pop(str_path, None)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path, DEFAULT_HASH_ALGO)
         self._data["indexed_files"][str_path] = {
-            "hash": self.compute_file_hash(file_path),
+            "hash": file_hash,
+            "hash_algo": DEFAULT_HASH_ALGO,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
             "chunks_count": chunks_count,
         }
     
@@ -80,15 +80,32 @@ def normalize_text(text: str) -> str:
     3. 개행 정규화
     4. 앞뒤 공백 제거
     
+    2~3단계는 normalize_whitespace, normalize_newlines를 차례로 적용한 것과
+    결과가 같지만, 줄 단위로 한 번만 순회하여 중간 문자열 복사를 줄입니다.
+    
     Args:
         text: 정규화할 텍스트
         
     Returns:
         정규화된 텍스트
     """
-    text = normalize_unicode(text)
-    text = normalize_whitespace(text)
-    text = normalize_newlines(text)
-    text = text.strip()
+    # ASCII 텍스트는 NFKC 결과가 항상 동일
+    if not text.isascii():
+        text = normalize_unicode(text)
     
-    return text
+    lines: list[str] = []
+    prev_blank = False
+    for line in text.split("\n"):
+        # split()은 탭 포함 연속 공백을 나누고 줄 끝 공백을 버림
+        words = line.split()
+        if words:
+            joined = " ".join(words)
+            # 줄 앞 공백은 단일 공백으로 유지
+            lines.append(" " + joined if line[0].isspace() else joined)
+            prev_blank = False
+        elif not prev_blank:
+            # 빈 줄은 연속으로 하나까지만 (개행 최대 2개)
+            lines.append("")
+            prev_blank = True
+    
+    return "\n".join(lines).strip()
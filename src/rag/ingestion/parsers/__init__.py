@@ -17,6 +17,12 @@ _PARSERS: list[DocumentParser] = [
     PDFParser(),
 ]
 
+# 확장자 → 파서 (먼저 등록된 파서 우선)
+_PARSER_BY_SUFFIX: dict[str, DocumentParser] = {}
+for _parser in _PARSERS:
+    for _ext in _parser.extensions:
+        _PARSER_BY_SUFFIX.setdefault(_ext.lower(), _parser)
+
 
 def get_parser(path: Path) -> Optional[DocumentParser]:
     """파일에 맞는 파서 반환
@@ -27,10 +33,7 @@ def get_parser(path: Path) -> Optional[DocumentParser]:
     Returns:
         적합한 파서 또는 None
     """
-    for parser in _PARSERS:
-        if parser.can_parse(path):
-            return parser
-    return None
+    return _PARSER_BY_SUFFIX.get(path.suffix.lower())
 
 
 def get_supported_extensions() -> list[str]:
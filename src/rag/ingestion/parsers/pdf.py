@@ -6,6 +6,7 @@ PDF 특유의 레이아웃 문제를 해결하기 위한 후처리를 포함합
 
 from __future__ import annotations
 
+import io
 import re
 from pathlib import Path
 
@@ -18,6 +19,14 @@ from rag.logger import get_logger
 logger = get_logger(__name__)
 
 
+# 하이픈으로 끊긴 단어 (예: "atten-\ntion")
+_HYPHEN_BREAK_PATTERN = re.compile(r'-\s*\n\s*')
+# 문단 구분 (줄바꿈 2개 이상, 사이 공백 포함)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r'\n\s*\n')
+# 연속 공백
+_MULTI_SPACE_PATTERN = re.compile(r' {2,}')
+
+
 def normalize_pdf_text(text: str) -> str:
     """PDF 텍스트 정규화
     
@@ -26,6 +35,8 @@ def normalize_pdf_text(text: str) -> str:
     - 불필요한 줄바꿈 제거
     - 문단 구분 유지
     
+    페이지마다 호출되므로 미리 컴파일한 정규식 세 번과 문자열 메서드로 처리합니다.
+    
     Args:
         text: PDF에서 추출된 원본 텍스트
         
@@ -36,26 +47,17 @@ def normalize_pdf_text(text: str) -> str:
         return ""
     
     # 1. 하이픈으로 끊긴 단어 병합 (예: "atten-\ntion" → "attention")
-    text = re.sub(r'-\s*\n\s*', '', text)
-    
-    # 2. 연속된 2개 이상 줄바꿈 → 문단 구분자로 임시 표시
-    text = re.sub(r'\n\s*\n+', '\n\n<<PARA>>\n\n', text)
-    
-    # 3. 단일 줄바꿈 → 공백 (PDF에서 줄바꿈은 레이아웃용)
-    text = re.sub(r'(?<!\n)\n(?!\n)', ' ', text)
-    
-    # 4. 문단 구분자 복원
-    text = text.replace('<<PARA>>', '\n\n')
-    
-    # 5. 연속 공백 정리
-    text = re.sub(r' +', ' ', text)
+    text = _HYPHEN_BREAK_PATTERN.sub('', text)
     
-    # 6. 불필요한 공백 줄 정리
-    text = re.sub(r'\n +', '\n', text)
-    text = re.sub(r' +\n', '\n', text)
+    # 2. 문단 단위로 나누어 단일 줄바꿈 → 공백 (PDF에서 줄바꿈은 레이아웃용),
+    #    문단 앞뒤 공백을 제거한 뒤 빈 줄 하나로 다시 연결
+    text = "\n\n".join(
+        paragraph.replace('\n', ' ').strip(' ')
+        for paragraph in _PARAGRAPH_BREAK_PATTERN.split(text)
+    )
     
-    # 7. 3개 이상 연속 줄바꿈 → 2개로
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    # 3. 연속 공백 정리
+    text = _MULTI_SPACE_PATTERN.sub(' ', text)
     
     return text.strip()
 
@@ -76,18 +78,21 @@ class PDFParser(DocumentParser):
         """
         try:
             reader = PdfReader(path)
-            text_parts: list[str] = []
+            # 페이지 문자열을 리스트에 모아두지 않고 버퍼에 바로 기록
+            buffer = io.StringIO()
             
-            for page_num, page in enumerate(reader.pages):
+            for page in reader.pages:
                 page_text = page.extract_text()
                 if page_text:
                     # 페이지별로 정규화 적용
                     normalized = normalize_pdf_text(page_text)
                     if normalized:
-                        text_parts.append(normalized)
+                        # 페이지 간 구분 (문단 구분)
+                        if buffer.tell():
+                            buffer.write("\n\n")
+                        buffer.write(normalized)
             
-            # 페이지 간 구분 (문단 구분)
-            full_text = "\n\n".join(text_parts)
+            full_text = buffer.getvalue()
             
             logger.debug(
                 "pdf_parsed",
@@ -14,22 +14,31 @@ from rag.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _decode_text(data: bytes, encoding: str) -> str:
+    """바이트를 디코딩하고 개행을 \\n으로 통일
+
+    read_text의 universal newline 동작(\\r\\n, \\r → \\n)과 동일한 결과를 냅니다.
+    """
+    text = data.decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 class TextParser(DocumentParser):
     """텍스트 파일 파서"""
     
     extensions = [".txt", ".md"]
     
     def parse(self, path: Path, encoding: str = "utf-8") -> str:
-        """텍스트 파일 파싱"""
+        """텍스트 파일 파싱
+        
+        파일은 한 번만 읽고, 디코딩 실패 시 같은 버퍼를 latin-1로 다시 디코딩합니다.
+        읽기 오류(FileNotFoundError, PermissionError 등)는 호출자에게 전달됩니다.
+        """
+        data = path.read_bytes()
         try:
-            return path.read_text(encoding=encoding)
+            return _decode_text(data, encoding)
         except UnicodeDecodeError:
-            # UTF-8 실패 시 latin-1 시도
-            try:
-                return path.read_text(encoding="latin-1")
-            except Exception as e:
-                logger.warning("text_parse_failed", path=str(path), error=str(e))
-                return ""
-        except Exception as e:
-            logger.warning("text_parse_failed", path=str(path), error=str(e))
-            return ""
+            # UTF-8 실패 시 latin-1로 다시 디코딩 (모든 바이트를 디코딩할 수 있음)
+            return _decode_text(data, "latin-1")
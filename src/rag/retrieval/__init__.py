@@ -5,12 +5,14 @@
 
 from rag.retrieval.bm25 import BM25Searcher
 from rag.retrieval.searcher import HybridSearcher
+from rag.retrieval.semantic_cache import SemanticCache
 from rag.retrieval.tokenizer import tokenize_query, tokenize_content
 
 
 __all__ = [
     "BM25Searcher",
     "HybridSearcher",
+    "SemanticCache",
     "tokenize_query",
     "tokenize_content",
 ]
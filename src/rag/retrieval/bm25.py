@@ -26,23 +26,47 @@ class BM25Searcher:
     def __init__(self):
         self.bm25: BM25Okapi | None = None
         self.chunks: List[Chunk] = []
+        # 증분 추가 시 기존 청크를 다시 토크나이징하지 않도록 보관
+        self.tokenized_corpus: List[List[str]] = []
         
     def index(self, chunks: List[Chunk]) -> None:
-        """청크 인덱싱
+        """청크 인덱싱 (기존 코퍼스 대체)
         
         Args:
             chunks: 인덱싱할 청크 리스트
         """
-        self.chunks = chunks
+        self.chunks = list(chunks)
         
         # 코퍼스 토크나이징
-        tokenized_corpus = [
+        self.tokenized_corpus = [
             tokenize_content(chunk.content)
             for chunk in chunks
         ]
         
-        self.bm25 = BM25Okapi(tokenized_corpus)
+        self.bm25 = BM25Okapi(self.tokenized_corpus)
         logger.info("bm25_indexed", count=len(chunks))
+    
+    def add(self, chunks: List[Chunk]) -> None:
+        """기존 코퍼스에 청크 추가
+        
+        BM25 통계(IDF, 평균 문서 길이)는 전체 코퍼스 기준이므로 재구축하되,
+        토크나이징은 새 청크에만 수행합니다.
+        
+        Args:
+            chunks: 추가할 청크 리스트
+        """
+        if not chunks:
+            return
+        
+        # 토큰 캐시가 없는 이전 형식 인덱스는 한 번 재토크나이징
+        if len(self.tokenized_corpus) != len(self.chunks):
+            self.tokenized_corpus = [tokenize_content(chunk.content) for chunk in self.chunks]
+        
+        self.chunks.extend(chunks)
+        self.tokenized_corpus.extend(tokenize_content(chunk.content) for chunk in chunks)
+        
+        self.bm25 = BM25Okapi(self.tokenized_corpus)
+        logger.info("bm25_chunks_added", count=len(chunks), total=len(self.chunks))
         
     def search(self, query: str, top_k: int = 5) -> List[Tuple[Chunk, float]]:
         """키워드 검색
@@ -60,16 +84,13 @@ class BM25Searcher:
         tokenized_query = tokenize_query(query)
         scores = self.bm25.get_scores(tokenized_query)
         
-        # 점수 내림차순 정렬
-        top_n_indices = np.argsort(scores)[::-1][:top_k]
+        # 관련성 있는(양수) 문서 중 상위 top_k만 부분 선택 후 정렬 (전체 정렬 O(N log N) 회피)
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        top_n_indices = candidates[np.argsort(-scores[candidates], kind="stable")]
         
-        results = []
-        for idx in top_n_indices:
-            score = scores[idx]
-            if score > 0:  # 관련성 있는 것만
-                results.append((self.chunks[idx], float(score)))
-                
-        return results
+        return [(self.chunks[idx], float(scores[idx])) for idx in top_n_indices]
     
     def get_full_scores(self, query: str) -> np.ndarray:
         """전체 문서에 대한 점수 반환 (Hybrid 검색용)"""
@@ -77,7 +98,7 @@ class BM25Searcher:
             return np.array([])
             
         tokenized_query = tokenize_query(query)
-        return np.array(self.bm25.get_scores(tokenized_query))
+        return np.asarray(self.bm25.get_scores(tokenized_query))
 
     def save(self, path: Path) -> None:
         """인덱스 저장"""
@@ -89,7 +110,8 @@ class BM25Searcher:
         with open(path / "bm25.pkl", "wb") as f:
             pickle.dump({
                 "bm25": self.bm25,
-                "chunks": self.chunks
+                "chunks": self.chunks,
+                "tokenized_corpus": self.tokenized_corpus,
             }, f)
             
     def load(self, path: Path) -> None:
@@ -99,5 +121,6 @@ class BM25Searcher:
                 data = pickle.load(f)
                 self.bm25 = data["bm25"]
                 self.chunks = data["chunks"]
+                self.tokenized_corpus = data.get("tokenized_corpus", [])
         except FileNotFoundError:
             logger.warning("bm25_index_not_found", path=str(path))
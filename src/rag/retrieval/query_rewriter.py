@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+from collections import OrderedDict
 from typing import Optional
 
 from rag.generation.llm import LLM, get_llm
@@ -41,13 +43,17 @@ class QueryRewriter:
     LLM을 사용하여 원본 질문을 여러 검색 쿼리로 확장합니다.
     """
     
-    def __init__(self, llm: Optional[LLM] = None):
+    def __init__(self, llm: Optional[LLM] = None, max_cache_items: int = 2048):
         """QueryRewriter 초기화
         
         Args:
             llm: LLM 인스턴스 (None이면 config에 따라 자동 생성)
+            max_cache_items: 재작성 결과 LRU 캐시 최대 항목 수 (0이면 비활성화)
         """
         self.llm = llm or get_llm()
+        self.max_cache_items = max_cache_items
+        self._cache: OrderedDict[tuple[str, int], list[str]] = OrderedDict()
+        self._lock = threading.Lock()
     
     def rewrite(self, query: str, num_queries: int = 3) -> list[str]:
         """질문을 여러 변형으로 재작성
@@ -59,6 +65,13 @@ class QueryRewriter:
         Returns:
             재작성된 질문 리스트 (원본 포함)
         """
+        key = (query, num_queries)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return list(cached)
+        
         try:
             prompt = REWRITE_PROMPT.format(query=query)
             response = self.llm.generate(prompt)
@@ -72,8 +85,10 @@ class QueryRewriter:
                     original=query,
                     rewritten_count=len(rewritten),
                 )
-                # 원본 질문 + 재작성된 질문들
-                return [query] + rewritten[:num_queries]
+                # 원본 질문 + 재작성된 질문들 (성공한 결과만 캐싱)
+                queries = [query] + rewritten[:num_queries]
+                self._remember(key, queries)
+                return queries
             
         except Exception as e:
             logger.warning("query_rewrite_failed", error=str(e))
@@ -81,6 +96,16 @@ class QueryRewriter:
         # 실패 시 원본만 반환
         return [query]
     
+    def _remember(self, key: tuple[str, int], queries: list[str]) -> None:
+        """재작성 결과를 LRU 캐시에 저장"""
+        if self.max_cache_items <= 0:
+            return
+        with self._lock:
+            self._cache[key] = list(queries)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_items:
+                self._cache.popitem(last=False)
+    
     def _parse_response(self, response: str) -> list[str]:
         """LLM 응답에서 JSON 배열 파싱
         
@@ -2,20 +2,38 @@
 
 Cross-Encoder를 사용하여 검색 결과를 재정렬합니다.
 1차 검색(Bi-Encoder) 결과를 받아 2차 정밀 점수를 계산합니다.
+
+백엔드:
+    - cross_encoder: sentence-transformers CrossEncoder (torch)
+    - flashrank: FlashRank ONNX Runtime (경량, CPU 추론 고속)
 """
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from sentence_transformers import CrossEncoder
+try:
+    from flashrank import Ranker, RerankRequest
+    HAS_FLASHRANK = True
+except ImportError:
+    HAS_FLASHRANK = False
 
 from rag.chunking.chunk import Chunk
+from rag.config import get_config
 from rag.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+DEFAULT_RERANKER_MODEL = "BAAI/bge-reranker-v2-m3"
+# FlashRank 기본 모델 (영어 전용, 다국어는 ms-marco-MultiBERT-L-12)
+FLASHRANK_DEFAULT_MODEL = "ms-marco-TinyBERT-L-2-v2"
+
+# 후보가 이 개수 이상이면 FlashRank 점수 계산을 서브 배치로 나눠 병렬 실행
+PARALLEL_MIN_PASSAGES = 16
+
 
 class Reranker:
     """Cross-Encoder 기반 Reranker
@@ -26,26 +44,78 @@ class Reranker:
     
     def __init__(
         self,
-        model_name: str = "BAAI/bge-reranker-v2-m3",
+        model_name: str = DEFAULT_RERANKER_MODEL,
         device: Optional[str] = None,
+        backend: Optional[str] = None,
     ):
         """Reranker 초기화
         
         Args:
             model_name: Cross-Encoder 모델 이름
-            device: 실행 디바이스 (None이면 자동 선택)
+                (flashrank 백엔드에서 기본 모델이면 FLASHRANK_DEFAULT_MODEL로 대체)
+            device: 실행 디바이스 (None이면 자동 선택, cross_encoder 전용)
+            backend: 'cross_encoder' 또는 'flashrank'. None이면 config 설정을 따름.
         """
+        self.backend = backend or get_config().retrieval.reranker_backend
+        self.pool_size = min(4, os.cpu_count() or 1)
+        
+        if self.backend == "flashrank":
+            if not HAS_FLASHRANK:
+                raise ImportError("flashrank 백엔드를 사용하려면 'pip install flashrank'가 필요합니다.")
+            if model_name == DEFAULT_RERANKER_MODEL:
+                model_name = FLASHRANK_DEFAULT_MODEL
+        
         self.model_name = model_name
         
-        logger.info("loading_reranker", model=model_name)
+        logger.info("loading_reranker", model=model_name, backend=self.backend)
         
-        self.model = CrossEncoder(
-            model_name,
-            max_length=512,
-            device=device,
-        )
+        if self.backend == "flashrank":
+            self.model = Ranker(model_name=model_name, max_length=512)
+        else:
+            # torch 임포트 비용은 Reranker를 실제로 사용할 때만 지불
+            from sentence_transformers import CrossEncoder
+            self.model = CrossEncoder(
+                model_name,
+                max_length=512,
+                device=device,
+            )
         
-        logger.info("reranker_loaded", model=model_name)
+        logger.info("reranker_loaded", model=model_name, backend=self.backend)
+    
+    def _score(self, query: str, chunks: list[tuple[Chunk, float]]) -> list[float]:
+        """질문-문서 쌍의 관련성 점수 계산 (입력 순서 유지)"""
+        if self.backend == "flashrank":
+            passages = [
+                {"id": i, "text": chunk.content}
+                for i, (chunk, _) in enumerate(chunks)
+            ]
+            
+            # ONNX Runtime 세션 실행은 GIL을 해제하고 스레드 안전하므로
+            # 후보가 많으면 서브 배치를 동시에 실행
+            if self.pool_size > 1 and len(passages) >= PARALLEL_MIN_PASSAGES:
+                step = -(-len(passages) // self.pool_size)
+                batches = [passages[i:i + step] for i in range(0, len(passages), step)]
+                with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+                    results = [
+                        result
+                        for batch_results in executor.map(
+                            lambda batch: self.model.rerank(RerankRequest(query=query, passages=batch)),
+                            batches,
+                        )
+                        for result in batch_results
+                    ]
+            else:
+                results = self.model.rerank(RerankRequest(query=query, passages=passages))
+            
+            # FlashRank는 점수순으로 정렬해 반환하므로 id로 원래 위치에 복원
+            scores = [0.0] * len(chunks)
+            for result in results:
+                scores[result["id"]] = float(result["score"])
+            return scores
+        
+        # 질문-문서 쌍 생성
+        pairs = [(query, chunk.content) for chunk, _ in chunks]
+        return [float(score) for score in self.model.predict(pairs)]
     
     def rerank(
         self,
@@ -66,15 +136,11 @@ class Reranker:
         if not chunks:
             return []
         
-        # 질문-문서 쌍 생성
-        pairs = [(query, chunk.content) for chunk, _ in chunks]
-        
-        # Cross-Encoder 점수 계산
-        scores = self.model.predict(pairs)
+        scores = self._score(query, chunks)
         
         # 청크와 새 점수 매핑
         reranked = [
-            (chunk, float(score))
+            (chunk, score)
             for (chunk, _), score in zip(chunks, scores)
         ]
         
@@ -6,6 +6,7 @@ RRF(Reciprocal Rank Fusion) 또는 Weighted Sum 방식을 지원합니다.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, List, Literal, Tuple
 
@@ -48,6 +49,12 @@ def rrf_score(rank: int, k: int = 60) -> float:
     return 1.0 / (k + rank)
 
 
+def _chunk_index_or_missing(chunk: Chunk) -> int:
+    """BM25 점수 매핑용 chunk_index 반환 (없으면 -1)"""
+    chunk_idx = chunk.metadata.get("chunk_index")
+    return -1 if chunk_idx is None else chunk_idx
+
+
 class HybridSearcher:
     """하이브리드 검색기"""
     
@@ -57,16 +64,21 @@ class HybridSearcher:
         self.bm25 = BM25Searcher()
         
     def index(self, chunks: List[Chunk], embeddings: np.ndarray | None = None) -> None:
-        """인덱스 구축
+        """인덱스에 청크 추가 (BM25 + 벡터)
         
         Args:
             chunks: 청크 리스트
             embeddings: 임베딩 벡터 (이미 생성된 경우)
         """
-        # BM25 인덱싱
-        self.bm25.index(chunks)
-        
-        # 벡터 인덱싱 (임베딩이 없으면 생성)
+        self.add_keywords(chunks)
+        self.add_vectors(chunks, embeddings)
+    
+    def add_keywords(self, chunks: List[Chunk]) -> None:
+        """BM25 인덱스에 청크 추가"""
+        self.bm25.add(chunks)
+    
+    def add_vectors(self, chunks: List[Chunk], embeddings: np.ndarray | None = None) -> None:
+        """벡터 저장소에 청크 추가 (임베딩이 없으면 생성)"""
         if embeddings is None:
             contents = [c.content for c in chunks]
             embeddings = self.embedder.embed(contents)
@@ -82,6 +94,7 @@ class HybridSearcher:
         rrf_k: int = 60,
         user_id: str | None = None,  # 사용자 ID 필터
         source_filter: str | None = None,  # 문서 필터
+        query_vec: np.ndarray | None = None,  # 미리 계산된 쿼리 임베딩
         **kwargs: Any,
     ) -> List[Tuple[Chunk, float]]:
         """하이브리드 검색
@@ -94,18 +107,62 @@ class HybridSearcher:
             rrf_k: RRF 상수 (기본값 60)
             user_id: 사용자 ID (이 사용자의 문서만 검색)
             source_filter: 특정 문서로 검색 제한 (파일명)
+            query_vec: 쿼리 임베딩 (None이면 내부에서 생성)
 
         Returns:
             (청크, 최종 점수) 튜플 리스트
         """
+        if query_vec is None:
+            query_vec = self.embedder.embed_query(query)
+
         if fusion_type == "rrf":
-            return self._search_rrf(query, top_k, rrf_k, user_id=user_id, source_filter=source_filter, **kwargs)
+            return self._search_rrf(query, query_vec, top_k, rrf_k, user_id=user_id, source_filter=source_filter, **kwargs)
         else:
-            return self._search_weighted(query, top_k, alpha, user_id=user_id, source_filter=source_filter, **kwargs)
+            return self._search_weighted(query, query_vec, top_k, alpha, user_id=user_id, source_filter=source_filter, **kwargs)
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        max_workers: int | None = None,
+        query_vecs: np.ndarray | None = None,
+        **kwargs: Any,
+    ) -> List[List[Tuple[Chunk, float]]]:
+        """여러 쿼리 동시 검색 (Query Rewriting 확장 검색용)
+
+        쿼리 임베딩은 한 번의 배치 호출로 생성하고(Embedder 동시 호출 회피),
+        쿼리별 BM25/벡터 검색은 스레드 풀에서 동시에 수행합니다.
+        (FAISS 검색과 NumPy 연산 중에는 GIL이 해제됨)
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리별 반환 개수
+            max_workers: 스레드 수 (None이면 쿼리 수)
+            query_vecs: 미리 계산된 쿼리 임베딩 (shape=[N, dim], None이면 배치 생성)
+            **kwargs: search()에 전달할 추가 인자
+
+        Returns:
+            입력 순서와 동일한 쿼리별 검색 결과 리스트
+        """
+        if not queries:
+            return []
+
+        if query_vecs is None:
+            query_vecs = self.embedder.embed(queries)
+
+        def _search(i: int) -> List[Tuple[Chunk, float]]:
+            return self.search(queries[i], top_k=top_k, query_vec=query_vecs[i:i + 1], **kwargs)
+
+        if len(queries) == 1:
+            return [_search(0)]
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(queries)) as executor:
+            return list(executor.map(_search, range(len(queries))))
 
     def _search_rrf(
         self,
         query: str,
+        query_vec: np.ndarray,
         top_k: int,
         rrf_k: int = 60,
         user_id: str | None = None,
@@ -120,7 +177,6 @@ class HybridSearcher:
         bm25_results = self.bm25.search(query, top_k=top_k * 2)
 
         # 2. 벡터 검색 (순위용) - user_id 필터 적용
-        query_vec = self.embedder.embed_query(query)
         vec_results = self.vector_store.search(query_vec, top_k=top_k * 2, user_id=user_id)
 
         if not bm25_results and not vec_results:
@@ -171,6 +227,7 @@ class HybridSearcher:
     def _search_weighted(
         self,
         query: str,
+        query_vec: np.ndarray,
         top_k: int,
         alpha: float = 0.5,
         user_id: str | None = None,
@@ -184,9 +241,6 @@ class HybridSearcher:
         # BM25 점수 계산
         bm25_scores = self.bm25.get_full_scores(query)
 
-        # 벡터 쿼리
-        query_vec = self.embedder.embed_query(query)
-
         # 1차 검색 (후보군 추출) - user_id 필터 적용
         candidates = self.vector_store.search(query_vec, top_k=top_k * 3, user_id=user_id)
 
@@ -204,57 +258,52 @@ class HybridSearcher:
         if not candidates:
             return []
 
-        # 점수 결합
-        hybrid_results = []
+        # 점수 결합 (후보 단위 Python 루프 없이 배열 연산으로 처리)
+        cand_chunks = [chunk for chunk, _ in candidates]
+        n_cand = len(cand_chunks)
 
-        vec_scores = np.array([score for _, score in candidates])
         # 코사인 유사도(-1~1)는 그대로 사용 (상대적 순위보다 절대적 유사도가 중요)
-        norm_vec_scores = vec_scores
-        # norm_vec_scores = min_max_normalize(vec_scores)
-
-        for i, (chunk, _) in enumerate(candidates):
-            chunk_idx = chunk.metadata.get("chunk_index")
-            current_bm25_score = 0.0
-
-            # BM25 인덱스가 있고 해당 청크가 범위 내에 있을 때만 점수 매핑
-            if len(bm25_scores) > 0 and chunk_idx is not None and chunk_idx < len(bm25_scores):
-                current_bm25_score = bm25_scores[chunk_idx]
+        vec_scores = np.fromiter(
+            (score for _, score in candidates), dtype=np.float64, count=n_cand
+        )
 
-            hybrid_results.append({
-                "chunk": chunk,
-                "vec_score": norm_vec_scores[i],
-                "bm25_score": current_bm25_score
-            })
+        # BM25 인덱스가 있고 해당 청크가 범위 내에 있을 때만 점수 매핑 (gather)
+        cand_bm25_scores = np.zeros(n_cand, dtype=np.float64)
+        if len(bm25_scores) > 0:
+            chunk_idx = np.fromiter(
+                (_chunk_index_or_missing(chunk) for chunk in cand_chunks),
+                dtype=np.int64,
+                count=n_cand,
+            )
+            valid = (chunk_idx >= 0) & (chunk_idx < len(bm25_scores))
+            cand_bm25_scores[valid] = bm25_scores[chunk_idx[valid]]
 
         # BM25 점수 정규화 (점수가 있는 경우에만)
-        cand_bm25_scores = np.array([r["bm25_score"] for r in hybrid_results])
         if np.max(cand_bm25_scores) > 0:
             norm_bm25_scores = min_max_normalize(cand_bm25_scores)
         else:
             norm_bm25_scores = np.zeros_like(cand_bm25_scores)
 
-        # 최종 점수 계산 및 정렬
-        final_results = []
-        for i, res in enumerate(hybrid_results):
-            final_score = (alpha * res["vec_score"]) + ((1 - alpha) * norm_bm25_scores[i])
-            final_results.append((res["chunk"], final_score))
-
-        final_results.sort(key=lambda x: x[1], reverse=True)
+        # 최종 점수 계산
+        final_scores = alpha * vec_scores + (1 - alpha) * norm_bm25_scores
 
-        # 점수 임계값 필터링
-        filtered_results = [
-            (chunk, score) for chunk, score in final_results
-            if score >= kwargs.get("score_threshold", 0.0)
-        ]
+        # 점수 임계값 필터링 후 내림차순 정렬 (동점은 벡터 검색 순서 유지)
+        keep = np.flatnonzero(final_scores >= kwargs.get("score_threshold", 0.0))
+        order = keep[np.argsort(-final_scores[keep], kind="stable")][:top_k]
 
-        return filtered_results[:top_k]
+        return [(cand_chunks[i], float(final_scores[i])) for i in order]
     
     def save(self, path: Path) -> None:
         """인덱스 저장"""
         self.vector_store.save(path)
         self.bm25.save(path)
         
-    def load(self, path: Path) -> None:
-        """인덱스 로드"""
-        self.vector_store.load(path)
+    def load(self, path: Path, mmap: bool = False) -> None:
+        """인덱스 로드
+        
+        Args:
+            path: 인덱스 디렉토리
+            mmap: 벡터 인덱스를 읽기 전용 메모리 매핑으로 로드 (검색 전용 프로세스용)
+        """
+        self.vector_store.load(path, mmap=mmap)
         self.bm25.load(path)
@@ -0,0 +1,167 @@
+"""시맨틱 검색 캐시
+
+쿼리 임베딩의 코사인 유사도로 캐시를 조회하여, 표현만 다른 유사 질의
+("X가 뭐야?" / "X에 대해 알려줘")에 대해 하이브리드 검색을 다시 수행하지 않습니다.
+
+랜덤 프로젝션 LSH(SimHash)로 후보를 좁힌 뒤 실제 코사인 유사도로 검증합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+import numpy as np
+
+from rag.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """임베딩 유사도 기반 LRU 캐시"""
+
+    def __init__(
+        self,
+        dim: int,
+        n_tables: int = 8,
+        n_bits: int = 16,
+        threshold: float = 0.95,
+        max_entries: int = 1024,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            dim: 임베딩 차원
+            n_tables: LSH 해시 테이블 수 (많을수록 재현율 증가)
+            n_bits: 테이블당 해시 비트 수 (최대 64, 많을수록 버킷이 좁아짐)
+            threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+            max_entries: 최대 항목 수 (초과 시 LRU 제거)
+            seed: 프로젝션 난수 시드
+        """
+        if not 0 < n_bits <= 64:
+            raise ValueError(f"n_bits must be in 1..64, got {n_bits}")
+
+        self.dim = dim
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        rng = np.random.default_rng(seed)
+        self.projections = rng.standard_normal((n_tables, n_bits, dim)).astype(np.float32)
+        self._bit_weights = np.left_shift(np.uint64(1), np.arange(n_bits, dtype=np.uint64))
+
+        # 테이블별 버킷 -> 항목 ID 집합
+        self._tables: list[dict[int, set[int]]] = [{} for _ in range(n_tables)]
+        # 항목 ID -> (단위 벡터, scope, payload, 버킷 키 리스트)
+        self._entries: OrderedDict[int, tuple[np.ndarray, Hashable, Any, list[int]]] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, vector: np.ndarray, scope: Hashable = None) -> Any | None:
+        """유사 쿼리의 캐시 값 조회
+
+        Args:
+            vector: 쿼리 임베딩 (shape=[dim] 또는 [1, dim])
+            scope: 결과에 영향을 주는 검색 조건 (일치하는 항목만 적중)
+
+        Returns:
+            가장 유사한 항목의 payload (임계값 미만이면 None)
+        """
+        unit = self._as_unit(vector)
+        if unit is None:
+            return None
+
+        buckets = self._buckets(unit)
+
+        with self._lock:
+            candidate_ids = set()
+            for table, bucket in zip(self._tables, buckets):
+                candidate_ids.update(table.get(bucket, ()))
+
+            candidate_ids = [i for i in candidate_ids if self._entries[i][1] == scope]
+            if not candidate_ids:
+                self.misses += 1
+                return None
+
+            matrix = np.stack([self._entries[i][0] for i in candidate_ids])
+            sims = matrix @ unit
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            entry_id = candidate_ids[best]
+            self._entries.move_to_end(entry_id)
+            self.hits += 1
+            logger.debug("semantic_cache_hit", similarity=float(sims[best]))
+            return self._entries[entry_id][2]
+
+    def set(self, vector: np.ndarray, payload: Any, scope: Hashable = None) -> None:
+        """쿼리 임베딩에 대한 값 저장
+
+        Args:
+            vector: 쿼리 임베딩 (shape=[dim] 또는 [1, dim])
+            payload: 저장할 값 (검색 결과 등)
+            scope: 결과에 영향을 주는 검색 조건
+        """
+        unit = self._as_unit(vector)
+        if unit is None:
+            return
+
+        buckets = self._buckets(unit)
+
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+
+            self._entries[entry_id] = (unit, scope, payload, buckets)
+            for table, bucket in zip(self._tables, buckets):
+                table.setdefault(bucket, set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        with self._lock:
+            self._entries.clear()
+            for table in self._tables:
+                table.clear()
+
+    def stats(self) -> dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _as_unit(self, vector: np.ndarray) -> np.ndarray | None:
+        """1차원 단위 벡터로 변환 (영벡터면 None)"""
+        vec = np.asarray(vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vec))
+        if norm == 0.0:
+            return None
+        return vec / norm
+
+    def _buckets(self, unit: np.ndarray) -> list[int]:
+        """테이블별 버킷 키 (프로젝션 부호 비트를 정수로 압축)"""
+        signs = (self.projections @ unit) > 0  # [n_tables, n_bits]
+        keys = (signs.astype(np.uint64) * self._bit_weights).sum(axis=1, dtype=np.uint64)
+        return [int(k) for k in keys]
+
+    def _remove(self, entry_id: int) -> None:
+        """항목 삭제 (호출자가 lock 보유)"""
+        _, _, _, buckets = self._entries.pop(entry_id)
+        for table, bucket in zip(self._tables, buckets):
+            ids = table.get(bucket)
+            if ids is None:
+                continue
+            ids.discard(entry_id)
+            if not ids:
+                del table[bucket]
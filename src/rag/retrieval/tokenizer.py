@@ -5,15 +5,29 @@
 
 from __future__ import annotations
 
+import threading
 from typing import List
 
 try:
     from kiwipiepy import Kiwi
-    _kiwi = Kiwi()
     HAS_KIWI = True
 except ImportError:
     HAS_KIWI = False
 
+# Kiwi 모델 로딩은 수백 ms가 걸리므로 첫 토크나이징 시점에 생성
+_kiwi = None
+_kiwi_lock = threading.Lock()
+
+
+def _get_kiwi() -> Kiwi:
+    """지연 초기화된 Kiwi 인스턴스 반환 (동시 첫 호출 시 한 번만 로딩)"""
+    global _kiwi
+    if _kiwi is None:
+        with _kiwi_lock:
+            if _kiwi is None:
+                _kiwi = Kiwi()
+    return _kiwi
+
 
 def tokenize_query(query: str, language: str = "ko") -> List[str]:
     """쿼리 토크나이징
@@ -28,7 +42,7 @@ def tokenize_query(query: str, language: str = "ko") -> List[str]:
     if language == "ko" and HAS_KIWI:
         # 명사, 동사, 형용사, 어근 등 실질 형태소만 추출
         tokens = []
-        for token in _kiwi.tokenize(query):
+        for token in _get_kiwi().tokenize(query):
             if token.tag.startswith(('N', 'V', 'VA', 'XR', 'SL')):
                 tokens.append(token.form)
         return tokens
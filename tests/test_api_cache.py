@@ -0,0 +1,131 @@
+"""API 응답 캐시 테스트"""
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+from api.cache import SmartRAGCache, make_cache_key
+from api.schemas import ChunkReference
+from rag.chunking.chunk import Chunk
+
+
+class TestSmartRAGCache:
+    """SmartRAGCache 테스트"""
+
+    def test_get_set(self):
+        """저장한 값 조회 및 적중/미스 통계"""
+        cache = SmartRAGCache()
+        assert cache.get("a") is None
+
+        cache.set("a", "value", size_bytes=5)
+
+        assert cache.get("a") == "value"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["bytes"] == 5
+
+    def test_lru_eviction_by_count(self):
+        """항목 수 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = SmartRAGCache(maxsize=2)
+        cache.set("a", 1, size_bytes=1)
+        cache.set("b", 2, size_bytes=1)
+        cache.get("a")
+        cache.set("c", 3, size_bytes=1)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """누적 크기 초과 시 제거, 상한보다 큰 값은 저장하지 않음"""
+        cache = SmartRAGCache(max_bytes=10)
+        cache.set("a", 1, size_bytes=6)
+        cache.set("b", 2, size_bytes=6)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.set("huge", 3, size_bytes=11)
+        assert cache.get("huge") is None
+        assert cache.stats()["bytes"] == 6
+
+    def test_ttl_expiry(self):
+        """TTL이 지나면 미스 처리"""
+        cache = SmartRAGCache(ttl=0.01)
+        cache.set("a", 1, size_bytes=1)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats()["size"] == 0
+
+
+class TestMakeCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_fields_affect_key(self, tmp_path):
+        """필드 값이 다르면 키가 다르고, 순서는 무관"""
+        key = make_cache_key("ask", tmp_path, query="q", top_k=5)
+
+        assert key == make_cache_key("ask", tmp_path, top_k=5, query="q")
+        assert key != make_cache_key("ask", tmp_path, query="q", top_k=3)
+        assert key != make_cache_key("search", tmp_path, query="q", top_k=5)
+
+    def test_reindex_changes_key(self, tmp_path):
+        """인덱스 파일이 갱신되면 키가 바뀜"""
+        index_file = tmp_path / "faiss.index"
+        index_file.write_bytes(b"v1")
+        key = make_cache_key("search", tmp_path, query="q")
+
+        stat = index_file.stat()
+        os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert key != make_cache_key("search", tmp_path, query="q")
+
+
+class TestChunkReference:
+    """ChunkReference 테스트"""
+
+    def test_from_chunk_coerces_source(self):
+        """검증 없이 생성해도 출처는 항상 문자열"""
+        assert ChunkReference.from_chunk(Chunk("본문", {"source": "a.md"}), 0.5).source == "a.md"
+        assert ChunkReference.from_chunk(Chunk("본문", {"source": None}), 0.5).source == "unknown"
+        assert ChunkReference.from_chunk(Chunk("본문", {}), 0.5).source == "unknown"
+
+        ref = ChunkReference.from_chunk(Chunk("본문", {"source": 3}), 1)
+        assert ref.model_dump() == {"content": "본문", "source": "3", "score": 1.0}
+
+
+class TestAskStreamCache:
+    """스트리밍 답변 캐시 테스트"""
+
+    def test_error_midway_not_cached(self, tmp_path):
+        """토큰 몇 개 뒤 오류가 오면 스트림 응답을 캐싱하지 않음"""
+        from api.routes import ask as ask_route
+        from api.schemas import AskRequest
+
+        class _BrokenStreamLLM:
+            async def generate_stream_async(self, prompt):
+                for text in ["부분 ", "답변 ", "오류 발생: connection reset"]:
+                    yield text
+
+        async def fake_search(request, searcher):
+            chunk = Chunk("본문", {"source": "a.md"})
+            return [chunk], [(chunk, 0.9)]
+
+        async def consume():
+            response = await ask_route.ask_stream(
+                AskRequest(query="질문"), index_path=tmp_path, searcher=None
+            )
+            return b"".join([frame async for frame in response.body_iterator])
+
+        cache = SmartRAGCache()
+        with patch.object(ask_route, "get_cache", return_value=cache), \
+             patch.object(ask_route, "_search_documents", fake_search), \
+             patch.object(ask_route, "get_llm", return_value=_BrokenStreamLLM()):
+            body = asyncio.run(consume())
+
+        assert body.endswith(ask_route.SSE_DONE)
+        assert cache.stats()["size"] == 0
@@ -1,14 +1,18 @@
 """Chunking 모듈 테스트"""
 
+import pickle
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import pytest
 
 from rag.chunking import (
     Chunk,
+    iter_split_text,
     split_text,
     split_markdown,
     chunk_document,
+    chunk_documents,
 )
 from rag.ingestion.document import Document
 
@@ -29,12 +33,74 @@ class TestChunk:
         assert chunk.content == "Test content"
         assert chunk.metadata["chunk_index"] == 0
         assert chunk.metadata["source"] == "/path/to/file.txt"
-    
+
+    def test_create_chunk_with_extra_metadata(self) -> None:
+        """추가 메타데이터를 생성 시 함께 저장"""
+        chunk = Chunk.create(
+            content="Test content",
+            source="a.txt",
+            chunk_index=0,
+            start_char=0,
+            end_char=12,
+            chunking_strategy="semantic",
+            sentence_count=2,
+        )
+
+        assert chunk.metadata["chunking_strategy"] == "semantic"
+        assert chunk.metadata["sentence_count"] == 2
+        assert chunk.metadata["header_path"] == ""
+
     def test_chunk_length(self) -> None:
         """Chunk 길이 반환 확인"""
         chunk = Chunk(content="12345")
         
         assert len(chunk) == 5
+    
+    def test_content_hash_uses_full_content(self) -> None:
+        """접두어가 같아도 본문이 다르면 해시가 다름"""
+        prefix = "# Copyright (c) Example Corp. All rights reserved.\n" * 3
+        a = Chunk(content=prefix + "import os")
+        b = Chunk(content=prefix + "import sys")
+        
+        assert a.content_hash != b.content_hash
+        assert a.content_hash == Chunk(content=prefix + "import os").content_hash
+    
+    def test_preview_is_truncated_and_not_pickled(self) -> None:
+        """미리보기는 앞 500자이며 pickle에 저장되지 않음"""
+        chunk = Chunk(content="가" * 600)
+        
+        assert chunk.preview == "가" * 500
+        assert chunk.preview is chunk.preview
+        assert pickle.loads(pickle.dumps(chunk))._preview is None
+        
+        short = Chunk(content="짧은 본문")
+        assert short.preview is short.content
+    
+    def test_pickle_roundtrip_and_legacy_state(self, monkeypatch) -> None:
+        """슬롯 Chunk pickle 왕복 및 슬롯 도입 이전 pickle 로드"""
+        import rag.chunking.chunk as chunk_module
+        
+        chunk = Chunk.create("본문", source="a.md", chunk_index=3, start_char=0, end_char=2)
+        restored = pickle.loads(pickle.dumps(chunk))
+        assert restored.content == "본문"
+        assert restored.metadata == chunk.metadata
+        
+        # __dict__ 기반 이전 클래스로 저장된 pickle 재현
+        @dataclass
+        class LegacyChunk:
+            content: str
+            metadata: dict = field(default_factory=dict)
+        LegacyChunk.__module__ = chunk_module.__name__
+        LegacyChunk.__qualname__ = "Chunk"
+        
+        with monkeypatch.context() as m:
+            m.setattr(chunk_module, "Chunk", LegacyChunk)
+            legacy_bytes = pickle.dumps([LegacyChunk("old", {"chunk_index": 1})])
+        
+        (legacy,) = pickle.loads(legacy_bytes)
+        assert isinstance(legacy, Chunk)
+        assert legacy.content == "old"
+        assert legacy.metadata == {"chunk_index": 1}
 
 
 class TestSplitText:
@@ -86,6 +152,16 @@ class TestSplitText:
         # 첫 청크의 위치 정보 확인
         assert chunks[0].metadata["start_char"] == 0
         assert chunks[0].metadata["chunk_index"] == 0
+    
+    def test_iter_split_text_matches_list(self) -> None:
+        """제너레이터 분할 결과가 리스트 분할과 동일"""
+        text = "첫 문장입니다. 두 번째 문장입니다.\n\n새 문단입니다. " * 20
+        
+        streamed = list(iter_split_text(text, chunk_size=50, chunk_overlap=10))
+        listed = split_text(text, chunk_size=50, chunk_overlap=10)
+        
+        assert [c.content for c in streamed] == [c.content for c in listed]
+        assert [c.metadata["start_char"] for c in streamed] == [c.metadata["start_char"] for c in listed]
 
 
 class TestSplitMarkdown:
@@ -124,6 +200,19 @@ Content here.
         last_chunk = chunks[-1]
         assert "header_path" in last_chunk.metadata
     
+    def test_header_path_resets_on_sibling(self) -> None:
+        """형제/상위 헤더가 나오면 이전 하위 경로가 제거됨"""
+        text = "# A\n\na\n\n## B\n\nb\n\n### C\n\nc\n\n## D\n\nd\n\n# E\n\ne\n"
+        chunks = split_markdown(text, chunk_size=1000)
+        
+        assert [c.metadata["header_path"] for c in chunks] == [
+            "# A",
+            "# A > ## B",
+            "# A > ## B > ### C",
+            "# A > ## D",
+            "# E",
+        ]
+    
     def test_large_section_gets_split(self) -> None:
         """큰 섹션은 추가 분할"""
         text = "# Title\n\n" + "A" * 500
@@ -132,6 +221,15 @@ Content here.
         # 500자 내용이 100자 청크로 분할되어야 함
         assert len(chunks) > 1
     
+    def test_header_detection_matches_pattern(self) -> None:
+        """헤더 탐색 결과가 정규식 전체 스캔과 동일"""
+        from rag.chunking.markdown import HEADER_PATTERN, _find_headers
+        
+        text = "# 제목\n본문 #아님\n####### 일곱개\n#\n\n## 하위\n\t### 탭\n### 끝"
+        
+        expected = [m.span() for m in HEADER_PATTERN.finditer(text)]
+        assert [m.span() for m in _find_headers(text)] == expected
+    
     def test_text_before_first_header(self) -> None:
         """첫 헤더 이전 텍스트 처리"""
         text = """Some intro text.
@@ -160,6 +258,7 @@ class TestChunkDocument:
         
         assert len(chunks) >= 1
         assert chunks[0].metadata["source"] == "/test/file.txt"
+        assert chunks[0].metadata["content_hash"] == chunks[0].content_hash
     
     def test_chunk_md_document(self) -> None:
         """md 문서 청킹 (Markdown 분할기 사용)"""
@@ -171,3 +270,25 @@ class TestChunkDocument:
         chunks = chunk_document(doc)
         
         assert len(chunks) >= 1
+
+
+class TestChunkDocuments:
+    """chunk_documents 병렬 청킹 테스트"""
+    
+    def test_parallel_matches_sequential(self) -> None:
+        """병렬 결과가 입력 순서 및 순차 결과와 동일"""
+        docs = [
+            Document(
+                content=f"Document {i}. " + "Some sentence here. " * 100,
+                metadata={"source": f"/test/{i}.txt", "extension": ".txt"},
+            )
+            for i in range(10)
+        ]
+        
+        parallel = list(chunk_documents(docs, max_workers=2))
+        
+        assert len(parallel) == len(docs)
+        for doc, chunks in zip(docs, parallel):
+            expected = chunk_document(doc)
+            assert [c.content for c in chunks] == [c.content for c in expected]
+            assert chunks[0].metadata["source"] == doc.metadata["source"]
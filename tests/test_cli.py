@@ -4,11 +4,13 @@ import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 from typer.testing import CliRunner
 
 from cli.main import app
 from rag.chunking.chunk import Chunk
+from rag.ingestion.document import Document
 
 
 runner = CliRunner()
@@ -21,22 +23,25 @@ class TestCLI:
     def mock_components(self):
         """Mock out core RAG components"""
         # Patching paths based on cli.commands imports
-        with patch("cli.commands.index.load_documents") as mock_load, \
-             patch("cli.commands.index.chunk_document") as mock_chunk, \
-             patch("cli.commands.index.Embedder") as mock_embedder, \
-             patch("cli.commands.index.VectorStore") as mock_store, \
+        with patch("cli.commands.index.load_files") as mock_load, \
+             patch("cli.commands.index.chunk_documents") as mock_chunk, \
+             patch("cli.commands.index.get_embedder") as mock_embedder, \
+             patch("cli.commands.index.get_vector_store") as mock_store, \
              patch("cli.commands.index.HybridSearcher") as mock_indexer, \
-             patch("cli.commands.ask.Embedder") as mock_ask_embedder, \
-             patch("cli.commands.ask.VectorStore") as mock_ask_store, \
+             patch("cli.commands.ask.get_embedder") as mock_ask_embedder, \
+             patch("cli.commands.ask.get_vector_store") as mock_ask_store, \
              patch("cli.commands.ask.HybridSearcher") as mock_searcher, \
-             patch("cli.commands.ask.GeminiLLM") as mock_llm, \
-             patch("cli.commands.search.Embedder") as mock_search_embedder, \
-             patch("cli.commands.search.VectorStore") as mock_search_store, \
+             patch("cli.commands.ask.get_llm") as mock_llm, \
+             patch("cli.commands.search.get_embedder") as mock_search_embedder, \
+             patch("cli.commands.search.get_vector_store") as mock_search_store, \
              patch("cli.commands.search.HybridSearcher") as mock_debug_searcher:
             
             # Setup mocks
-            mock_load.return_value = ["mock_doc"]
-            mock_chunk.return_value = [Chunk(content="mock content")]
+            mock_load.side_effect = lambda paths: [
+                (path, Document(content="content", metadata={"source": str(path)}))
+                for path in paths
+            ]
+            mock_chunk.return_value = [[Chunk(content="mock content")]]
             
             # Indexer mock
             indexer_instance = MagicMock()
@@ -45,12 +50,13 @@ class TestCLI:
             # Searcher mock
             searcher_instance = MagicMock()
             searcher_instance.search.return_value = [(Chunk(content="found content"), 0.9)]
+            searcher_instance.search_many.return_value = [searcher_instance.search.return_value]
             mock_searcher.return_value = searcher_instance
             mock_debug_searcher.return_value = searcher_instance
             
             # LLM mock
             llm_instance = MagicMock()
-            llm_instance.generate.return_value = "Mock Answer"
+            llm_instance.generate_stream.side_effect = lambda prompt: iter(["Mock Answer"])
             mock_llm.return_value = llm_instance
             
             yield {
@@ -77,6 +83,7 @@ class TestCLI:
             config_mock = MagicMock()
             config_mock.project.index_path = str(tmp_path / "rag_index")
             config_mock.embedding.dimension = 384
+            config_mock.ingestion.supported_extensions = [".txt", ".md"]
             mock_config.return_value = config_mock
             
             # 실행
@@ -89,7 +96,7 @@ class TestCLI:
             assert result.exit_code == 0
             assert "Successfully indexed" in result.stdout
         mock_components["load"].assert_called()
-        mock_components["indexer"].index.assert_called()
+        mock_components["indexer"].add_vectors.assert_called()
         mock_components["indexer"].save.assert_called()
 
     def test_ask_command(self, mock_components, tmp_path):
@@ -99,6 +106,7 @@ class TestCLI:
             config_mock = MagicMock()
             config_mock.project.index_path = str(tmp_path / "index")
             config_mock.embedding.dimension = 384
+            config_mock.retrieval.use_reranker = False
             mock_config.return_value = config_mock
             
             (tmp_path / "index").mkdir()  # 인덱스 디렉토리 생성
@@ -112,12 +120,10 @@ class TestCLI:
             assert result.exit_code == 0
             assert "Answer:" in result.stdout
             assert "Mock Answer" in result.stdout
-            assert "Answer:" in result.stdout
-            assert "Mock Answer" in result.stdout
             # 검색 및 생성 호출 확인
             mock_components["searcher"].load.assert_called()
-            mock_components["searcher"].search.assert_called()
-            mock_components["llm"].generate.assert_called()
+            mock_components["searcher"].search_many.assert_called()
+            mock_components["llm"].generate_stream.assert_called()
 
     def test_search_command(self, mock_components, tmp_path):
         """Search 명령어 테스트"""
@@ -139,3 +145,25 @@ class TestCLI:
             # 테이블 컬럼 확인
             assert "Rank" in result.stdout
             assert "found content" in result.stdout
+
+
+class TestMergeResults:
+    """merge_results 테스트"""
+
+    def test_vectorized_matches_small_path(self):
+        """후보 수에 따른 두 구현의 결과 동일"""
+        from cli.commands import ask
+
+        rng = np.random.default_rng(0)
+        pool = [Chunk(content=f"shared prefix {i}") for i in range(30)]
+        all_results = [
+            [(pool[j], float(round(rng.random(), 1))) for j in rng.integers(0, 30, 20)]
+            for _ in range(5)
+        ]
+
+        for top_k in (3, 15, 100):
+            vectorized = ask.merge_results(all_results, top_k=top_k)
+            with patch.object(ask, "VECTORIZED_MERGE_MIN", 10_000):
+                expected = ask.merge_results(all_results, top_k=top_k)
+
+            assert [(c.content, s) for c, s in vectorized] == [(c.content, s) for c, s in expected]
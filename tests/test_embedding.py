@@ -2,13 +2,17 @@
 
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import faiss
 import numpy as np
 import pytest
 
 from rag.chunking.chunk import Chunk
-from rag.embedding.embedder import Embedder
-from rag.embedding.faiss_store import FAISSStore as VectorStore
+from rag.embedding.cache import CachedEmbedder
+from rag.embedding.embedder import Embedder, get_embedder
+from rag.embedding.faiss_store import HAS_PYARROW, ArrowChunks, FAISSStore as VectorStore
 
 
 # 테스트용 임베딩 모델 (매우 작음)
@@ -53,6 +57,128 @@ class TestEmbedder:
         
         assert len(embedding) == 1
         assert embedding.shape[1] == 384
+    
+    def test_embed_normalizes_to_contiguous_float32(self):
+        """모델 출력은 float32 C-연속 단위 벡터로 정규화"""
+        class _RawModel:
+            def encode(self, texts, **kwargs):
+                assert not kwargs.get("normalize_embeddings")
+                assert kwargs.get("pool") is None
+                return np.array([[3.0, 4.0], [0.0, 2.0]])[:, ::-1][:len(texts)]
+
+        raw = object.__new__(Embedder)
+        raw.model = _RawModel()
+        raw.multi_process_workers = 0
+        raw._pool = None
+        embeddings = raw.embed(["a", "b"], batch_size=2)
+
+        assert embeddings.dtype == np.float32
+        assert embeddings.flags.c_contiguous
+        np.testing.assert_allclose(embeddings, [[0.8, 0.6], [1.0, 0.0]], rtol=1e-6)
+
+    def test_get_embedder_reuses_instance(self, monkeypatch):
+        """같은 모델명은 동일 인스턴스 재사용 (모델은 로드하지 않음)"""
+        import rag.embedding.embedder as embedder_module
+
+        created: list[str] = []
+
+        def _fake_embedder(model_name):
+            created.append(model_name)
+            return _CountingEmbedder()
+
+        monkeypatch.setattr(embedder_module, "Embedder", _fake_embedder)
+        embedder_module._load_embedder.cache_clear()
+
+        try:
+            assert get_embedder("counting") is get_embedder("counting")
+            assert get_embedder("other") is not get_embedder("counting")
+        finally:
+            embedder_module._load_embedder.cache_clear()
+
+        assert created == ["counting", "other"]
+
+
+class _CountingEmbedder:
+    """호출된 텍스트를 기록하는 테스트용 Embedder"""
+
+    model_name = "counting"
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts, batch_size=None):
+        self.calls.append(list(texts))
+        return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+
+class TestCachedEmbedder:
+    """CachedEmbedder 테스트"""
+
+    def test_embeds_only_misses(self):
+        """캐시 미스와 배치 내 중복은 한 번만 임베딩"""
+        inner = _CountingEmbedder()
+        cached = CachedEmbedder(inner)
+
+        first = cached.embed(["a", "bb", "a"])
+        second = cached.embed(["bb", "ccc"])
+
+        assert inner.calls == [["a", "bb"], ["ccc"]]
+        np.testing.assert_array_equal(first[0], first[2])
+        np.testing.assert_array_equal(first[1], second[0])
+        assert second.shape == (2, 2)
+
+    def test_persists_to_disk(self, tmp_path: Path):
+        """SQLite 캐시는 새 인스턴스에서도 재사용"""
+        cache_path = tmp_path / "embed_cache.sqlite"
+        CachedEmbedder(_CountingEmbedder(), cache_path=cache_path).embed(["hello"])
+
+        inner = _CountingEmbedder()
+        vectors = CachedEmbedder(inner, cache_path=cache_path).embed_query("hello")
+
+        assert inner.calls == []
+        assert vectors.dtype == np.float32
+        np.testing.assert_array_equal(vectors, [[5.0, 1.0]])
+
+    def test_disk_hit_matches_fresh_embedding(self, tmp_path: Path):
+        """float16로 저장된 디스크 캐시 적중 결과가 첫 임베딩 결과와 동일"""
+        cache_path = tmp_path / "embed_cache.sqlite"
+        fresh = CachedEmbedder(_CountingEmbedder(), cache_path=cache_path).embed(["a" * 1234])
+
+        cached = CachedEmbedder(_CountingEmbedder(), cache_path=cache_path).embed(["a" * 1234])
+
+        assert cached.dtype == np.float32
+        np.testing.assert_array_equal(cached, fresh)
+
+    def test_backend_separates_cache_entries(self, tmp_path: Path):
+        """백엔드가 다르면(int8 등) 같은 모델이어도 캐시를 공유하지 않음"""
+        cache_path = tmp_path / "embed_cache.sqlite"
+        CachedEmbedder(_CountingEmbedder(), cache_path=cache_path).embed(["hello"])
+
+        inner = _CountingEmbedder()
+        inner.backend = "onnx-int8"
+        CachedEmbedder(inner, cache_path=cache_path).embed(["hello"])
+
+        assert inner.calls == [["hello"]]
+
+
+    def test_get_embedder_memory_cache_without_path(self, monkeypatch):
+        """디스크 캐시 경로가 없어도 반복 쿼리는 메모리 캐시로 처리"""
+        import rag.embedding.embedder as embedder_module
+
+        inner = _CountingEmbedder()
+        monkeypatch.setattr(embedder_module, "_load_embedder", lambda name: inner)
+        monkeypatch.setattr(embedder_module.get_config().embedding, "cache_path", None)
+        embedder_module._load_cached_embedder.cache_clear()
+
+        try:
+            cached = get_embedder("counting", use_cache=True)
+            cached.embed_query("같은 질문")
+            cached.embed_query("같은 질문")
+        finally:
+            embedder_module._load_cached_embedder.cache_clear()
+
+        assert isinstance(cached, CachedEmbedder)
+        assert inner.calls == [["같은 질문"]]
 
 
 class TestVectorStore:
@@ -130,7 +256,8 @@ class TestVectorStore:
         
         # 파일 생성 확인
         assert (save_dir / "faiss.index").exists()
-        assert (save_dir / "chunks.pkl").exists()
+        chunks_file = "chunks.arrow" if HAS_PYARROW else "chunks.pkl"
+        assert (save_dir / chunks_file).exists()
         assert (save_dir / "meta.json").exists()
         
         # 새로운 저장소로 로드
@@ -139,3 +266,216 @@ class TestVectorStore:
         
         assert new_store.total_chunks == 3
         assert new_store.chunks[0].content == "Apple is a fruit"
+    
+    @pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow not installed")
+    def test_arrow_chunks_lazy_load(self, store, sample_data, tmp_path: Path):
+        """Arrow 파일 로드 시 청크는 지연 복원되고 검색/필터/추가/재저장 가능"""
+        chunks, embeddings = sample_data
+        chunks[2].metadata["user_id"] = "bob"
+        store.add(chunks, embeddings)
+        store.save(tmp_path / "arrow_index")
+
+        new_store = VectorStore(dimension=384)
+        new_store.load(tmp_path / "arrow_index")
+        assert isinstance(new_store.chunks, ArrowChunks)
+        assert new_store.chunks[1].metadata == {"id": 2}
+        assert new_store.chunks.user_ids() == ["", "", "bob"]
+        assert [c.content for c in new_store.chunks[0:2]] == ["Apple is a fruit", "Banana is yellow"]
+
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        assert new_store.search(query, top_k=1)[0][0].content == "Apple is a fruit"
+        assert new_store.search(query, top_k=3, user_id="bob")[0][0].content == "Sky is blue"
+
+        # 매핑된 파일 위에 다시 저장해도 기존 청크를 읽을 수 있음
+        new_store.save(tmp_path / "arrow_index")
+        assert new_store.chunks[0].content == "Apple is a fruit"
+
+        new_store.add([Chunk(content="Extra", metadata={"user_id": "bob"})], embeddings[:1])
+        assert new_store.total_chunks == 4
+        assert new_store.chunks[-1].content == "Extra"
+        assert [c.content for c, _ in new_store.search(query, top_k=3, user_id="bob")] == [
+            "Extra",
+            "Sky is blue",
+        ]
+
+    def test_load_mmap_read_only(self, store, sample_data, tmp_path: Path):
+        """mmap 로드 시 검색 가능, 추가는 거부"""
+        chunks, embeddings = sample_data
+        store.add(chunks, embeddings)
+        store.save(tmp_path / "mmap_index")
+        
+        new_store = VectorStore(dimension=384)
+        new_store.load(tmp_path / "mmap_index", mmap=True)
+        
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        assert new_store.search(query, top_k=1)[0][0].content == "Apple is a fruit"
+        
+        with pytest.raises(RuntimeError):
+            new_store.add(chunks, embeddings)
+
+    def test_search_with_user_id_filter(self, store, sample_data):
+        """user_id 필터 검색 시 해당 사용자 청크만 반환"""
+        chunks, embeddings = sample_data
+        chunks[0].metadata["user_id"] = "alice"
+        chunks[2].metadata["user_id"] = "bob"
+        store.add(chunks, embeddings)
+        
+        # Apple과 가장 유사한 쿼리지만 bob의 청크만 검색되어야 함
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        results = store.search(query, top_k=3, user_id="bob")
+        
+        assert len(results) == 1
+        assert results[0][0].content == "Sky is blue"
+        
+        assert store.search(query, top_k=3, user_id="nobody") == []
+
+    def test_user_filter_on_quantized_index(self, sample_data):
+        """양자화 인덱스는 벡터를 복원하지 않고 FAISS 안에서 사용자 필터 검색"""
+        chunks, embeddings = sample_data
+        chunks[0].metadata["user_id"] = "alice"
+        chunks[2].metadata["user_id"] = "bob"
+        store = VectorStore(dimension=384, quantization="fp16")
+        store.add(chunks, embeddings)
+        
+        assert store._flat_vectors() is None
+        
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        results = store.search(query, top_k=3, user_id="bob")
+        
+        assert [c.content for c, _ in results] == ["Sky is blue"]
+
+    def test_in_process_search_matches_index(self, store, sample_data):
+        """프로세스 내 정확 검색 결과가 FAISS 검색과 동일"""
+        chunks, embeddings = sample_data
+        store.add(chunks, embeddings)
+
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        scores, indices = store.index.search(query, 3)
+        results = store._search_vectors(query, 3, store._flat_vectors())
+
+        assert [c.content for c, _ in results] == [chunks[i].content for i in indices[0]]
+        np.testing.assert_allclose([score for _, score in results], scores[0], rtol=1e-6)
+
+    def test_simsimd_path_matches_index(self, sample_data):
+        """SimSIMD가 있으면 작은 Flat 인덱스는 프로세스 내 검색, 양자화 인덱스는 FAISS 검색"""
+        chunks, embeddings = sample_data
+        calls = []
+
+        def cdist(query, matrix, metric):
+            calls.append(metric)
+            return query @ matrix.T
+
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        with patch("rag.embedding.faiss_store.HAS_SIMSIMD", True), \
+             patch("rag.embedding.faiss_store.simsimd", SimpleNamespace(cdist=cdist), create=True):
+            flat = VectorStore(dimension=384)
+            flat.add(chunks, embeddings)
+            scores, indices = flat.index.search(query, 3)
+            results = flat.search(query, top_k=3)
+            assert calls == ["dot"]
+
+            quantized = VectorStore(dimension=384, quantization="fp16")
+            quantized.add(chunks, embeddings)
+            quantized.search(query, top_k=3)
+            assert calls == ["dot"]
+
+        assert [c.content for c, _ in results] == [chunks[i].content for i in indices[0]]
+        np.testing.assert_allclose([score for _, score in results], scores[0], rtol=1e-6)
+
+    def test_int8_quantized_search(self, sample_data, tmp_path: Path):
+        """int8 양자화 인덱스 검색 및 저장/로드"""
+        chunks, embeddings = sample_data
+        store = VectorStore(dimension=384, quantization="int8")
+        store.add(chunks, embeddings)
+        
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        results = store.search(query, top_k=1)
+        
+        assert results[0][0].content == "Apple is a fruit"
+        assert results[0][1] > 0.95  # 양자화 오차 허용
+        
+        store.save(tmp_path / "sq_index")
+        new_store = VectorStore(dimension=384)
+        new_store.load(tmp_path / "sq_index")
+        
+        assert new_store.quantization == "int8"
+        assert new_store.search(query, top_k=1)[0][0].content == "Apple is a fruit"
+
+    def test_int8_trains_after_enough_vectors(self, tmp_path: Path):
+        """작은 첫 배치로 학습하지 않고, 충분한 표본이 모이면 전체로 한 번 학습"""
+        from rag.embedding.faiss_store import SQ_TRAIN_MIN_VECTORS
+
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((SQ_TRAIN_MIN_VECTORS + 500, 384)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        chunks = [Chunk(content=str(i)) for i in range(len(vectors))]
+
+        store = VectorStore(dimension=384, quantization="int8")
+        store.add(chunks[:3], vectors[:3])
+        assert not isinstance(store.index, faiss.IndexScalarQuantizer)
+
+        # 학습 전 상태로 저장/로드해도 이어서 추가 가능
+        store.save(tmp_path / "staged_index")
+        store = VectorStore(dimension=384, quantization="int8")
+        store.load(tmp_path / "staged_index")
+
+        store.add(chunks[3:], vectors[3:])
+        assert isinstance(store.index, faiss.IndexScalarQuantizer)
+        assert store.index.ntotal == len(vectors)
+
+        queries = vectors[:50]
+        exact = np.argsort(-(queries @ vectors.T), axis=1)[:, :5]
+        recall = np.mean([
+            len({int(c.content) for c, _ in store.search(q[None, :], top_k=5)} & set(row)) / 5
+            for q, row in zip(queries, exact.tolist())
+        ])
+        assert recall >= 0.9
+
+    def test_fp16_quantized_search(self, sample_data, tmp_path: Path):
+        """fp16 양자화 인덱스는 학습 없이 검색 및 저장/로드"""
+        chunks, embeddings = sample_data
+        store = VectorStore(dimension=384, quantization="fp16")
+        assert store.index.is_trained
+        store.add(chunks, embeddings)
+
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        scores, indices = store.index.search(query, 1)
+        assert indices[0][0] == 0
+        assert scores[0][0] == pytest.approx(1.0, abs=1e-3)
+
+        store.save(tmp_path / "fp16_index")
+        new_store = VectorStore(dimension=384)
+        new_store.load(tmp_path / "fp16_index")
+        assert new_store.quantization == "fp16"
+
+    def test_hnsw_search(self, sample_data, tmp_path: Path):
+        """HNSW 인덱스 검색 및 저장/로드"""
+        chunks, embeddings = sample_data
+        store = VectorStore(dimension=384, index_type="hnsw", hnsw_ef_search=16)
+        store.add(chunks, embeddings)
+        
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        results = store.search(query, top_k=1)
+        
+        assert results[0][0].content == "Apple is a fruit"
+        assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+        
+        store.save(tmp_path / "hnsw_index")
+        new_store = VectorStore(dimension=384, hnsw_ef_search=32)
+        new_store.load(tmp_path / "hnsw_index")
+        
+        assert new_store.index_type == "hnsw"
+        assert new_store.search(query, top_k=1)[0][0].content == "Apple is a fruit"
+
+
+    def test_hnsw_search_top_k_above_ef_search(self, sample_data):
+        """top_k가 efSearch보다 커도 요청한 개수만큼 반환"""
+        chunks, embeddings = sample_data
+        store = VectorStore(dimension=384, index_type="hnsw", hnsw_ef_search=1)
+        store.add(chunks, embeddings)
+
+        query = np.array([[1.0, 0.0, 0.0] + [0.0] * 381], dtype=np.float32)
+        results = store.search(query, top_k=len(chunks))
+
+        assert len(results) == len(chunks)
+        assert results[0][0].content == "Apple is a fruit"
@@ -1,12 +1,15 @@
 """Generation 모듈 테스트"""
 
+import asyncio
+import json
 import os
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from rag.chunking.chunk import Chunk
-from rag.generation import GeminiLLM, build_prompt
+from rag.generation import LLM, CachedLLM, GeminiLLM, build_prompt, generate_batch
+from rag.generation.llm import OllamaLLM
 
 
 class TestPrompt:
@@ -31,6 +34,19 @@ class TestPrompt:
         assert "[Question]" in prompt
         assert query in prompt
         assert "[Answer]" in prompt
+    
+    def test_build_prompt_prefix_is_rank_independent(self):
+        """검색 순위가 달라도 같은 청크 집합이면 동일한 프롬프트"""
+        chunks = [
+            Chunk(content="B", metadata={"source": "/docs/b.txt", "filename": "b.txt", "chunk_index": 0}),
+            Chunk(content="A1", metadata={"source": "/docs/a.txt", "filename": "a.txt", "chunk_index": 1}),
+            Chunk(content="A0", metadata={"source": "/docs/a.txt", "filename": "a.txt", "chunk_index": 0}),
+        ]
+        
+        prompt = build_prompt("질문", chunks)
+        
+        assert prompt == build_prompt("질문", list(reversed(chunks)))
+        assert prompt.index("A0") < prompt.index("A1") < prompt.index("B")
 
 
 class TestGeminiLLM:
@@ -90,3 +106,182 @@ class TestGeminiLLM:
         
         assert "죄송합니다" in response
         assert "안전 정책" in response
+
+
+class _CountingLLM(LLM):
+    """호출 횟수를 기록하는 테스트용 LLM"""
+
+    def __init__(self, response: str = "답변"):
+        self.response = response
+        self.calls = 0
+
+    def generate(self, prompt: str) -> str:
+        self.calls += 1
+        return self.response
+
+    def generate_stream(self, prompt: str):
+        self.calls += 1
+        yield from self.response
+
+
+class TestCachedLLM:
+    """CachedLLM 테스트"""
+
+    def test_memory_cache_hit(self):
+        inner = _CountingLLM()
+        llm = CachedLLM(inner)
+
+        assert llm.generate("질문") == "답변"
+        assert llm.generate("질문") == "답변"
+        assert inner.calls == 1
+
+        llm.generate("다른 질문")
+        assert inner.calls == 2
+
+    def test_disk_cache_persists(self, tmp_path):
+        cache_path = tmp_path / "llm_cache.sqlite"
+        inner = _CountingLLM()
+        CachedLLM(inner, cache_path=cache_path).generate("질문")
+
+        reloaded = CachedLLM(inner, cache_path=cache_path)
+        assert reloaded.generate("질문") == "답변"
+        assert inner.calls == 1
+
+    def test_error_response_not_cached(self):
+        inner = _CountingLLM("API 오류: quota exceeded")
+        llm = CachedLLM(inner)
+
+        llm.generate("질문")
+        llm.generate("질문")
+        assert inner.calls == 2
+
+    def test_stream_error_midway_not_cached(self):
+        """앞부분이 정상이어도 스트림 중간에 오류가 오면 캐싱하지 않음"""
+        class _BrokenStreamLLM(_CountingLLM):
+            def generate_stream(self, prompt: str):
+                self.calls += 1
+                yield "부분 답변 "
+                yield "오류 발생: connection reset"
+
+        inner = _BrokenStreamLLM()
+        llm = CachedLLM(inner)
+
+        async def collect():
+            return "".join([text async for text in llm.generate_stream_async("질문")])
+
+        assert "".join(llm.generate_stream("질문")) == "부분 답변 오류 발생: connection reset"
+        assert asyncio.run(collect()) == "부분 답변 오류 발생: connection reset"
+        assert llm.generate("질문") == "답변"
+        assert inner.calls == 3
+
+    def test_stream_uses_cache(self):
+        inner = _CountingLLM()
+        llm = CachedLLM(inner)
+
+        assert "".join(llm.generate_stream("질문")) == "답변"
+        assert "".join(llm.generate_stream("질문")) == "답변"
+        assert llm.generate("질문") == "답변"
+        assert inner.calls == 1
+
+    def test_async_stream_uses_cache(self):
+        """비동기 스트림도 기본 구현(스레드 소비)으로 동작하고 캐시를 공유"""
+        inner = _CountingLLM()
+        llm = CachedLLM(inner)
+
+        async def collect():
+            return "".join([text async for text in llm.generate_stream_async("질문")])
+
+        assert asyncio.run(collect()) == "답변"
+        assert asyncio.run(collect()) == "답변"
+        assert llm.generate("질문") == "답변"
+        assert inner.calls == 1
+
+    def test_generate_batch_uses_cache(self):
+        """배치 생성은 입력 순서를 유지하고 캐시를 공유"""
+        inner = _CountingLLM()
+        llm = CachedLLM(inner)
+        llm.generate("질문1")
+
+        results = asyncio.run(generate_batch(llm, ["질문1", "질문2", "질문3"]))
+
+        assert results == ["답변"] * 3
+        assert inner.calls == 3
+
+
+class TestOllamaLLM:
+    """OllamaLLM 요청 구성 테스트"""
+    
+    def test_prefix_cache_keeps_model_loaded(self):
+        """접두어 캐시 사용 시 keep_alive 전달, 미사용 시 생략"""
+        llm = OllamaLLM(base_url="http://localhost:11434", model="llama3")
+        payload = llm._build_payload("prompt", stream=True)
+        
+        assert payload["keep_alive"] == llm.keep_alive
+        assert payload["stream"] is True
+        
+        no_cache = OllamaLLM(base_url="http://localhost:11434", model="llama3", prefix_cache=False)
+        assert "keep_alive" not in no_cache._build_payload("prompt", stream=False)
+
+    def test_generate_reuses_session(self):
+        """요청마다 새 연결 대신 세션(연결 풀)을 재사용"""
+        llm = OllamaLLM(base_url="http://localhost:11434", model="llama3")
+        llm._session = MagicMock()
+        llm._session.post.return_value.json.return_value = {"response": "답변"}
+
+        assert llm.generate("a") == "답변"
+        assert llm.generate("b") == "답변"
+        assert llm._session.post.call_count == 2
+
+    def test_async_calls_share_client(self, monkeypatch):
+        """비동기 호출은 이벤트 루프 안에서 서버별 클라이언트(연결 풀)를 재사용"""
+        import httpx
+        import rag.generation.llm as llm_module
+
+        created = []
+        real_client = httpx.AsyncClient
+
+        def handler(request):
+            if json.loads(request.content)["stream"]:
+                return httpx.Response(200, content='{"response": "답"}\n'.encode())
+            return httpx.Response(200, json={"response": "답변"})
+
+        def fake_client(**kwargs):
+            created.append(kwargs)
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(llm_module.httpx, "AsyncClient", fake_client)
+        llm = OllamaLLM(base_url="http://ollama.test", model="llama3")
+
+        async def run():
+            answers = await generate_batch(llm, ["a", "b", "c"])
+            streamed = [text async for text in llm.generate_stream_async("d")]
+            return answers, streamed
+
+        assert asyncio.run(run()) == (["답변"] * 3, ["답"])
+        assert len(created) == 1
+
+        # 새 이벤트 루프에서는 이전 루프에 묶인 클라이언트를 쓰지 않음
+        asyncio.run(run())
+        assert len(created) == 2
+
+    def test_instances_share_session_per_server(self):
+        """요청마다 새 인스턴스를 만들어도 같은 서버는 세션(연결 풀)을 공유"""
+        a = OllamaLLM(base_url="http://ollama-a.test", model="llama3")
+        b = OllamaLLM(base_url="http://ollama-a.test", model="qwen", prefix_cache=False)
+        other = OllamaLLM(base_url="http://ollama-b.test", model="llama3")
+
+        assert a._session is b._session
+        assert a._session is not other._session
+
+    def test_generate_stream_parses_lines(self):
+        """스트림 줄 단위 JSON에서 응답 텍스트만 추출"""
+        llm = OllamaLLM(base_url="http://localhost:11434", model="llama3")
+        llm._session = MagicMock()
+        llm._session.post.return_value.iter_lines.return_value = [
+            '{"response": "안녕"}'.encode(),
+            b"",
+            b'{"response": "!", "done": false}',
+            b'{"response": "", "done": true}',
+        ]
+
+        assert list(llm.generate_stream("a")) == ["안녕", "!"]
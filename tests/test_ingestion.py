@@ -9,6 +9,7 @@ from rag.ingestion import (
     Document,
     load_documents,
     load_file,
+    load_files,
     normalize_text,
     detect_language,
 )
@@ -78,6 +79,35 @@ class TestNormalizer:
         assert not result.startswith(" ")
         assert not result.endswith(" ")
 
+    def test_normalize_text_matches_step_functions(self) -> None:
+        """단일 순회 결과가 단계별 정규화 함수 적용 결과와 동일"""
+        from rag.ingestion.normalizer import (
+            normalize_newlines,
+            normalize_unicode,
+            normalize_whitespace,
+        )
+
+        samples = [
+            "",
+            " \t \n\n",
+            "  앞 공백\t탭  \r\n줄 끝 \n \n\t\n\n다음　문단\x0b끝 ",
+            "ｆｕｌｌ　ｗｉｄｔｈ\n\n\n\n\tindented\n \n",
+        ]
+        for text in samples:
+            expected = normalize_newlines(
+                normalize_whitespace(normalize_unicode(text))
+            ).strip()
+            assert normalize_text(text) == expected
+
+
+    def test_normalize_pdf_text(self) -> None:
+        """PDF 레이아웃 줄바꿈/하이픈 병합, 문단 구분 유지"""
+        from rag.ingestion.parsers.pdf import normalize_pdf_text
+        
+        text = "  atten-\n  tion   is\nall you \n \n\n  need.  \nEnd  "
+        
+        assert normalize_pdf_text(text) == "attention is all you\n\nneed. End"
+
 
 class TestLanguageDetection:
     """언어 감지 테스트"""
@@ -100,6 +130,16 @@ class TestLanguageDetection:
         
         assert detect_language(text) == "ko"
     
+    def test_detect_long_text_uses_samples(self) -> None:
+        """긴 텍스트는 앞/중간/끝 표본으로 판단"""
+        from rag.ingestion.language import LANGUAGE_SAMPLE_SIZE
+        
+        filler = "Hello world. " * (LANGUAGE_SAMPLE_SIZE // 4)
+        text = "한국어 문서입니다. " * LANGUAGE_SAMPLE_SIZE + filler + "한국어 문서입니다. " * LANGUAGE_SAMPLE_SIZE
+        
+        assert len(text) > LANGUAGE_SAMPLE_SIZE * 3
+        assert detect_language(text) == "ko"
+    
     def test_detect_empty_returns_unknown(self) -> None:
         """빈 텍스트는 unknown 반환"""
         assert detect_language("") == "unknown"
@@ -155,8 +195,162 @@ class TestLoader:
         
         assert len(docs) == 2
     
+    def test_load_files_keeps_order_and_skips_unsupported(self, tmp_path: Path) -> None:
+        """동시 로딩 시 입력 순서 유지, 미지원 파일 제외"""
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"file{i}.txt"
+            path.write_text(f"Content {i}")
+            paths.append(path)
+        unsupported = tmp_path / "script.py"
+        unsupported.write_text("# Not supported")
+        
+        loaded = load_files(paths[:10] + [unsupported] + paths[10:], max_workers=4)
+        
+        assert [path for path, _ in loaded] == paths
+        assert [doc.content for _, doc in loaded] == [f"Content {i}" for i in range(20)]
+    
+    def test_iter_files_filters_hidden_and_extensions(self, tmp_path: Path) -> None:
+        """숨김 경로와 미지원 확장자 제외, 확장자는 대소문자 무시"""
+        from rag.ingestion import iter_files
+        
+        (tmp_path / "sub").mkdir()
+        (tmp_path / ".git").mkdir()
+        for name in ["a.md", "sub/b.TXT", "sub/c.png", ".hidden.md", ".git/d.txt"]:
+            (tmp_path / name).write_text("x")
+        
+        found = {p.relative_to(tmp_path).as_posix() for p in iter_files(tmp_path, [".md", ".txt"])}
+        assert found == {"a.md", "sub/b.TXT"}
+        
+        with_hidden = {
+            p.relative_to(tmp_path).as_posix()
+            for p in iter_files(tmp_path, [".md", ".txt"], skip_hidden=False)
+        }
+        assert with_hidden == {"a.md", "sub/b.TXT", ".hidden.md", ".git/d.txt"}
+
+    def test_text_parser_newlines_and_latin1_fallback(self, tmp_path: Path) -> None:
+        """개행은 read_text와 같이 통일되고, UTF-8 실패 시 latin-1로 디코딩"""
+        from rag.ingestion.parsers import TextParser
+
+        crlf = tmp_path / "crlf.txt"
+        crlf.write_bytes("첫 줄\r\n둘째 줄\r셋째 줄\n".encode("utf-8"))
+        assert TextParser().parse(crlf) == crlf.read_text(encoding="utf-8")
+
+        latin = tmp_path / "latin.txt"
+        latin.write_bytes("café".encode("latin-1"))
+        assert TextParser().parse(latin) == "café"
+
+        with pytest.raises(FileNotFoundError):
+            TextParser().parse(tmp_path / "missing.txt")
+
+    def test_get_parser_by_suffix(self) -> None:
+        """확장자(대소문자 무시)로 파서를 찾고, 미지원 확장자는 None"""
+        from rag.ingestion.loader import DocumentLoader
+        from rag.ingestion.parsers import PDFParser, TextParser, get_parser
+
+        for lookup in (get_parser, DocumentLoader().get_parser):
+            assert isinstance(lookup(Path("a.MD")), TextParser)
+            assert isinstance(lookup(Path("dir/b.pdf")), PDFParser)
+            assert lookup(Path("c.docx")) is None
+            assert lookup(Path("noext")) is None
+
+    def test_pdf_parser_joins_non_empty_pages(self, monkeypatch) -> None:
+        """빈 페이지는 건너뛰고 정규화된 페이지를 빈 줄로 연결"""
+        import rag.ingestion.parsers.pdf as pdf_module
+
+        class FakePage:
+            def __init__(self, text: str) -> None:
+                self.text = text
+
+            def extract_text(self) -> str:
+                return self.text
+
+        class FakeReader:
+            def __init__(self, path) -> None:
+                self.pages = [FakePage(t) for t in ["", "첫  페이지\n본문", "  \n ", "끝-\n  페이지"]]
+
+        monkeypatch.setattr(pdf_module, "PdfReader", FakeReader)
+
+        assert pdf_module.PDFParser().parse(Path("a.pdf")) == "첫 페이지 본문\n\n끝페이지"
+
     def test_load_nonexistent_returns_empty(self) -> None:
         """존재하지 않는 경로는 빈 리스트 반환"""
         docs = load_documents("/nonexistent/path")
         
         assert docs == []
+
+
+class TestIndexMetadata:
+    """인덱스 메타데이터 테스트"""
+    
+    def test_is_indexed_many_detects_changes(self, tmp_path: Path) -> None:
+        """신규/변경/미변경 파일 일괄 판별"""
+        from rag.ingestion.metadata import IndexMetadata
+        
+        files = []
+        for i in range(4):
+            path = tmp_path / f"doc{i}.txt"
+            path.write_text(f"Content {i}")
+            files.append(path)
+        
+        meta = IndexMetadata(tmp_path / "index")
+        for path in files[:3]:
+            meta.mark_indexed(path, chunks_count=1)
+        meta.save()
+        
+        files[1].write_text("Changed")
+        reloaded = IndexMetadata(tmp_path / "index")
+        
+        assert reloaded.is_indexed_many(files) == [True, False, True, False]
+        assert reloaded.is_indexed(files[0])
+    
+    def test_legacy_sha256_entries_still_match(self, tmp_path: Path) -> None:
+        """알고리즘 기록이 없는 기존 SHA256 항목도 미변경으로 판별"""
+        import hashlib
+        import json
+        from rag.ingestion.metadata import IndexMetadata
+        
+        path = tmp_path / "doc.txt"
+        path.write_text("Content")
+        index_dir = tmp_path / "index"
+        index_dir.mkdir()
+        legacy = {
+            "indexed_files": {
+                str(path.absolute()): {
+                    "hash": hashlib.sha256(b"Content").hexdigest(),
+                    "chunks_count": 1,
+                }
+            },
+            "version": "1.0",
+        }
+        (index_dir / IndexMetadata.FILENAME).write_text(json.dumps(legacy))
+        
+        assert IndexMetadata(index_dir).is_indexed(path)
+    
+    def test_unchanged_stat_skips_hashing(self, tmp_path: Path, monkeypatch) -> None:
+        """수정 시각/크기가 기록과 같으면 해시를 계산하지 않음"""
+        import os
+        from rag.ingestion.metadata import IndexMetadata
+        
+        path = tmp_path / "doc.txt"
+        path.write_text("Content")
+        meta = IndexMetadata(tmp_path / "index")
+        meta.mark_indexed(path, chunks_count=1)
+        
+        hashed: list[Path] = []
+        original = IndexMetadata.compute_file_hash
+        monkeypatch.setattr(
+            IndexMetadata, "compute_file_hash",
+            staticmethod(lambda p, algo="sha256": hashed.append(p) or original(p, algo)),
+        )
+        
+        assert meta.is_indexed(path)
+        assert hashed == []
+        
+        # 내용은 같고 수정 시각만 바뀌면 해시로 확인 후 stat 갱신
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert meta.is_indexed(path)
+        assert meta.is_indexed(path)
+        assert len(hashed) == 1
+
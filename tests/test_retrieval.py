@@ -1,6 +1,7 @@
 """Retrieval 모듈 테스트"""
 
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -9,7 +10,10 @@ from rag.chunking.chunk import Chunk
 from rag.embedding.embedder import Embedder
 from rag.embedding import VectorStore
 from rag.retrieval.bm25 import BM25Searcher
+from rag.retrieval.query_rewriter import QueryRewriter
+from rag.retrieval.reranker import FLASHRANK_DEFAULT_MODEL, Reranker
 from rag.retrieval.searcher import HybridSearcher
+from rag.retrieval.semantic_cache import SemanticCache
 from rag.retrieval.tokenizer import tokenize_query
 
 
@@ -81,6 +85,35 @@ class TestBM25Searcher:
         results = new_searcher.search("바나나")
         assert len(results) > 0
         assert results[0][0].content == "바나나는 노랗다"
+    
+    def test_add_appends_to_corpus(self, sample_chunks):
+        """증분 추가 시 기존 청크 유지"""
+        searcher = BM25Searcher()
+        searcher.index(sample_chunks[:2])
+        searcher.add(sample_chunks[2:])
+        
+        assert len(searcher.chunks) == 3
+        assert searcher.search("사과")[0][0].content == "사과는 과일이다"
+        assert searcher.search("하늘은")[0][0].content == "하늘은 파랗다"
+
+    def test_search_top_k_sorted_positive(self):
+        """부분 선택 후에도 양수 점수만 내림차순으로 top_k개 반환"""
+        # 일부 문서에만 등장하는 단어 (빈도가 다른 1~7번 문서만 양수 점수)
+        chunks = [
+            Chunk(content=f"문서{i} {'바나나 ' * i if 0 < i < 8 else '사과'}", metadata={"chunk_index": i})
+            for i in range(20)
+        ]
+        searcher = BM25Searcher()
+        searcher.index(chunks)
+
+        results = searcher.search("바나나", top_k=5)
+        scores = [score for _, score in results]
+        full = searcher.get_full_scores("바나나")
+
+        assert len(results) == 5
+        assert scores == sorted(scores, reverse=True)
+        assert all(score > 0 for score in scores)
+        assert scores[0] == pytest.approx(full.max())
 
 
 class TestHybridSearcher:
@@ -162,3 +195,139 @@ class TestHybridSearcher:
         
         assert isinstance(results_k60, list)
         assert isinstance(results_k10, list)
+
+    def test_search_many_matches_search(self, hybrid_searcher, sample_chunks):
+        """동시 검색 결과가 쿼리별 단일 검색과 동일"""
+        hybrid_searcher.index(sample_chunks)
+        queries = ["사과", "바나나", "하늘은"]
+        
+        batched = hybrid_searcher.search_many(queries, top_k=2)
+        
+        assert len(batched) == len(queries)
+        for q, results in zip(queries, batched):
+            expected = hybrid_searcher.search(q, top_k=2)
+            assert [(c.content, s) for c, s in results] == [(c.content, s) for c, s in expected]
+
+    def test_search_many_uses_given_vectors(self, hybrid_searcher, sample_chunks):
+        """미리 계산된 쿼리 임베딩이 있으면 다시 임베딩하지 않음"""
+        hybrid_searcher.index(sample_chunks)
+        queries = ["사과", "바나나"]
+        query_vecs = hybrid_searcher.embedder.embed(queries)
+        
+        with patch.object(hybrid_searcher.embedder, "embed", side_effect=AssertionError):
+            batched = hybrid_searcher.search_many(queries, top_k=2, query_vecs=query_vecs)
+        
+        assert len(batched) == len(queries)
+
+
+class TestReranker:
+    """Reranker 테스트"""
+
+    def test_flashrank_backend_restores_input_order(self, sample_chunks):
+        """FlashRank 점수를 입력 순서로 복원해 재정렬"""
+        ranker = MagicMock()
+        # FlashRank는 점수 내림차순으로 반환
+        ranker.rerank.return_value = [
+            {"id": 2, "score": 0.9},
+            {"id": 0, "score": 0.5},
+            {"id": 1, "score": 0.1},
+        ]
+
+        with patch("rag.retrieval.reranker.HAS_FLASHRANK", True), \
+             patch("rag.retrieval.reranker.Ranker", create=True, return_value=ranker) as mock_ranker, \
+             patch("rag.retrieval.reranker.RerankRequest", create=True):
+            reranker = Reranker(backend="flashrank")
+            results = reranker.rerank("질문", [(c, 0.0) for c in sample_chunks], top_k=2)
+
+        assert mock_ranker.call_args.kwargs["model_name"] == FLASHRANK_DEFAULT_MODEL
+        assert [c.content for c, _ in results] == ["하늘은 파랗다", "사과는 과일이다"]
+        assert [s for _, s in results] == [0.9, 0.5]
+
+    def test_flashrank_parallel_sub_batches(self):
+        """후보가 많으면 서브 배치로 나눠 점수 계산 후 병합"""
+        chunks = [(Chunk(content=f"doc {i}"), 0.0) for i in range(40)]
+
+        def fake_rerank(request):
+            return [{"id": p["id"], "score": float(p["id"])} for p in request.passages]
+
+        ranker = MagicMock()
+        ranker.rerank.side_effect = fake_rerank
+
+        with patch("rag.retrieval.reranker.HAS_FLASHRANK", True), \
+             patch("rag.retrieval.reranker.Ranker", create=True, return_value=ranker), \
+             patch("rag.retrieval.reranker.RerankRequest", create=True, side_effect=lambda **kw: MagicMock(**kw)):
+            reranker = Reranker(backend="flashrank")
+            reranker.pool_size = 4
+            results = reranker.rerank("질문", chunks, top_k=3)
+
+        assert ranker.rerank.call_count == 4
+        assert [c.content for c, _ in results] == ["doc 39", "doc 38", "doc 37"]
+
+
+class TestSemanticCache:
+    """SemanticCache 테스트"""
+
+    def _unit(self, vec):
+        vec = np.asarray(vec, dtype=np.float32)
+        return vec / np.linalg.norm(vec)
+
+    def test_near_duplicate_hit(self):
+        """코사인 유사도가 임계값 이상인 쿼리는 적중"""
+        rng = np.random.default_rng(1)
+        base = self._unit(rng.standard_normal(64))
+        near = self._unit(base + 0.01 * rng.standard_normal(64))
+        far = self._unit(rng.standard_normal(64))
+
+        cache = SemanticCache(dim=64, threshold=0.95)
+        cache.set(base, "cached")
+
+        assert cache.get(near) == "cached"
+        assert cache.get(far) is None
+        assert cache.stats()["hits"] == 1
+
+    def test_scope_must_match(self):
+        """검색 조건(scope)이 다르면 적중하지 않음"""
+        vec = self._unit(np.arange(1, 17))
+        cache = SemanticCache(dim=16)
+        cache.set(vec[None, :], "user-a", scope=("a",))
+
+        assert cache.get(vec[None, :], scope=("a",)) == "user-a"
+        assert cache.get(vec[None, :], scope=("b",)) is None
+
+    def test_lru_eviction(self):
+        """최대 항목 수 초과 시 오래된 항목과 버킷 제거"""
+        cache = SemanticCache(dim=8, max_entries=2)
+        vecs = np.eye(8, dtype=np.float32)
+        for i in range(3):
+            cache.set(vecs[i], i)
+
+        assert len(cache) == 2
+        assert cache.get(vecs[0]) is None
+        assert cache.get(vecs[2]) == 2
+        assert sum(len(ids) for table in cache._tables for ids in table.values()) == 2 * 8
+
+
+class TestQueryRewriter:
+    """QueryRewriter 테스트"""
+
+    def test_rewrite_result_is_cached(self):
+        """같은 질문은 LLM을 다시 호출하지 않음"""
+        llm = MagicMock()
+        llm.generate.return_value = '["query a", "query b"]'
+        rewriter = QueryRewriter(llm)
+
+        first = rewriter.rewrite("질문")
+        second = rewriter.rewrite("질문")
+
+        assert first == second == ["질문", "query a", "query b"]
+        assert llm.generate.call_count == 1
+
+    def test_failed_rewrite_is_not_cached(self):
+        """파싱 실패 결과는 캐싱하지 않고 다음 호출에서 재시도"""
+        llm = MagicMock()
+        llm.generate.side_effect = ["not json", '["query a"]']
+        rewriter = QueryRewriter(llm)
+
+        assert rewriter.rewrite("질문") == ["질문"]
+        assert rewriter.rewrite("질문") == ["질문", "query a"]
+        assert llm.generate.call_count == 2
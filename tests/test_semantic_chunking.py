@@ -2,7 +2,13 @@
 
 import pytest
 
+from rag.chunking._semantic_numba import _group_boundaries
 from rag.chunking.semantic import (
+    _apply_overlap_to_chunks,
+    _group_avg_similarities,
+    _group_sentences_semantically,
+    _normalize_rows,
+    _split_long_sentence,
     split_into_sentences,
     split_semantic,
     cosine_similarity,
@@ -152,5 +158,113 @@ def test_chunk_index_sequential():
         assert chunk.metadata["chunk_index"] == i
 
 
+def test_group_sentences_by_topic():
+    """주제가 바뀌는 지점에서 그룹 분리 (그룹 중심과의 유사도 기준)"""
+    rng = np.random.default_rng(0)
+    topic_a, topic_b = np.eye(8)[0], np.eye(8)[1]
+    vectors = [topic_a + 0.1 * rng.standard_normal(8) for _ in range(4)]
+    vectors += [topic_b + 0.1 * rng.standard_normal(8) for _ in range(3)]
+    embeddings = np.stack([v / np.linalg.norm(v) for v in vectors])
+    sentences = [f"Sentence {i}." for i in range(len(embeddings))]
+
+    groups = _group_sentences_semantically(
+        sentences, embeddings, similarity_threshold=0.7, chunk_size=1000
+    )
+
+    assert groups == [slice(0, 4), slice(4, 7)]
+
+
+def test_group_boundaries_matches_python_loop():
+    """컴파일용 그룹 경계 계산이 Python 루프와 같은 결과"""
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        n = int(rng.integers(1, 40))
+        embeddings = _normalize_rows(rng.standard_normal((n, 8)) + rng.standard_normal(8))
+        sentences = ["x" * int(rng.integers(5, 80)) for _ in range(n)]
+        sent_lens = np.array([len(s) for s in sentences], dtype=np.int32)
+
+        starts = _group_boundaries(embeddings, sent_lens, 0.5, 300).tolist()
+        expected = _group_sentences_semantically(sentences, embeddings, 0.5, 300)
+
+        assert starts == [group.start for group in expected]
+
+
+def test_zero_threshold_single_group_skips_embedding():
+    """임계값 0이고 한 청크에 들어가면 임베딩 없이 단일 청크"""
+    class FailingEmbedder:
+        def embed(self, texts):
+            raise AssertionError("embedder should not be called")
+
+    text = "First sentence here. Second sentence here. Third sentence here."
+    chunks = split_semantic(
+        text, chunk_size=1000, similarity_threshold=0.0, embedder=FailingEmbedder()
+    )
+
+    assert len(chunks) == 1
+    assert chunks[0].content == text
+    assert chunks[0].metadata["sentence_count"] == 3
+
+
+def test_zero_threshold_groups_by_size_only():
+    """임계값 0이면 유사도와 무관하게 크기 제한으로만 그룹 분리"""
+    embeddings = _normalize_rows(np.array([[1.0, 0.0], [-1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]))
+    sentences = ["a" * 10] * 4
+
+    groups = _group_sentences_semantically(sentences, embeddings, 0.0, chunk_size=21)
+    starts = _group_boundaries(embeddings, np.full(4, 10, dtype=np.int32), 0.0, 21).tolist()
+
+    assert groups == [slice(0, 2), slice(2, 4)]
+    assert starts == [0, 2]
+
+
+def test_split_long_sentence():
+    """긴 문장은 쉼표/세미콜론 → 공백 → 강제 분할 순으로 max_len 이하로 분할"""
+    parts = _split_long_sentence("alpha beta, gamma delta; epsilon zeta eta theta", max_len=15)
+    assert parts == ["alpha beta,", "gamma delta;", "epsilon zeta", "eta theta"]
+
+    # 구분자가 없으면 max_len 단위로 강제 분할 (단어 중복 없음)
+    parts = _split_long_sentence("x" * 25, max_len=10)
+    assert parts == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_apply_overlap_uses_sentence_groups():
+    """이전 청크의 문장 그룹 끝에서 overlap 크기만큼 앞에 붙임"""
+    groups = [["First one.", "Second one.", "Third one."], ["Next chunk."]]
+    chunks = [Chunk(content=" ".join(g), metadata={}) for g in groups]
+
+    result = _apply_overlap_to_chunks(chunks, groups, chunk_overlap=25, chunk_size=1000)
+
+    assert result[0].content == "First one. Second one. Third one."
+    assert result[1].content == "Second one. Third one. Next chunk."
+
+
+def test_group_avg_similarities():
+    """그룹별 중심 벡터와의 평균 유사도 (문장 1개 그룹은 0.0)"""
+    rng = np.random.default_rng(2)
+    embeddings = _normalize_rows(rng.standard_normal((7, 8)))
+    groups = [slice(0, 3), slice(3, 4), slice(4, 7)]
+
+    avg = _group_avg_similarities(embeddings, groups)
+
+    for value, group in zip(avg, groups):
+        rows = embeddings[group]
+        if len(rows) == 1:
+            assert value == 0.0
+            continue
+        centroid = rows.mean(axis=0)
+        centroid /= np.linalg.norm(centroid)
+        assert value == pytest.approx(float((rows @ centroid).mean()), abs=1e-5)
+
+
+def test_normalize_rows():
+    """행 단위 L2 정규화 (영벡터는 그대로 유지)"""
+    embeddings = np.array([[3.0, 4.0], [0.0, 0.0], [0.0, 2.0]])
+
+    normalized = _normalize_rows(embeddings)
+
+    assert normalized.dtype == np.float32
+    np.testing.assert_allclose(normalized, [[0.6, 0.8], [0.0, 0.0], [0.0, 1.0]], atol=1e-6)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])